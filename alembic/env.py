@@ -16,7 +16,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from auto_apply_ai.db.engine import Base
 from auto_apply_ai.models.entities import *  # Import all models
-from auto_apply_ai.core.settings import settings
+from auto_apply_ai.config.settings import settings
 
 
 # this is the Alembic Config object, which provides
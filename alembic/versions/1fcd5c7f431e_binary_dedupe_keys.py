@@ -0,0 +1,103 @@
+"""binary dedupe keys
+
+Revision ID: 1fcd5c7f431e
+Revises: 5f0c2be9d7a4
+Create Date: 2026-10-18 11:20:05.417733
+
+"""
+from hashlib import sha1
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1fcd5c7f431e'
+down_revision: Union[str, None] = '5f0c2be9d7a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_CHUNK = 5000
+
+postings = sa.table(
+    'job_postings',
+    sa.column('id', sa.String()),
+    sa.column('canonical_url', sa.Text()),
+    sa.column('company', sa.String()),
+    sa.column('job_title', sa.String()),
+    sa.column('source_host', sa.String()),
+    sa.column('dedupe_key_exact'),
+    sa.column('dedupe_key_company_title_host'),
+)
+
+
+def _rewrite_keys(convert) -> None:
+    """Rewrite both key columns in id order, BACKFILL_CHUNK rows per UPDATE batch."""
+    bind = op.get_bind()
+    last_id = ''
+    while True:
+        rows = bind.execute(
+            sa.select(postings).where(postings.c.id > last_id).order_by(postings.c.id).limit(BACKFILL_CHUNK)
+        ).mappings().all()
+        if not rows:
+            return
+        bind.execute(
+            postings.update().where(postings.c.id == sa.bindparam('_id')),
+            [{'_id': r['id'], **convert(r)} for r in rows],
+        )
+        last_id = rows[-1]['id']
+
+
+def _hex_to_blob(r) -> dict:
+    # same digest, truncated: dedupe.keys.key_* == bytes.fromhex(old_hex[:32])
+    return {
+        'dedupe_key_exact': bytes.fromhex(r['dedupe_key_exact'][:32]),
+        'dedupe_key_company_title_host': bytes.fromhex(r['dedupe_key_company_title_host'][:32]),
+    }
+
+
+def _blob_to_hex(r) -> dict:
+    # the full 40-char digests can't be recovered from 16 bytes; recompute them from the posting
+    c = (r['company'] or '').strip().lower()
+    t = (r['job_title'] or '').strip().lower()
+    h = (r['source_host'] or '').strip().lower()
+    return {
+        'dedupe_key_exact': sha1(r['canonical_url'].encode('utf-8')).hexdigest(),
+        'dedupe_key_company_title_host': sha1(f'{c}|{t}|{h}'.encode('utf-8')).hexdigest(),
+    }
+
+
+KEY_COLUMNS = ('dedupe_key_exact', 'dedupe_key_company_title_host')
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        # converted in place: the first 16 bytes of the hex digest
+        for column in KEY_COLUMNS:
+            op.alter_column(
+                'job_postings', column, existing_type=sa.String(), type_=sa.LargeBinary(length=16),
+                existing_nullable=False, postgresql_using=f"decode(substr({column}, 1, 32), 'hex')",
+            )
+        return
+    # SQLite keeps blob values as-is in TEXT columns, so backfill first and let the batch
+    # table copy carry the converted values over
+    _rewrite_keys(_hex_to_blob)
+    with op.batch_alter_table('job_postings') as batch_op:
+        batch_op.alter_column('dedupe_key_exact', existing_type=sa.String(), type_=sa.LargeBinary(length=16), existing_nullable=False)
+        batch_op.alter_column('dedupe_key_company_title_host', existing_type=sa.String(), type_=sa.LargeBinary(length=16), existing_nullable=False)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        for column in KEY_COLUMNS:
+            op.alter_column(
+                'job_postings', column, existing_type=sa.LargeBinary(length=16), type_=sa.String(),
+                existing_nullable=False, postgresql_using=f"encode({column}, 'hex')",
+            )
+        _rewrite_keys(_blob_to_hex)
+        return
+    _rewrite_keys(_blob_to_hex)
+    with op.batch_alter_table('job_postings') as batch_op:
+        batch_op.alter_column('dedupe_key_exact', existing_type=sa.LargeBinary(length=16), type_=sa.String(), existing_nullable=False)
+        batch_op.alter_column('dedupe_key_company_title_host', existing_type=sa.LargeBinary(length=16), type_=sa.String(), existing_nullable=False)
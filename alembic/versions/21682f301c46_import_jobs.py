@@ -0,0 +1,42 @@
+"""import jobs
+
+Revision ID: 21682f301c46
+Revises: a8c10372e1a9
+Create Date: 2026-10-18 09:12:40.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '21682f301c46'
+down_revision: Union[str, None] = 'a8c10372e1a9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('import_jobs',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('source', sa.String(), nullable=False),
+    sa.Column('status', sa.Enum('queued', 'running', 'succeeded', 'failed', name='import_job_status'), nullable=False),
+    sa.Column('dry_run', sa.Boolean(), nullable=False),
+    sa.Column('rows_processed', sa.Integer(), nullable=False),
+    sa.Column('accepted', sa.Integer(), nullable=False),
+    sa.Column('quarantined', sa.Integer(), nullable=False),
+    sa.Column('rows_per_sec', sa.Float(), nullable=False),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_import_jobs_status', 'import_jobs', ['status'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_import_jobs_status', table_name='import_jobs')
+    op.drop_table('import_jobs')
@@ -0,0 +1,76 @@
+"""time-ordered posting ids
+
+Revision ID: 3e6b1d9c7f02
+Revises: 9b4d2f6e8a15
+Create Date: 2026-10-18 17:42:51.118306
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3e6b1d9c7f02'
+down_revision: Union[str, None] = '9b4d2f6e8a15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables pointing at job_postings.id (unnamed FKs: PostgreSQL names them <table>_<column>_fkey)
+REFERENCES = [('posting_captures', 'posting_id'), ('ats_resolutions', 'posting_id')]
+
+# Postings created before uuid7 ids (uuid4 or anything else) sort by chance under ORDER BY id.
+# They get a UUIDv7 id for the time of their earliest capture (the epoch if they have none),
+# built in SQL so the migration also renders with --sql.
+MS_HEX = {
+    'sqlite': "printf('%012x', CAST(COALESCE((julianday(MIN(c.captured_at)) - 2440587.5) * 86400000, 0) AS INTEGER))",
+    'postgresql': "lpad(to_hex(COALESCE((extract(epoch FROM MIN(c.captured_at)) * 1000)::bigint, 0)), 12, '0')",
+}
+RANDOM_HEX = {  # at least 18 hex digits
+    'sqlite': "lower(hex(randomblob(9)))",
+    'postgresql': "md5(random()::text || p.id)",
+}
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    op.create_table(
+        'posting_id_map',
+        sa.Column('old_id', sa.String(), nullable=False),
+        sa.Column('new_id', sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint('old_id'),
+    )
+    op.execute(
+        "INSERT INTO posting_id_map (old_id, new_id) "
+        "SELECT old_id, substr(h, 1, 8) || '-' || substr(h, 9, 4) || '-7' || substr(r, 1, 3) || '-8' "
+        "|| substr(r, 4, 3) || '-' || substr(r, 7, 12) FROM ("
+        f"SELECT p.id AS old_id, {MS_HEX[dialect]} AS h, {RANDOM_HEX[dialect]} AS r "
+        "FROM job_postings p "
+        "LEFT JOIN posting_captures l ON l.posting_id = p.id "
+        "LEFT JOIN job_captures c ON c.id = l.capture_id "
+        "WHERE length(p.id) <> 36 OR substr(p.id, 15, 1) <> '7' "
+        "GROUP BY p.id) AS t"
+    )
+    if dialect == 'postgresql':
+        # the FKs have no ON UPDATE CASCADE and are not deferrable
+        for table, column in REFERENCES:
+            op.drop_constraint(f'{table}_{column}_fkey', table, type_='foreignkey')
+    else:
+        op.execute("PRAGMA defer_foreign_keys = ON")  # checked at commit, when everything points at the new ids
+    for table, column in REFERENCES + [('job_postings', 'id')]:
+        op.execute(
+            f"UPDATE {table} SET {column} = (SELECT m.new_id FROM posting_id_map m WHERE m.old_id = {table}.{column}) "
+            f"WHERE {column} IN (SELECT old_id FROM posting_id_map)"
+        )
+    if dialect == 'postgresql':
+        for table, column in REFERENCES:
+            op.create_foreign_key(
+                f'{table}_{column}_fkey', table, 'job_postings', [column], ['id'], ondelete='CASCADE'
+            )
+    op.drop_table('posting_id_map')
+
+
+def downgrade() -> None:
+    # the new ids are valid for the older schema too; the old ones are not kept
+    pass
@@ -0,0 +1,33 @@
+"""import checkpoints
+
+Revision ID: 5f0c2be9d7a4
+Revises: 21682f301c46
+Create Date: 2026-10-18 10:03:17.502911
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5f0c2be9d7a4'
+down_revision: Union[str, None] = '21682f301c46'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('import_checkpoints',
+    sa.Column('batch_id', sa.String(), nullable=False),
+    sa.Column('last_row_index', sa.Integer(), nullable=False),
+    sa.Column('accepted', sa.Integer(), nullable=False),
+    sa.Column('quarantined', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('batch_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('import_checkpoints')
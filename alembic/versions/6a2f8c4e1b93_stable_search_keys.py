@@ -0,0 +1,90 @@
+"""stable full-text search keys
+
+Revision ID: 6a2f8c4e1b93
+Revises: 3e6b1d9c7f02
+Create Date: 2026-10-18 19:05:37.902114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6a2f8c4e1b93'
+down_revision: Union[str, None] = '3e6b1d9c7f02'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# job_postings_fts was an external-content table keyed by job_postings.rowid, which VACUUM may
+# renumber (String primary key). It now stores its own content, keyed by an INTEGER PRIMARY
+# KEY per posting id in job_postings_search_keys. PostgreSQL (GIN index) is unaffected.
+KEY_OF = "(SELECT key FROM job_postings_search_keys WHERE posting_id = {})"
+
+SQLITE_UPGRADE = [
+    "DROP TRIGGER IF EXISTS job_postings_fts_au",
+    "DROP TRIGGER IF EXISTS job_postings_fts_ad",
+    "DROP TRIGGER IF EXISTS job_postings_fts_ai",
+    "DROP TABLE IF EXISTS job_postings_fts",
+    "CREATE TABLE job_postings_search_keys (key INTEGER PRIMARY KEY, posting_id VARCHAR NOT NULL UNIQUE)",
+    "CREATE VIRTUAL TABLE job_postings_fts USING fts5("
+    "company, job_title, location, tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+    "CREATE TRIGGER job_postings_fts_ai AFTER INSERT ON job_postings BEGIN "
+    "INSERT INTO job_postings_search_keys(posting_id) VALUES (new.id); "
+    "INSERT INTO job_postings_fts(rowid, company, job_title, location) "
+    f"VALUES ({KEY_OF.format('new.id')}, new.company, new.job_title, new.location); END",
+    "CREATE TRIGGER job_postings_fts_ad AFTER DELETE ON job_postings BEGIN "
+    f"DELETE FROM job_postings_fts WHERE rowid = {KEY_OF.format('old.id')}; "
+    "DELETE FROM job_postings_search_keys WHERE posting_id = old.id; END",
+    "CREATE TRIGGER job_postings_fts_au AFTER UPDATE OF company, job_title, location "
+    "ON job_postings BEGIN "
+    "UPDATE job_postings_fts SET company = new.company, job_title = new.job_title, location = new.location "
+    "WHERE rowid IN (SELECT key FROM job_postings_search_keys WHERE posting_id IN (old.id, new.id)); END",
+    "CREATE TRIGGER job_postings_fts_aid AFTER UPDATE OF id ON job_postings BEGIN "
+    "UPDATE job_postings_search_keys SET posting_id = new.id WHERE posting_id = old.id; END",
+    # backfill from the existing postings
+    "INSERT INTO job_postings_search_keys(posting_id) SELECT id FROM job_postings",
+    "INSERT INTO job_postings_fts(rowid, company, job_title, location) "
+    "SELECT k.key, p.company, p.job_title, p.location FROM job_postings_search_keys k "
+    "JOIN job_postings p ON p.id = k.posting_id",
+]
+
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS job_postings_fts_aid",
+    "DROP TRIGGER IF EXISTS job_postings_fts_au",
+    "DROP TRIGGER IF EXISTS job_postings_fts_ad",
+    "DROP TRIGGER IF EXISTS job_postings_fts_ai",
+    "DROP TABLE IF EXISTS job_postings_fts",
+    "DROP TABLE IF EXISTS job_postings_search_keys",
+    # as created by c41f8e2d6a73
+    "CREATE VIRTUAL TABLE job_postings_fts USING fts5("
+    "company, job_title, location, content='job_postings', content_rowid='rowid', "
+    "tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+    "CREATE TRIGGER job_postings_fts_ai AFTER INSERT ON job_postings BEGIN "
+    "INSERT INTO job_postings_fts(rowid, company, job_title, location) "
+    "VALUES (new.rowid, new.company, new.job_title, new.location); END",
+    "CREATE TRIGGER job_postings_fts_ad AFTER DELETE ON job_postings BEGIN "
+    "INSERT INTO job_postings_fts(job_postings_fts, rowid, company, job_title, location) "
+    "VALUES ('delete', old.rowid, old.company, old.job_title, old.location); END",
+    "CREATE TRIGGER job_postings_fts_au AFTER UPDATE OF company, job_title, location "
+    "ON job_postings BEGIN "
+    "INSERT INTO job_postings_fts(job_postings_fts, rowid, company, job_title, location) "
+    "VALUES ('delete', old.rowid, old.company, old.job_title, old.location); "
+    "INSERT INTO job_postings_fts(rowid, company, job_title, location) "
+    "VALUES (new.rowid, new.company, new.job_title, new.location); END",
+    "INSERT INTO job_postings_fts(job_postings_fts) VALUES ('rebuild')",
+]
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    for stmt in SQLITE_UPGRADE:
+        op.execute(stmt)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    for stmt in SQLITE_DOWNGRADE:
+        op.execute(stmt)
@@ -0,0 +1,30 @@
+"""posting keyset pagination indexes
+
+Revision ID: 7d3e9a1c5b20
+Revises: b642d51fea92
+Create Date: 2026-10-18 12:31:09.265140
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d3e9a1c5b20'
+down_revision: Union[str, None] = 'b642d51fea92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # existing (uuid4) ids are kept; rows created from here on get time-ordered uuid7 ids
+    op.drop_index('ix_job_postings_status', table_name='job_postings')
+    op.create_index('ix_job_postings_status_id', 'job_postings', ['status', 'id'], unique=False)
+    op.create_index('ix_job_postings_source_host_id', 'job_postings', ['source_host', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_job_postings_source_host_id', table_name='job_postings')
+    op.drop_index('ix_job_postings_status_id', table_name='job_postings')
+    op.create_index('ix_job_postings_status', 'job_postings', ['status'], unique=False)
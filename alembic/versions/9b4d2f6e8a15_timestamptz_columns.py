@@ -0,0 +1,52 @@
+"""timestamptz columns
+
+Revision ID: 9b4d2f6e8a15
+Revises: e5a7c9d1f304
+Create Date: 2026-10-18 16:10:22.604417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b4d2f6e8a15'
+down_revision: Union[str, None] = 'e5a7c9d1f304'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Created naive by earlier revisions; the entities declare DateTime(timezone=True) and the app
+# writes aware UTC datetimes, which asyncpg rejects for `timestamp` columns
+COLUMNS = [
+    ('job_captures', 'captured_at', False),
+    ('job_postings', 'last_checked_at', True),
+    ('import_jobs', 'created_at', False),
+    ('import_jobs', 'started_at', True),
+    ('import_jobs', 'finished_at', True),
+    ('import_checkpoints', 'updated_at', False),
+]
+
+
+def _convert(to_aware: bool) -> None:
+    # SQLite stores both the same way: nothing to do
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for table, column, nullable in COLUMNS:
+        # stored values are UTC either way
+        op.alter_column(
+            table, column,
+            existing_type=sa.DateTime(timezone=not to_aware),
+            type_=sa.DateTime(timezone=to_aware),
+            existing_nullable=nullable,
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+        )
+
+
+def upgrade() -> None:
+    _convert(to_aware=True)
+
+
+def downgrade() -> None:
+    _convert(to_aware=False)
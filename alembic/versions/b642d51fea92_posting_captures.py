@@ -0,0 +1,60 @@
+"""posting captures link table
+
+Revision ID: b642d51fea92
+Revises: 1fcd5c7f431e
+Create Date: 2026-10-18 11:58:41.902316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b642d51fea92'
+down_revision: Union[str, None] = '1fcd5c7f431e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('posting_captures',
+    sa.Column('posting_id', sa.String(), nullable=False),
+    sa.Column('capture_id', sa.String(), nullable=False),
+    sa.ForeignKeyConstraint(['capture_id'], ['job_captures.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['posting_id'], ['job_postings.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('posting_id', 'capture_id')
+    )
+    op.create_index('ix_posting_captures_capture_id', 'posting_captures', ['capture_id'], unique=False)
+    # ids in the JSON lists whose capture no longer exists are dropped
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(
+            "INSERT INTO posting_captures (posting_id, capture_id) "
+            "SELECT p.id, j.value FROM job_postings AS p CROSS JOIN LATERAL jsonb_array_elements_text("
+            "CASE WHEN jsonb_typeof(p.capture_ids::jsonb) = 'array' THEN p.capture_ids::jsonb ELSE '[]'::jsonb END"
+            ") AS j(value) "
+            "WHERE j.value IN (SELECT id FROM job_captures) "
+            "ON CONFLICT DO NOTHING"
+        )
+    else:
+        op.execute(
+            "INSERT OR IGNORE INTO posting_captures (posting_id, capture_id) "
+            "SELECT p.id, j.value FROM job_postings AS p, json_each(p.capture_ids) AS j "
+            "WHERE j.value IN (SELECT id FROM job_captures)"
+        )
+    with op.batch_alter_table('job_postings') as batch_op:
+        batch_op.drop_column('capture_ids')
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('job_postings') as batch_op:
+        batch_op.add_column(sa.Column('capture_ids', sa.JSON(), nullable=True))
+    aggregate = 'json_agg' if op.get_bind().dialect.name == 'postgresql' else 'json_group_array'
+    op.execute(
+        "UPDATE job_postings SET capture_ids = COALESCE(("
+        f"SELECT {aggregate}(capture_id) FROM posting_captures "
+        "WHERE posting_captures.posting_id = job_postings.id), '[]')"
+    )
+    op.drop_index('ix_posting_captures_capture_id', table_name='posting_captures')
+    op.drop_table('posting_captures')
@@ -0,0 +1,64 @@
+"""posting full-text search
+
+Revision ID: c41f8e2d6a73
+Revises: 7d3e9a1c5b20
+Create Date: 2026-10-18 13:14:52.640218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41f8e2d6a73'
+down_revision: Union[str, None] = '7d3e9a1c5b20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SQLITE_UPGRADE = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS job_postings_fts USING fts5("
+    "company, job_title, location, content='job_postings', content_rowid='rowid', "
+    "tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+    "CREATE TRIGGER IF NOT EXISTS job_postings_fts_ai AFTER INSERT ON job_postings BEGIN "
+    "INSERT INTO job_postings_fts(rowid, company, job_title, location) "
+    "VALUES (new.rowid, new.company, new.job_title, new.location); END",
+    "CREATE TRIGGER IF NOT EXISTS job_postings_fts_ad AFTER DELETE ON job_postings BEGIN "
+    "INSERT INTO job_postings_fts(job_postings_fts, rowid, company, job_title, location) "
+    "VALUES ('delete', old.rowid, old.company, old.job_title, old.location); END",
+    "CREATE TRIGGER IF NOT EXISTS job_postings_fts_au AFTER UPDATE OF company, job_title, location "
+    "ON job_postings BEGIN "
+    "INSERT INTO job_postings_fts(job_postings_fts, rowid, company, job_title, location) "
+    "VALUES ('delete', old.rowid, old.company, old.job_title, old.location); "
+    "INSERT INTO job_postings_fts(rowid, company, job_title, location) "
+    "VALUES (new.rowid, new.company, new.job_title, new.location); END",
+    # backfill from the existing postings
+    "INSERT INTO job_postings_fts(job_postings_fts) VALUES ('rebuild')",
+]
+
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS job_postings_fts_au",
+    "DROP TRIGGER IF EXISTS job_postings_fts_ad",
+    "DROP TRIGGER IF EXISTS job_postings_fts_ai",
+    "DROP TABLE IF EXISTS job_postings_fts",
+]
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS ix_job_postings_search ON job_postings USING gin "
+            "(to_tsvector('simple'::regconfig, coalesce(company, '') || ' ' || "
+            "coalesce(job_title, '') || ' ' || coalesce(location, '')))"
+        )
+        return
+    for stmt in SQLITE_UPGRADE:
+        op.execute(stmt)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS ix_job_postings_search")
+        return
+    for stmt in SQLITE_DOWNGRADE:
+        op.execute(stmt)
@@ -0,0 +1,38 @@
+"""host fetch stats
+
+Revision ID: e5a7c9d1f304
+Revises: c41f8e2d6a73
+Create Date: 2026-10-18 15:02:41.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a7c9d1f304'
+down_revision: Union[str, None] = 'c41f8e2d6a73'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('host_fetch_stats',
+    sa.Column('source_host', sa.String(), nullable=False),
+    sa.Column('tier', sa.Enum('static', 'browser_lite', 'browser', name='fetch_tier'), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('successes', sa.Integer(), nullable=False),
+    sa.Column('recent', sa.JSON(), nullable=True),
+    sa.Column('success_rate', sa.Float(), nullable=False),
+    sa.Column('median_ms', sa.Float(), nullable=True),
+    sa.Column('last_success_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('source_host', 'tier')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('host_fetch_stats')
+    sa.Enum(name='fetch_tier').drop(op.get_bind(), checkfirst=True)
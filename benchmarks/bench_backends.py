@@ -0,0 +1,82 @@
+"""
+SQLite vs PostgreSQL: import throughput (PostgreSQL with and without COPY for job_captures)
+and concurrent list_jobs reads. The PostgreSQL database is dropped and recreated.
+
+    python benchmarks/bench_backends.py --rows 50000 --pg-url postgresql+asyncpg://postgres@localhost/auto_apply_bench
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import csv
+import io
+import json
+import tempfile
+import time
+from typing import Optional
+
+from common import synthetic_csv
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from auto_apply_ai.api.routers import job_intake
+from auto_apply_ai.config.settings import settings
+from auto_apply_ai.db.engine import Base, create_write_engine
+from auto_apply_ai.services.job_intake.import_pipeline import process_csv_reader
+
+job_intake.read_cache = None  # measure the database, not the cache
+
+
+async def run(url: str, text: str, args: argparse.Namespace, copy: bool) -> tuple[float, float]:
+    settings.IMPORT_PG_COPY = copy
+    settings.DB_POOL_SIZE = args.readers
+    engine = create_write_engine(url)
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+        factory = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+
+        async with factory() as session:
+            start = time.perf_counter()
+            accepted, *_ = await process_csv_reader(csv.DictReader(io.StringIO(text)), session, False, "bench")
+            rows_per_sec = accepted / (time.perf_counter() - start)
+
+        async def reader(pages: int) -> None:
+            cursor: Optional[str] = None
+            for _ in range(pages):
+                async with factory() as session:
+                    resp = await job_intake.list_jobs(
+                        status=None, company=None, host=None, q=None, limit=50, cursor=cursor, fields=None,
+                        if_none_match=None, session=session,
+                    )
+                cursor = json.loads(resp.body)["next_cursor"]
+
+        start = time.perf_counter()
+        await asyncio.gather(*(reader(args.pages) for _ in range(args.readers)))
+        pages_per_sec = args.readers * args.pages / (time.perf_counter() - start)
+    finally:
+        await engine.dispose()
+    return rows_per_sec, pages_per_sec
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--pg-url", default=None, help="postgresql+asyncpg://... (omit to run SQLite only)")
+    parser.add_argument("--readers", type=int, default=8, help="concurrent list_jobs walkers")
+    parser.add_argument("--pages", type=int, default=100, help="pages per walker")
+    args = parser.parse_args()
+
+    text = synthetic_csv(args.rows)
+    print(f"rows={args.rows} readers={args.readers} x {args.pages} pages of 50")
+    with tempfile.TemporaryDirectory() as tmp:
+        runs = [("sqlite", f"sqlite+aiosqlite:///{tmp}/bench.db", False)]
+        if args.pg_url:
+            runs += [("postgresql executemany", args.pg_url, False), ("postgresql COPY", args.pg_url, True)]
+        for label, url, copy in runs:
+            rows_per_sec, pages_per_sec = asyncio.run(run(url, text, args, copy))
+            print(f"{label:24s} import {rows_per_sec:8.0f} rows/s   list {pages_per_sec:7.0f} pages/s")
+
+
+if __name__ == "__main__":
+    main()
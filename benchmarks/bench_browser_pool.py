@@ -0,0 +1,84 @@
+"""
+Fetch N local fixture job pages with headless Chromium: a Playwright start + browser launch per
+page (the old fetch_and_parse_job) vs contexts leased from the warm BrowserPool
+(services.jd_parser.browser_pool). Pages come from a local HTTP server, so the numbers are the
+browser overhead, not the network. Needs `playwright install chromium`.
+
+    python benchmarks/bench_browser_pool.py --pages 100 --pool-size 2
+"""
+from __future__ import annotations
+import argparse
+import statistics
+import time
+from typing import Callable, List
+
+from common import serve_pages, synthetic_jd_html
+
+from auto_apply_ai.services.jd_parser.browser_pool import BrowserPool, process_tree_rss_mb
+from auto_apply_ai.services.jd_parser.scraper import open_browser
+
+
+def fetch_text(context, url: str, wait_until: str) -> str:
+    page = context.new_page()
+    try:
+        page.goto(url, wait_until=wait_until, timeout=60000)
+        return page.inner_text("main")
+    finally:
+        page.close()
+
+
+def per_call(url: str, wait_until: str) -> str:
+    p, browser, context = open_browser()
+    try:
+        return fetch_text(context, url, wait_until)
+    finally:
+        browser.close()
+        p.stop()
+
+
+def timed(urls: List[str], fetch: Callable[[str], str]) -> List[float]:
+    latencies = []
+    for url in urls:
+        start = time.perf_counter()
+        assert "Responsibilities" in fetch(url)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def report(name: str, latencies: List[float], extra: str = "") -> None:
+    latencies = sorted(latencies)
+    print(f"{name:9s} p50 {statistics.median(latencies) * 1000:8.1f} ms  "
+          f"p90 {latencies[int(len(latencies) * 0.9) - 1] * 1000:8.1f} ms  total {sum(latencies):7.2f} s{extra}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=100)
+    parser.add_argument("--pool-size", type=int, default=2)
+    parser.add_argument("--max-pages", type=int, default=200)
+    parser.add_argument("--wait-until", default="load", help="goto wait_until (the scraper waits for its page-load profile)")
+    args = parser.parse_args()
+
+    base = serve_pages({f"/jobs/{i}": synthetic_jd_html(i).encode() for i in range(args.pages)})
+    urls = [f"{base}/jobs/{i}" for i in range(args.pages)]
+    print(f"pages={args.pages} pool_size={args.pool_size} wait_until={args.wait_until} (local HTTP fixtures)")
+
+    report("per-call", timed(urls, lambda url: per_call(url, args.wait_until)))
+
+    pool = BrowserPool(size=args.pool_size, max_pages=args.max_pages)
+    start = time.perf_counter()
+    pool.start()
+    warmup = time.perf_counter() - start
+
+    def leased(url: str) -> str:
+        with pool.lease() as context:
+            return fetch_text(context, url, args.wait_until)
+
+    latencies = timed(urls, leased)
+    rss = [process_tree_rss_mb(s.marker) for s in pool._slots if s is not None]
+    pool.close()
+    report("pool", latencies, f"  (+{warmup:.2f} s warm-up, browser RSS {sum(r or 0 for r in rss):.0f} MB, {pool.stats()['launched']} launches)")
+
+
+if __name__ == "__main__":
+    main()
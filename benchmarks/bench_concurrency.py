@@ -0,0 +1,147 @@
+"""
+Mixed load against one SQLite file: CSV imports + single-posting deletes + list calls,
+all concurrent through the API (in-process), with DB_WRITE_MODE=direct (one shared pool)
+vs. queue (single writer connection, group-committed deletes, read-only WAL reader pool).
+List calls bypass the read cache so every one hits the database.
+
+    python benchmarks/bench_concurrency.py --importers 2 --imports 3 --rows 5000 --deleters 8 --listers 8
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import tempfile
+import time
+from typing import Dict, List
+
+from common import synthetic_csv
+
+import httpx
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from auto_apply_ai.api.app import create_app
+from auto_apply_ai.api.deps import get_read_session, get_session, get_writer
+from auto_apply_ai.api.routers import job_intake
+from auto_apply_ai.db.engine import Base, create_read_engine, create_write_engine
+from auto_apply_ai.db.writer import GroupCommitWriter, SessionWriter
+from auto_apply_ai.models.entities import JobPosting
+
+job_intake.read_cache = None  # measure the database, not the cache
+
+
+def pct(values: List[float], p: float) -> float:
+    values = sorted(values)
+    return values[max(int(len(values) * p) - 1, 0)] if values else float("nan")
+
+
+async def run(path: str, mode: str, args: argparse.Namespace) -> Dict[str, object]:
+    url = f"sqlite+aiosqlite:///{path}"
+    queue = mode == "queue"
+    write_engine = create_write_engine(url, single_writer=queue)
+    read_engine = create_read_engine(url) if queue else write_engine
+    writes = async_sessionmaker(write_engine, expire_on_commit=False, class_=AsyncSession)
+    reads = async_sessionmaker(read_engine, expire_on_commit=False, class_=AsyncSession)
+    writer = GroupCommitWriter(writes) if queue else SessionWriter(writes)
+
+    async with write_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    def override(factory):
+        async def dep():
+            async with factory() as session:
+                yield session
+        return dep
+
+    app = create_app()
+    app.dependency_overrides[get_session] = override(writes)
+    app.dependency_overrides[get_read_session] = override(reads)
+    app.dependency_overrides[get_writer] = lambda: writer
+
+    stats: Dict[str, List[float]] = {"list": [], "delete": [], "import": []}
+    errors: Dict[str, int] = {}
+    done = asyncio.Event()
+
+    async def timed(kind: str, call) -> None:
+        start = time.perf_counter()
+        try:
+            resp = await call
+            if resp.status_code >= 500:
+                errors[kind] = errors.get(kind, 0) + 1
+                return
+        except Exception as e:  # e.g. OperationalError: database is locked
+            errors[f"{kind}: {type(e).__name__}"] = errors.get(f"{kind}: {type(e).__name__}", 0) + 1
+            return
+        stats[kind].append(time.perf_counter() - start)
+
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=True)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        seed = synthetic_csv(args.seed_rows).replace("/jobs/", "/jobs/seed-")
+        await client.post("/job_intake/csv", files={"file": ("seed.csv", seed)}, params={"result_format": "compact"})
+        async with reads() as session:
+            ids = (await session.execute(select(JobPosting.id))).scalars().all()
+
+        async def importer(n: int) -> None:
+            for i in range(args.imports):
+                text = synthetic_csv(args.rows).replace("/jobs/", f"/jobs/i{n}-{i}-")
+                await timed("import", client.post(
+                    "/job_intake/csv", files={"file": ("x.csv", text)},
+                    params={"result_format": "compact", "commit_every": args.commit_every},
+                ))
+
+        async def deleter(n: int) -> None:
+            for job_id in ids[n::args.deleters]:
+                if done.is_set():
+                    return
+                await timed("delete", client.delete(f"/job_intake/{job_id}"))
+
+        async def lister() -> None:
+            while not done.is_set():
+                await timed("list", client.get("/job_intake", params={"limit": 50}))
+
+        start = time.perf_counter()
+        background = [asyncio.create_task(deleter(n)) for n in range(args.deleters)]
+        background += [asyncio.create_task(lister()) for _ in range(args.listers)]
+        await asyncio.gather(*(importer(n) for n in range(args.importers)))
+        elapsed = time.perf_counter() - start
+        done.set()
+        await asyncio.gather(*background)
+
+    await writer.stop()
+    await write_engine.dispose()
+    if queue:
+        await read_engine.dispose()
+    imported = len(stats["import"]) * args.rows
+    return {
+        "elapsed": elapsed,
+        "import_rows_per_s": imported / elapsed,
+        "deletes_per_s": len(stats["delete"]) / elapsed,
+        "delete_p50": pct(stats["delete"], 0.5) * 1000, "delete_p95": pct(stats["delete"], 0.95) * 1000,
+        "list_per_s": len(stats["list"]) / elapsed,
+        "list_p50": pct(stats["list"], 0.5) * 1000, "list_p95": pct(stats["list"], 0.95) * 1000,
+        "errors": errors,
+        "group_commit": f"{writer.units} units / {writer.commits} commits" if queue else "-",
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seed-rows", type=int, default=20000)
+    parser.add_argument("--importers", type=int, default=2)
+    parser.add_argument("--imports", type=int, default=3, help="imports per importer")
+    parser.add_argument("--rows", type=int, default=5000, help="rows per import")
+    parser.add_argument("--commit-every", type=int, default=1000)
+    parser.add_argument("--deleters", type=int, default=8)
+    parser.add_argument("--listers", type=int, default=8)
+    args = parser.parse_args()
+
+    for mode in ("direct", "queue"):
+        with tempfile.TemporaryDirectory() as tmp:
+            r = asyncio.run(run(f"{tmp}/bench.db", mode, args))
+        print(f"{mode:6s} {r['elapsed']:6.1f}s  imports {r['import_rows_per_s']:7.0f} rows/s  "
+              f"deletes {r['deletes_per_s']:6.0f}/s (p50 {r['delete_p50']:.1f} p95 {r['delete_p95']:.1f} ms)  "
+              f"lists {r['list_per_s']:6.0f}/s (p50 {r['list_p50']:.1f} p95 {r['list_p95']:.1f} ms)  "
+              f"errors {r['errors'] or 0}  group commit: {r['group_commit']}")
+
+
+if __name__ == "__main__":
+    main()
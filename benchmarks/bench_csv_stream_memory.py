@@ -0,0 +1,100 @@
+"""
+Peak RSS of a CSV upload import: whole-payload buffering vs. streaming parse.
+
+    python benchmarks/bench_csv_stream_memory.py --mb 200 --budget-mb 120
+
+Each mode runs in its own child process (dry run, so only parsing, normalization and
+validation are measured). Exits non-zero if the streaming path exceeds --budget-mb.
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import csv
+import io
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from common import synthetic_rows
+
+from starlette.datastructures import UploadFile
+
+from auto_apply_ai.services.job_intake.import_pipeline import process_csv_reader
+from auto_apply_ai.services.job_intake.ingest.csv_stream import aiter_csv_dicts, aiter_file_chunks
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def write_csv(path: str, target_mb: int) -> int:
+    # ~130 bytes per row; no duplicates or warnings so only parsing state can grow
+    rows = target_mb * 1024 * 1024 // 130
+    with open(path, "w", encoding="utf-8") as f:
+        for line in synthetic_rows(rows, dup_ratio=0, blank_company_every=0):
+            f.write(line)
+    return rows
+
+
+async def child(path: str, mode: str) -> None:
+    with open(path, "rb") as fh:
+        upload = UploadFile(file=fh, filename="bench.csv")
+        if mode == "buffered":
+            text = (await upload.read()).decode("utf-8", errors="replace")
+            reader = csv.DictReader(io.StringIO(text))
+        else:
+            reader = aiter_csv_dicts(aiter_file_chunks(upload))
+        start = time.perf_counter()
+        accepted, quarantined, *_ = await process_csv_reader(reader, _NoSession(), True, "bench")  # type: ignore[arg-type]
+        elapsed = time.perf_counter() - start
+    print(f"{mode:9}: peak_rss={peak_rss_mb():7.1f} MB  rows={accepted + quarantined}  {elapsed:6.1f}s")
+    print(f"PEAK {peak_rss_mb():.1f}")
+
+
+class _NoSession:
+    """Dry runs never write; process_csv_reader only ends the transaction."""
+
+    async def commit(self):
+        pass
+
+    async def rollback(self):
+        pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--mb", type=int, default=200)
+    parser.add_argument("--budget-mb", type=float, default=120)
+    parser.add_argument("--mode", choices=("buffered", "streaming"))
+    parser.add_argument("--path")
+    args = parser.parse_args()
+
+    if args.mode:
+        asyncio.run(child(args.path, args.mode))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.csv")
+        rows = write_csv(path, args.mb)
+        print(f"payload={os.path.getsize(path) / 2**20:.0f} MB rows={rows}")
+        peaks = {}
+        for mode in ("buffered", "streaming"):
+            out = subprocess.run(
+                [sys.executable, __file__, "--mode", mode, "--path", path],
+                check=True, capture_output=True, text=True,
+            ).stdout
+            print(out.splitlines()[0])
+            peaks[mode] = float(out.splitlines()[-1].split()[1])
+
+    if peaks["streaming"] > args.budget_mb:
+        sys.exit(f"streaming peak RSS {peaks['streaming']:.1f} MB exceeds budget {args.budget_mb} MB")
+    print(f"streaming peak RSS within budget ({args.budget_mb} MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Dedupe key formats: 40-char SHA-1 hex TEXT (old) vs 16-byte BLOB (dedupe.keys).
+Reports index size and lookup speed (point lookups and the importer's batched IN lookups).
+
+    python benchmarks/bench_dedupe_keys.py --rows 1000000 --lookups 200000
+"""
+from __future__ import annotations
+import argparse
+import random
+import sqlite3
+import tempfile
+import time
+from hashlib import sha1
+from typing import Callable, List, Sequence
+
+from common import HOSTS
+
+from auto_apply_ai.services.job_intake.dedupe.keys import key_exact
+
+IN_BATCH = 500
+
+
+def pages(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA page_count").fetchone()[0]
+
+
+def build(conn: sqlite3.Connection, table: str, col_type: str, keys: Sequence[object]) -> int:
+    """Load keys into a fresh table and return the size of its index in bytes."""
+    conn.execute(f"CREATE TABLE {table} (id INTEGER PRIMARY KEY, k {col_type} NOT NULL)")
+    conn.executemany(f"INSERT INTO {table} (k) VALUES (?)", ((k,) for k in keys))
+    conn.commit()
+    before = pages(conn)
+    conn.execute(f"CREATE INDEX ix_{table}_k ON {table} (k)")
+    conn.commit()
+    return (pages(conn) - before) * conn.execute("PRAGMA page_size").fetchone()[0]
+
+
+def timed(fn: Callable[[], None]) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def point_lookups(conn: sqlite3.Connection, table: str, probes: List[object]) -> None:
+    sql = f"SELECT id FROM {table} WHERE k = ?"
+    for p in probes:
+        conn.execute(sql, (p,)).fetchone()
+
+
+def batched_lookups(conn: sqlite3.Connection, table: str, probes: List[object]) -> None:
+    sql = f"SELECT id, k FROM {table} WHERE k IN ({','.join('?' * IN_BATCH)})"
+    for i in range(0, len(probes) - IN_BATCH + 1, IN_BATCH):
+        conn.execute(sql, probes[i:i + IN_BATCH]).fetchall()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--lookups", type=int, default=200000)
+    parser.add_argument("--cache-mb", type=int, default=16, help="page cache, smaller = closer to a cold working set")
+    args = parser.parse_args()
+
+    urls = [f"https://{HOSTS[i % len(HOSTS)]}/jobs/{i}" for i in range(args.rows)]
+    hex_keys = [sha1(u.encode("utf-8")).hexdigest() for u in urls]
+    blob_keys = [key_exact(u) for u in urls]
+    rnd = random.Random(7)
+    # half hits, half misses, like an import of partly-new postings
+    picks = [rnd.randrange(args.rows) for _ in range(args.lookups)]
+    miss = [f"https://example.org/miss/{i}" for i in range(args.lookups)]
+    hex_probes = [hex_keys[j] if n % 2 else sha1(miss[n].encode("utf-8")).hexdigest() for n, j in enumerate(picks)]
+    blob_probes = [blob_keys[j] if n % 2 else key_exact(miss[n]) for n, j in enumerate(picks)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = sqlite3.connect(f"{tmp}/keys.db")
+        conn.execute(f"PRAGMA cache_size = -{args.cache_mb * 1024}")
+        size_hex = build(conn, "hex_keys", "TEXT", hex_keys)
+        size_blob = build(conn, "blob_keys", "BLOB", blob_keys)
+
+        t_hex = timed(lambda: point_lookups(conn, "hex_keys", hex_probes))
+        t_blob = timed(lambda: point_lookups(conn, "blob_keys", blob_probes))
+        b_hex = timed(lambda: batched_lookups(conn, "hex_keys", hex_probes))
+        b_blob = timed(lambda: batched_lookups(conn, "blob_keys", blob_probes))
+        conn.close()
+
+    mb = 1024 * 1024
+    print(f"rows={args.rows} lookups={args.lookups} cache={args.cache_mb}MB")
+    print(f"index size      hex TEXT: {size_hex / mb:8.1f} MB   blob: {size_blob / mb:8.1f} MB  ({size_hex / size_blob:.2f}x smaller)")
+    print(f"point lookups   hex TEXT: {args.lookups / t_hex:8.0f} /s   blob: {args.lookups / t_blob:8.0f} /s  ({t_hex / t_blob:.2f}x)")
+    print(f"IN({IN_BATCH}) lookups hex TEXT: {args.lookups / b_hex:8.0f} /s   blob: {args.lookups / b_blob:8.0f} /s  ({b_hex / b_blob:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Tiered JD fetch (services.jd_parser.tiered) over a local mix of job pages: JSON-LD pages
+(Greenhouse/Lever/Workday style), server-rendered pages without JSON-LD, and JS-only shells
+that need a browser, each kind on its own host key. Prints per-tier attempts, hit rate and
+latency for the browser-only fetch, the tiered fetch, and the tiered fetch with the per-host
+strategy table (jd_parser.strategy, on a throwaway database), which stops sending GETs to the
+JS-only host. --skip-browser replaces Chromium with an immediate failure so the static tier
+can be measured where no browser is installed (shells then count as errors).
+
+    python benchmarks/bench_fetch_tiers.py --pages 200 --shell-ratio 0.2
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+import time
+from contextlib import asynccontextmanager
+
+from common import serve_pages, synthetic_jd_html, temp_database
+
+from auto_apply_ai.services.http_client import build_client
+from auto_apply_ai.services.jd_parser.crawler import CrawlEngine, CrawlTarget
+from auto_apply_ai.services.jd_parser.strategy import StrategyTable
+from auto_apply_ai.services.jd_parser.tiered import TierStats, TieredFetcher
+
+
+def json_ld_page(n: int) -> str:
+    body = synthetic_jd_html(n)
+    posting = {
+        "@context": "https://schema.org", "@type": "JobPosting", "title": f"Engineer {n}",
+        "hiringOrganization": {"@type": "Organization", "name": f"Company {n % 997}"},
+        "jobLocationType": "TELECOMMUTE", "employmentType": "FULL_TIME",
+        "description": body.split("<main>", 1)[1].split("</main>", 1)[0],
+    }
+    shell = "<html><head><script type='application/ld+json'>" + json.dumps(posting) + "</script></head>"
+    return shell + "<body><div id='app'></div><script src='/app.js'></script></body></html>"
+
+
+def js_shell(n: int) -> str:
+    return f"<html><head><title>Job {n}</title></head><body><div id='root'></div><script src='/app.js'></script></body></html>"
+
+
+class NoBrowser:
+    @asynccontextmanager
+    async def lease(self):
+        raise RuntimeError("browser tier skipped (--skip-browser)")
+        yield
+
+    async def close(self) -> None:
+        pass
+
+
+async def run(args: argparse.Namespace) -> None:
+    pages, kinds, host = {}, {"json-ld": 0, "html": 0, "shell": 0}, {}
+    shell_every = round(1 / args.shell_ratio) if args.shell_ratio else 0
+    for i in range(args.pages):
+        if shell_every and i % shell_every == 0:
+            pages[f"/jobs/{i}"], kind = js_shell(i), "shell"
+        elif i % 2:
+            pages[f"/jobs/{i}"], kind = json_ld_page(i), "json-ld"
+        else:
+            pages[f"/jobs/{i}"], kind = synthetic_jd_html(i), "html"
+        kinds[kind] += 1
+        host[f"/jobs/{i}"] = f"{kind}.ats.test"
+    base = serve_pages({k: v.encode() for k, v in pages.items()}, delay=args.server_delay_ms / 1000)
+    targets = [CrawlTarget(url=f"{base}{path}", host=host[path]) for path in pages]
+    print(f"pages={args.pages} {kinds} server_delay={args.server_delay_ms} ms"
+          f"{' (browser skipped)' if args.skip_browser else ''}")
+
+    client = build_client(per_host=0)
+    async with temp_database() as (_engine, sessions):
+        for mode in ("browser-only", "tiered", "tiered+strategy"):
+            stats = TierStats()
+            strategies = StrategyTable(sessions) if mode == "tiered+strategy" else None
+            fetcher = TieredFetcher(client=client, pool=NoBrowser() if args.skip_browser else None,
+                                    static_first=mode != "browser-only", stats=stats,
+                                    strategies=strategies, use_strategies=strategies is not None)
+            engine = CrawlEngine(fetch=fetcher, concurrency=args.concurrency, per_host=args.concurrency, host_delay=0)
+            start = time.perf_counter()
+            ok = sum([r.ok async for r in engine.crawl(targets)])
+            elapsed = time.perf_counter() - start
+            await fetcher.aclose()
+            print(f"{mode:16s} ok {ok}/{len(targets)} in {elapsed:6.2f} s")
+            for tier, row in stats.snapshot().items():
+                print(f"  {tier:12s} attempts {row['attempts']:5.0f}  hit {row['hit']:5.0f}  thin {row['thin']:4.0f}  "
+                      f"error {row['error']:4.0f}  hit rate {row['hit_rate']:6.1%}  p50 {row['p50_ms']:8.1f} ms  p90 {row['p90_ms']:8.1f} ms")
+            if strategies is not None:
+                for name, tiers in sorted(strategies.snapshot().items()):
+                    print(f"  {name:16s} starts at {strategies.plan(name)[0]:12s} " + "  ".join(
+                        f"{t}: {r['success_rate']:.0%} of {r['attempts']}, median {r['median_ms']} ms" for t, r in tiers.items()))
+    await client.aclose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--shell-ratio", type=float, default=0.2)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--server-delay-ms", type=float, default=50.0)
+    parser.add_argument("--skip-browser", action="store_true")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Back-to-back Google Sheet imports (POST /job_intake/google_sheet, dry run) against a local
+HTTPS stand-in for docs.google.com: a new httpx.AsyncClient per request (before) vs the
+shared pooled client (services.http_client). Needs the openssl CLI for a throwaway cert.
+--connect-delay-ms adds a server-side pause per new connection to stand in for DNS + TCP
+round trips to a remote host (loopback has none).
+
+    python benchmarks/bench_http_client.py --imports 50 --rows 200 --connect-delay-ms 30
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import os
+import ssl
+import statistics
+import subprocess
+import tempfile
+import threading
+import time
+from typing import List
+
+from common import synthetic_csv, temp_database
+
+import httpx
+
+from auto_apply_ai.api.app import create_app
+from auto_apply_ai.api.deps import get_http_client, get_session
+from auto_apply_ai.services.http_client import build_client
+
+
+def sheet_server(body: bytes, certfile: str, keyfile: str, connect_delay: float) -> int:
+    """Keep-alive HTTPS server in a thread answering every request with `body` in one write."""
+    head = f"HTTP/1.1 200 OK\r\ncontent-type: text/csv\r\ncontent-length: {len(body)}\r\n\r\n".encode()
+    tls = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    tls.load_cert_chain(certfile, keyfile)
+    ready = threading.Event()
+    port: List[int] = []
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        await asyncio.sleep(connect_delay)
+        try:
+            while await reader.readuntil(b"\r\n\r\n"):
+                writer.write(head + body)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        writer.close()
+
+    async def serve() -> None:
+        server = await asyncio.start_server(handle, "127.0.0.1", 0, ssl=tls)
+        port.append(server.sockets[0].getsockname()[1])
+        ready.set()
+        await server.serve_forever()
+
+    threading.Thread(target=asyncio.run, args=(serve(),), daemon=True).start()
+    ready.wait()
+    return port[0]
+
+
+async def run(mode: str, sheet_url: str, args: argparse.Namespace) -> List[float]:
+    async with temp_database() as (_engine, sessions):
+        async def session_override():
+            async with sessions() as session:
+                yield session
+
+        async def per_request_client():
+            async with httpx.AsyncClient(timeout=20, follow_redirects=True) as client:
+                yield client
+
+        shared = build_client()
+        app = create_app()
+        app.dependency_overrides[get_session] = session_override
+        app.dependency_overrides[get_http_client] = per_request_client if mode == "per-request" else (lambda: shared)
+        latencies = []
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as api:
+            for _ in range(args.imports):
+                start = time.perf_counter()
+                resp = await api.post("/job_intake/google_sheet", params={"sheet_url": sheet_url, "dry_run": "true"})
+                latencies.append(time.perf_counter() - start)
+                assert resp.status_code == 200, resp.text
+        await shared.aclose()
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--imports", type=int, default=50)
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--connect-delay-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cert, key = os.path.join(tmp, "cert.pem"), os.path.join(tmp, "key.pem")
+        subprocess.run(
+            ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1", "-subj", "/CN=127.0.0.1",
+             "-addext", "subjectAltName=IP:127.0.0.1", "-keyout", key, "-out", cert],
+            check=True, capture_output=True,
+        )
+        os.environ["SSL_CERT_FILE"] = cert  # trust the throwaway cert (httpx honours it)
+        port = sheet_server(synthetic_csv(args.rows).encode(), cert, key, args.connect_delay_ms / 1000)
+        sheet_url = f"https://127.0.0.1:{port}/spreadsheets/export?format=csv"
+        print(f"imports={args.imports} rows={args.rows} connect_delay={args.connect_delay_ms} ms (dry run, TLS to 127.0.0.1)")
+        for mode in ("per-request", "shared"):
+            latencies = sorted(asyncio.run(run(mode, sheet_url, args)))
+            print(f"{mode:12s} p50 {statistics.median(latencies) * 1000:7.2f} ms  "
+                  f"p90 {latencies[int(len(latencies) * 0.9) - 1] * 1000:7.2f} ms  total {sum(latencies):6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
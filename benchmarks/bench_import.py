@@ -0,0 +1,44 @@
+"""
+Import throughput: row-by-row ORM writes vs. chunked set-based writes.
+
+    python benchmarks/bench_import.py --rows 50000 --batch-size 2000
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import csv
+import io
+import time
+
+from common import synthetic_csv, temp_database
+
+from auto_apply_ai.services.job_intake.import_pipeline import process_csv_reader
+
+
+async def run(text: str, batch_size: int) -> float:
+    async with temp_database() as (_, sessions):
+        async with sessions() as session:
+            start = time.perf_counter()
+            accepted, *_ = await process_csv_reader(
+                csv.DictReader(io.StringIO(text)), session, False, "bench", batch_size=batch_size
+            )
+            elapsed = time.perf_counter() - start
+    return accepted / elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--batch-size", type=int, default=2000)
+    args = parser.parse_args()
+
+    text = synthetic_csv(args.rows)
+    before = await run(text, batch_size=1)
+    after = await run(text, batch_size=args.batch_size)
+    print(f"rows={args.rows}")
+    print(f"row-by-row         : {before:10.0f} rows/sec")
+    print(f"batched ({args.batch_size:>5})    : {after:10.0f} rows/sec  ({after / before:.1f}x)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,115 @@
+"""
+Keyset pagination through list_jobs: random uuid4 ids + single-column status index (old)
+vs. time-ordered uuid7 ids + (status, id) / (source_host, id) indexes (current schema).
+
+    python benchmarks/bench_list_jobs.py --rows 1000000 --limit 200 --max-pages 200
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+import os
+import sqlite3
+import tempfile
+import time
+import uuid
+from typing import Callable, Optional
+
+from common import HOSTS
+
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from auto_apply_ai.api.routers.job_intake import list_jobs
+from auto_apply_ai.db.engine import Base
+from auto_apply_ai.models.entities import Status
+from auto_apply_ai.utils.ids import uuid7
+
+STATUSES = Status[:4]  # filtered pages select ~1/4 of the table
+
+
+def build(path: str, rows: int, new_id: Callable[[], str], legacy: bool) -> None:
+    sync = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(sync)
+    sync.dispose()
+    conn = sqlite3.connect(path)
+    if legacy:
+        conn.execute("DROP INDEX ix_job_postings_status_id")
+        conn.execute("DROP INDEX ix_job_postings_source_host_id")
+        conn.execute("CREATE INDEX ix_job_postings_status ON job_postings (status)")
+    conn.executemany(
+        "INSERT INTO job_postings (id, canonical_url, company, job_title, source_host, status, next_action,"
+        " dedupe_key_exact, dedupe_key_company_title_host) VALUES (?, ?, ?, ?, ?, ?, 'none', ?, ?)",
+        (
+            (new_id(), f"https://{HOSTS[i % len(HOSTS)]}/jobs/{i}", f"Company {i % 997}", "Engineer",
+             HOSTS[i % len(HOSTS)], STATUSES[(i // 7) % len(STATUSES)], os.urandom(16), os.urandom(16))
+            for i in range(rows)
+        ),
+    )
+    conn.commit()
+    conn.execute("ANALYZE")
+    conn.close()
+
+
+async def walk(
+    factory: async_sessionmaker[AsyncSession], limit: int, max_pages: int,
+    status: Optional[str] = None, host: Optional[str] = None,
+) -> tuple[int, int, float]:
+    pages = seen = 0
+    cursor = None
+    start = time.perf_counter()
+    while pages < max_pages:
+        async with factory() as session:
+            resp = await list_jobs(
+                status=status, company=None, host=host, q=None, limit=limit, cursor=cursor, fields=None,
+                if_none_match=None, session=session,
+            )
+        page = json.loads(resp.body)
+        pages += 1
+        seen += len(page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    return pages, seen, time.perf_counter() - start
+
+
+async def run(path: str, args: argparse.Namespace) -> dict[str, float]:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    factory = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+    out = {}
+    try:
+        for name, filters in (("unfiltered", {}), ("status", {"status": STATUSES[1]}), ("source_host", {"host": HOSTS[2]})):
+            pages, seen, secs = await walk(factory, args.limit, args.max_pages, **filters)
+            out[name] = secs / pages * 1000
+            print(f"  {name:12s}: {pages:5d} pages ({seen:7d} rows)  {out[name]:8.2f} ms/page")
+    finally:
+        await engine.dispose()
+    return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--limit", type=int, default=200)
+    parser.add_argument("--max-pages", type=int, default=200, help="0 = walk every page")
+    args = parser.parse_args()
+    if args.max_pages <= 0:
+        args.max_pages = args.rows
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, new_id, legacy in (
+            ("uuid4 + ix(status)", lambda: str(uuid.uuid4()), True),
+            ("uuid7 + ix(status,id), ix(source_host,id)", uuid7, False),
+        ):
+            path = f"{tmp}/{'legacy' if legacy else 'keyset'}.db"
+            build(path, args.rows, new_id, legacy)
+            print(f"{label}  rows={args.rows} limit={args.limit}")
+            results[label] = asyncio.run(run(path, args))
+
+    old, new = results.values()
+    print("speedup: " + "  ".join(f"{k} {old[k] / new[k]:.1f}x" for k in new))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Latency of GET /job_intake (full HTTP stack in-process, 200 items per page by default).
+--mode walk pages forward (every request misses the read cache), poll re-requests the
+first page (cache hits) and revalidate re-requests it with If-None-Match (304s).
+
+    python benchmarks/bench_list_latency.py --rows 100000 --requests 300 --limit 200
+    python benchmarks/bench_list_latency.py --fields id,company,job_title
+    python benchmarks/bench_list_latency.py --mode poll
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import os
+import sqlite3
+import statistics
+import tempfile
+import time
+
+from common import HOSTS
+
+import httpx
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from auto_apply_ai.api.app import create_app
+from auto_apply_ai.api.deps import get_session
+from auto_apply_ai.db.engine import Base
+from auto_apply_ai.utils.ids import uuid7
+
+
+def build(path: str, rows: int) -> None:
+    sync = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(sync)
+    sync.dispose()
+    conn = sqlite3.connect(path)
+    conn.executemany(
+        "INSERT INTO job_postings (id, canonical_url, company, job_title, location, source_host, status,"
+        " next_action, dedupe_key_exact, dedupe_key_company_title_host)"
+        " VALUES (?, ?, ?, ?, 'Remote', ?, 'new', 'retry_fetch', ?, ?)",
+        (
+            (uuid7(), f"https://{HOSTS[i % len(HOSTS)]}/jobs/{i}", f"Company {i % 997}", "Backend Engineer",
+             HOSTS[i % len(HOSTS)], os.urandom(16), os.urandom(16))
+            for i in range(rows)
+        ),
+    )
+    conn.commit()
+    conn.close()
+
+
+async def measure(path: str, args: argparse.Namespace) -> list[float]:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    factory = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+
+    async def session_override():
+        async with factory() as session:
+            yield session
+
+    app = create_app()
+    app.dependency_overrides[get_session] = session_override
+    params = {"limit": args.limit}
+    if args.fields:
+        params["fields"] = args.fields
+    timings = []
+    try:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+            cursor = None
+            etag = None
+            for i in range(args.warmup + args.requests):
+                headers = {"If-None-Match": etag} if etag and args.mode == "revalidate" else {}
+                start = time.perf_counter()
+                resp = await client.get("/job_intake", params={**params, **({"cursor": cursor} if cursor else {})}, headers=headers)
+                elapsed = time.perf_counter() - start
+                if resp.status_code != 304:
+                    resp.raise_for_status()
+                etag = resp.headers.get("etag", etag)
+                if args.mode == "walk":
+                    cursor = resp.json()["next_cursor"]  # walk forward; restart at the end
+                if i >= args.warmup:
+                    timings.append(elapsed * 1000)
+    finally:
+        await engine.dispose()
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=200)
+    parser.add_argument("--fields", default=None)
+    parser.add_argument("--mode", choices=("walk", "poll", "revalidate"), default="walk")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = f"{tmp}/bench.db"
+        build(path, args.rows)
+        timings = asyncio.run(measure(path, args))
+
+    timings.sort()
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    print(f"rows={args.rows} limit={args.limit} fields={args.fields or 'all'} mode={args.mode} requests={len(timings)}")
+    print(f"latency ms: p50 {statistics.median(timings):.2f}  p95 {p95:.2f}  mean {statistics.fmean(timings):.2f}")
+    print(f"throughput: {1000 / statistics.fmean(timings):.0f} req/s (sequential)")
+
+
+if __name__ == "__main__":
+    main()
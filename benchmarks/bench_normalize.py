@@ -0,0 +1,74 @@
+"""
+Normalization + validation throughput: row-wise functions vs. the columnar engine.
+
+    python benchmarks/bench_normalize.py --rows 200000 --block 2000
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import csv
+import io
+import time
+
+from common import synthetic_csv
+
+from auto_apply_ai.services.job_intake.import_pipeline import process_csv_reader
+from auto_apply_ai.services.job_intake.ingest.columnar import prepare_block
+from auto_apply_ai.services.job_intake.ingest.normalizers import normalize_capture_row
+from auto_apply_ai.services.job_intake.ingest.validators import validate_row
+from auto_apply_ai.utils.time import parse_captured_at
+
+
+class _NoSession:
+    async def commit(self):
+        pass
+
+    async def rollback(self):
+        pass
+
+
+def rowwise(rows):
+    for raw in rows:
+        row = normalize_capture_row(raw)
+        row["captured_at"] = parse_captured_at(row.get("captured_at"))
+        row["import_batch_id"] = "bench"
+        validate_row(row)
+
+
+def columnar(rows, block):
+    for i in range(0, len(rows), block):
+        for _ in prepare_block(rows[i:i + block], "bench"):
+            pass
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--block", type=int, default=2000)
+    args = parser.parse_args()
+
+    text = synthetic_csv(args.rows)
+    rows = list(csv.DictReader(io.StringIO(text)))
+    n = len(rows)
+    t_row = timed(lambda: rowwise(rows))
+    t_col = timed(lambda: columnar(rows, args.block))
+    print(f"rows={n}")
+    print(f"prepare row-wise   : {n / t_row:10.0f} rows/sec")
+    print(f"prepare columnar   : {n / t_col:10.0f} rows/sec  ({t_row / t_col:.1f}x)")
+
+    for flag in (False, True):
+        reader = csv.DictReader(io.StringIO(text))
+        start = time.perf_counter()
+        asyncio.run(process_csv_reader(reader, _NoSession(), True, "bench", batch_size=args.block, columnar=flag))  # type: ignore[arg-type]
+        elapsed = time.perf_counter() - start
+        print(f"dry-run import {'columnar' if flag else 'row-wise'}: {n / elapsed:10.0f} rows/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+Page-load profiles (services.jd_parser.page_profiles) vs the old `networkidle` load, on local
+fixture pages shaped like recorded ATS pages: a server-rendered Greenhouse and Lever posting,
+a Workday shell that renders the description from a first-party XHR, and a custom career
+site, each with images, web fonts, a stylesheet, a video, an analytics tag that long-polls
+its collector and a chat widget. Chromium resolves every host to the local fixture server
+(--host-resolver-rules), so ATS detection and tracker blocking see the real host names.
+
+Prints, per page and mode, the median time until the page is ready (goto returned, or the
+profile's readiness check passed), the bytes the server sent, the requests that reached it,
+and the description text found. Needs `playwright install chromium`.
+
+    python benchmarks/bench_page_profiles.py --runs 5 --networkidle-timeout 20
+"""
+from __future__ import annotations
+import argparse
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Tuple
+
+from common import synthetic_jd_html
+
+from auto_apply_ai.services.jd_parser.page_profiles import load_page, profile_for
+
+TRACKERS = (
+    "<script src='http://www.googletagmanager.com:{port}/gtm.js'></script>"
+    "<script src='http://widget.intercom.io:{port}/widget.js'></script>"
+)
+HEAVY = (
+    "<link rel='stylesheet' href='/assets/app.css'>"
+    + "".join(f"<img src='/assets/photo{i}.jpg' width=10>" for i in range(6))
+    + "<video src='/assets/culture.mp4' preload='auto' muted></video>"
+)
+
+
+def description(n: int) -> str:
+    return synthetic_jd_html(n).split("<main>", 1)[1].split("</main>", 1)[0]
+
+
+def fixture_pages(port: int) -> Dict[Tuple[str, str], Tuple[str, bytes]]:
+    """{(host, path): (content type, body)}; page hosts are ATS hosts, served locally."""
+    trackers = TRACKERS.format(port=port)
+    html = "text/html; charset=utf-8"
+    pages = {
+        ("boards.greenhouse.io", "/acme/jobs/1"): f"<html><head>{HEAVY}{trackers}</head><body>"
+        f"<div id='content'><div class='job__description'>{description(1)}</div></div></body></html>",
+        ("jobs.lever.co", "/acme/2"): f"<html><head>{HEAVY}{trackers}</head><body><div class='posting-page'>"
+        f"<div data-qa='job-description'>{description(2)}</div></div></body></html>",
+        ("acme.wd5.myworkdayjobs.com", "/en-US/careers/job/3"): f"<html><head>{HEAVY}{trackers}</head><body>"
+        f"<div id='root'></div><script src='http://wd5.myworkdaycdn.com:{port}/wd.js'></script></body></html>",
+        ("careers.acme.test", "/jobs/4"): f"<html><head>{HEAVY}{trackers}</head><body>"
+        f"<main>{description(4)}</main></body></html>",
+    }
+    out = {key: (html, body.encode()) for key, body in pages.items()}
+    css = "@font-face{font-family:Brand;src:url(/assets/brand.woff2)}body{font-family:Brand}" + "." * 40_000
+    widget = "/*" + "w" * 200_000 + "*/ fetch('http://widget.intercom.io:%d/poll');" % port
+    gtm = "/*" + "g" * 90_000 + "*/ fetch('http://www.google-analytics.com:%d/collect');" % port
+    app = ("/*" + "a" * 150_000 + "*/ setTimeout(() => fetch('/wday/cxs/job/3').then(r => r.text())"
+           ".then(t => { const d = document.createElement('div');"
+           " d.setAttribute('data-automation-id', 'jobPostingDescription'); d.innerHTML = t;"
+           " document.getElementById('root').appendChild(d); }), 300);")
+    for host in {h for h, _ in pages} | {"wd5.myworkdaycdn.com"}:
+        out[(host, "/assets/app.css")] = ("text/css", css.encode())
+        out[(host, "/assets/brand.woff2")] = ("font/woff2", b"\0" * 80_000)
+        out[(host, "/assets/culture.mp4")] = ("video/mp4", b"\0" * 2_000_000)
+        for i in range(6):
+            out[(host, f"/assets/photo{i}.jpg")] = ("image/jpeg", b"\xff" * 150_000)
+    out[("wd5.myworkdaycdn.com", "/wd.js")] = ("application/javascript", app.encode())
+    out[("acme.wd5.myworkdayjobs.com", "/wday/cxs/job/3")] = (html, description(3).encode())
+    out[("www.googletagmanager.com", "/gtm.js")] = ("application/javascript", gtm.encode())
+    out[("widget.intercom.io", "/widget.js")] = ("application/javascript", widget.encode())
+    return out
+
+
+class FixtureServer:
+    """Serves the fixtures by Host header; /collect and /poll are held open (long polling)."""
+
+    def __init__(self, hold: float) -> None:
+        self.bytes = self.requests = 0
+        self.lock = threading.Lock()
+        outer = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                host, path = self.headers.get("Host", "").split(":", 1)[0], self.path.split("?", 1)[0]
+                with outer.lock:
+                    outer.requests += 1
+                if path in ("/collect", "/poll"):
+                    time.sleep(hold)
+                content_type, body = outer.pages.get((host, path), ("text/plain", b"not found"))
+                self.send_response(200 if (host, path) in outer.pages else 404)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("Access-Control-Allow-Origin", "*")
+                self.end_headers()
+                try:
+                    self.wfile.write(body)
+                    with outer.lock:
+                        outer.bytes += len(body)
+                except OSError:  # page closed mid-transfer
+                    pass
+
+            def log_message(self, *args) -> None:
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.port = self.server.server_address[1]
+        self.pages = fixture_pages(self.port)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def reset(self) -> None:
+        with self.lock:
+            self.bytes = self.requests = 0
+
+
+def networkidle(context, url: str, timeout: float):
+    """The old open_page: every resource, ready at network idle (or at the timeout)."""
+    page = context.new_page()
+    try:
+        page.goto(url, wait_until="networkidle", timeout=timeout * 1000)
+    except Exception:  # playwright TimeoutError: the long poll never let the network go idle
+        pass
+    return page
+
+
+def description_chars(page, url: str) -> int:
+    for selector in profile_for(url).ready_selectors:
+        node = page.query_selector(selector)
+        if node is not None:
+            return len(node.inner_text().strip())
+    return 0
+
+
+def main() -> None:
+    from playwright.sync_api import sync_playwright
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--networkidle-timeout", type=float, default=20.0, help="seconds (the old code used 60)")
+    parser.add_argument("--hold", type=float, default=120.0, help="seconds a long-poll request stays open")
+    args = parser.parse_args()
+
+    server = FixtureServer(args.hold)
+    urls = [f"http://{host}:{server.port}{path}" for (host, path), (kind, _) in server.pages.items()
+            if kind.startswith("text/html") and not path.startswith("/wday")]
+    modes: Dict[str, Callable] = {
+        "networkidle": lambda context, url: networkidle(context, url, args.networkidle_timeout),
+        "profile": lambda context, url: load_page(context, url),
+        "profile-lite": lambda context, url: load_page(context, url, lite=True),
+    }
+    print(f"runs={args.runs} networkidle_timeout={args.networkidle_timeout:g}s (local fixture server)")
+    print(f"{'page':28s} {'mode':13s} {'ready p50':>10s} {'KB sent':>9s} {'requests':>8s} {'desc chars':>10s}")
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True, args=["--host-resolver-rules=MAP * 127.0.0.1"])
+        for url in urls:
+            for mode, open_page in modes.items():
+                times, sent, requests, chars = [], [], [], 0
+                for _ in range(args.runs):
+                    context = browser.new_context()  # cold cache each run
+                    server.reset()
+                    start = time.perf_counter()
+                    page = open_page(context, url)
+                    times.append(time.perf_counter() - start)
+                    chars = description_chars(page, url)
+                    context.close()
+                    sent.append(server.bytes)
+                    requests.append(server.requests)
+                print(f"{url.split('//')[1].split(':')[0]:28s} {mode:13s} {statistics.median(times) * 1000:8.0f} ms "
+                      f"{statistics.median(sent) / 1024:9.0f} {statistics.median(requests):8.0f} {chars:10d}")
+        browser.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+SQLite storage profiles under a mixed load: one CSV import (rows/sec) while concurrent
+readers do point lookups and list pages (read latency p50/p99), per profile. The
+background checkpointer (db.maintenance) runs during the import unless --checkpoint-interval 0.
+
+    python benchmarks/bench_sqlite_profiles.py --seed 100000 --rows 50000 --readers 4
+    python benchmarks/bench_sqlite_profiles.py --profiles legacy,balanced --checkpoint-interval 0
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import csv
+import io
+import os
+import random
+import statistics
+import time
+from typing import List
+
+from common import synthetic_csv, temp_database
+
+from sqlalchemy import select
+
+from auto_apply_ai.config.settings import settings
+from auto_apply_ai.db.maintenance import SqliteMaintenance
+from auto_apply_ai.models.entities import JobPosting
+from auto_apply_ai.services.job_intake.import_pipeline import process_csv_reader
+
+
+async def run(profile: str, seed: str, text: str, args: argparse.Namespace) -> dict:
+    async with temp_database(profile) as (engine, sessions):
+        async with sessions() as session:
+            await process_csv_reader(csv.DictReader(io.StringIO(seed)), session, False, "seed", storage_profile=profile)
+            ids = (await session.execute(select(JobPosting.id))).scalars().all()
+
+        latencies: List[float] = []
+        done = asyncio.Event()
+
+        async def reader(n: int) -> None:
+            rnd = random.Random(n)
+            while not done.is_set():
+                async with sessions() as session:
+                    start = time.perf_counter()
+                    if rnd.random() < 0.8:
+                        await session.get(JobPosting, rnd.choice(ids))
+                    else:
+                        await session.execute(
+                            select(JobPosting.id, JobPosting.company, JobPosting.job_title)
+                            .where(JobPosting.id < rnd.choice(ids)).order_by(JobPosting.id.desc()).limit(50)
+                        )
+                    latencies.append(time.perf_counter() - start)
+                await asyncio.sleep(0)
+
+        readers = [asyncio.create_task(reader(n)) for n in range(args.readers)]
+        maintenance = SqliteMaintenance(engine, checkpoint_interval=args.checkpoint_interval, optimize_interval=0)
+        maintenance.start()
+        async with sessions() as session:
+            start = time.perf_counter()
+            accepted, *_ = await process_csv_reader(
+                csv.DictReader(io.StringIO(text)), session, False, "bench",
+                commit_every=args.commit_every, storage_profile=profile,
+            )
+            elapsed = time.perf_counter() - start
+        done.set()
+        await asyncio.gather(*readers)
+        await maintenance.stop()
+        wal = os.path.getsize(f"{engine.url.database}-wal")
+
+    latencies.sort()
+    return {
+        "rows_per_sec": accepted / elapsed,
+        "reads": len(latencies),
+        "p50": statistics.median(latencies) * 1000,
+        "p99": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "wal_mb": wal / 1e6,
+    }
+
+
+def main() -> None:
+    # the hard-coded pragmas from before storage profiles, as a baseline
+    settings.SQLITE_PROFILES.setdefault("legacy", {"synchronous": "NORMAL"})
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--profiles", default=",".join(settings.SQLITE_PROFILES))
+    parser.add_argument("--seed", type=int, default=100000, help="rows imported before measuring")
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--commit-every", type=int, default=5000)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--checkpoint-interval", type=float, default=1.0)
+    args = parser.parse_args()
+
+    seed = synthetic_csv(args.seed).replace("/jobs/", "/jobs/seed-")
+    text = synthetic_csv(args.rows)
+    print(f"seed={args.seed} rows={args.rows} commit_every={args.commit_every} readers={args.readers} "
+          f"checkpoint_interval={args.checkpoint_interval}")
+    for profile in args.profiles.split(","):
+        r = asyncio.run(run(profile, seed, text, args))
+        print(f"{profile:12s} import {r['rows_per_sec']:7.0f} rows/s   reads {r['reads']:6d}  "
+              f"p50 {r['p50']:6.2f} ms  p99 {r['p99']:6.2f} ms   WAL after {r['wal_mb']:6.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Shared helpers for the scripts in benchmarks/ (synthetic data, throwaway databases)."""
+from __future__ import annotations
+import random
+import sys
+import tempfile
+import threading
+import time
+from contextlib import asynccontextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import AsyncIterator, Dict, Iterator, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from auto_apply_ai.db.engine import Base, create_write_engine
+import auto_apply_ai.models.entities  # noqa: F401  (register tables on Base)
+
+CSV_HEADER = "source_url,company,job_title,location,tags,captured_at\n"
+HOSTS = ("boards.greenhouse.io", "jobs.lever.co", "www.linkedin.com", "acme.wd5.myworkdayjobs.com")
+TITLES = ("Backend Engineer", "Data Engineer", "  Senior   SRE ", "ML Engineer", "Frontend Developer")
+
+
+def synthetic_rows(
+    rows: int, dup_ratio: float = 0.2, seed: int = 7, blank_company_every: int = 13
+) -> Iterator[str]:
+    """
+    Yield CSV lines (header first); roughly dup_ratio of rows repeat an earlier posting URL
+    and every blank_company_every-th posting has no company (0 disables).
+    """
+    rnd = random.Random(seed)
+    yield CSV_HEADER
+    for i in range(rows):
+        n = rnd.randrange(max(i, 1)) if i and rnd.random() < dup_ratio else i
+        host = HOSTS[n % len(HOSTS)]
+        company = f"Company {n % 997}" if not blank_company_every or n % blank_company_every else ""
+        title = TITLES[n % len(TITLES)]
+        yield (
+            f"https://{host}/jobs/{n}?utm_source=bench&ref=x,"
+            f"{company},{title},Remote,\"python, sql\",2025-01-01T00:00:00Z\n"
+        )
+
+
+def synthetic_csv(rows: int, dup_ratio: float = 0.2) -> str:
+    return "".join(synthetic_rows(rows, dup_ratio))
+
+
+def synthetic_jd_html(n: int) -> str:
+    """A server-rendered job description page (title, company, a few sections)."""
+    title = TITLES[n % len(TITLES)].strip()
+    items = "".join(f"<li>Requirement {n}.{i}: {5 + i} years with Python, SQL and distributed systems</li>" for i in range(12))
+    return (
+        f"<!doctype html><html><head><title>{title} - Company {n % 997}</title></head><body>"
+        f"<header><nav><a href='/'>Careers</a></nav></header><main><h1>{title}</h1>"
+        f"<p class='company'>Company {n % 997}</p><p class='location'>Remote</p>"
+        f"<h2>Responsibilities</h2><ul>{items}</ul><h2>Requirements</h2><ul>{items}</ul>"
+        f"</main><footer>Equal opportunity employer</footer></body></html>"
+    )
+
+
+def serve_pages(pages: Dict[str, bytes], content_type: str = "text/html; charset=utf-8", delay: float = 0.0) -> str:
+    """
+    Serve {path: body} from a keep-alive HTTP server in a daemon thread; returns the base URL.
+    `delay` seconds are spent before each response (a remote server's think time).
+    """
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            if delay:
+                time.sleep(delay)
+            body = pages.get(self.path.split("?", 1)[0])
+            self.send_response(200 if body is not None else 404)
+            body = body if body is not None else b"not found"
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+
+@asynccontextmanager
+async def temp_database(
+    profile: Optional[str] = None,
+) -> AsyncIterator[tuple[AsyncEngine, async_sessionmaker[AsyncSession]]]:
+    """Fresh on-disk SQLite database with the app's pragmas (storage `profile`, default SQLITE_PROFILE) and schema."""
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_write_engine(f"sqlite+aiosqlite:///{tmp}/bench.db", profile=profile)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        try:
+            yield engine, async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+        finally:
+            await engine.dispose()
@@ -3,19 +3,33 @@ from __future__ import annotations
 from fastapi import FastAPI
 from contextlib import asynccontextmanager
 
-from auto_apply_ai.db.engine import engine, Base  # Base imported from models/entities via engine
-from auto_apply_ai.api.routers import job_intake
+from auto_apply_ai.db.engine import engine
+from auto_apply_ai.api.routers import job_intake, imports
+from auto_apply_ai.db.maintenance import sqlite_maintenance
+from auto_apply_ai.db.schema import ensure_schema
+from auto_apply_ai.db.writer import db_writer
+from auto_apply_ai.services.http_client import http_client
+from auto_apply_ai.services.job_intake.import_jobs import import_jobs
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Dev-only; use Alembic in real deployments
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    # One version lookup; creates the schema only on a fresh dev database (DB_CREATE_SCHEMA)
+    await ensure_schema(engine)
+    await import_jobs.fail_interrupted()  # left queued/running by a previous process
+    if sqlite_maintenance is not None:
+        sqlite_maintenance.start()
+    await http_client.start()
     yield
+    await import_jobs.shutdown()
+    await http_client.aclose()
+    await db_writer.stop()
+    if sqlite_maintenance is not None:
+        await sqlite_maintenance.stop()
 
 def create_app() -> FastAPI:
     app = FastAPI(title="Auto Apply AI", lifespan=lifespan)
     app.include_router(job_intake.router)
+    app.include_router(imports.router)
     return app
 
 app = create_app()
\ No newline at end of file
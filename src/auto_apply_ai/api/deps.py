@@ -1,9 +1,23 @@
 # src/auto_apply_ai/api/deps.py
 from __future__ import annotations
 from typing import AsyncGenerator
+import httpx
 from sqlalchemy.ext.asyncio import AsyncSession
-from auto_apply_ai.db.engine import AsyncSessionLocal
+from auto_apply_ai.db.engine import AsyncSessionLocal, ReadSessionLocal
+from auto_apply_ai.db.writer import Writer, db_writer
+from auto_apply_ai.services.http_client import http_client
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:  # type: ignore
-        yield session
\ No newline at end of file
+        yield session
+
+async def get_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """Read-only endpoints (a separate read-only pool in DB_WRITE_MODE=queue)."""
+    async with ReadSessionLocal() as session:  # type: ignore
+        yield session
+
+def get_writer() -> Writer:
+    return db_writer
+
+def get_http_client() -> httpx.AsyncClient:
+    return http_client.client
@@ -0,0 +1,56 @@
+# src/auto_apply_ai/api/responses.py
+from __future__ import annotations
+import json
+from typing import Any, Awaitable, Callable, Optional
+
+from fastapi.responses import Response
+
+from auto_apply_ai.db.cache import PostingReadCache
+
+try:  # optional: pip install "auto-apply-ai[fast]"
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+def dumps(content: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+class FastJSONResponse(Response):
+    """
+    JSON response for payloads that are already plain dicts/lists of JSON types.
+    Skips FastAPI's response_model validation and jsonable_encoder pass; uses orjson when installed.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    tags = [t.strip() for t in if_none_match.split(",")]
+    return "*" in tags or etag in tags or f"W/{etag}" in tags
+
+async def cached_json(
+    cache: Optional[PostingReadCache],
+    etag: Optional[str],
+    if_none_match: Optional[str],
+    load: Callable[[], Awaitable[Any]],
+) -> Response:
+    """
+    Serve a JSON body through the read cache:
+    304 if the client already has `etag`, else the cached body, else `load()` (then cached).
+    `etag` must be computed before load() runs: a write committed in between then causes a miss, never a stale hit.
+    """
+    if cache is None or etag is None:
+        return FastJSONResponse(await load())
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    body = await cache.aget_body(etag)
+    if body is None:
+        body = dumps(await load())
+        await cache.aset_body(etag, body)
+    return Response(body, media_type="application/json", headers=headers)
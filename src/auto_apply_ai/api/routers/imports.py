@@ -0,0 +1,98 @@
+# src/auto_apply_ai/api/routers/imports.py
+from __future__ import annotations
+import os
+import tempfile
+import uuid
+from typing import AsyncIterator, Optional
+
+import anyio
+from fastapi import APIRouter, File, HTTPException, Query, Request, UploadFile, status
+from fastapi.responses import StreamingResponse
+
+from auto_apply_ai.config.settings import settings
+from auto_apply_ai.schemas.job_intake_scm import ImportJobOut
+from auto_apply_ai.services.job_intake.import_jobs import (
+    ImportJobConflict,
+    google_sheet_rows,
+    import_jobs,
+    spooled_csv_rows,
+)
+from auto_apply_ai.services.job_intake.ingest.csv_stream import aiter_file_chunks
+from auto_apply_ai.utils.sheets import gsheet_to_csv_url
+
+router = APIRouter(prefix="/job_intake/imports", tags=["job_intake"])
+
+async def _spool_upload(file: UploadFile) -> str:
+    # The UploadFile is closed once the response is sent, so the worker reads its own copy
+    fd, path = tempfile.mkstemp(prefix="import-", suffix=".csv", dir=settings.IMPORT_SPOOL_DIR)
+    try:
+        with os.fdopen(fd, "wb") as out:
+            async for chunk in aiter_file_chunks(file):
+                await anyio.to_thread.run_sync(out.write, chunk)
+    except BaseException:
+        os.unlink(path)
+        raise
+    return path
+
+@router.post("/csv", response_model=ImportJobOut, status_code=status.HTTP_202_ACCEPTED)
+async def submit_csv_import(
+    file: UploadFile = File(...),
+    dry_run: bool = Query(False),
+    import_batch_id: Optional[str] = Query(default=None),
+    commit_every: Optional[int] = Query(default=None, ge=0, description="Commit and checkpoint every N rows (default IMPORT_JOB_COMMIT_EVERY); 0 = single transaction"),
+):
+    batch_id = import_batch_id or str(uuid.uuid4())
+    path = await _spool_upload(file)
+    try:
+        state = await import_jobs.submit(batch_id, "csv", lambda: spooled_csv_rows(path), dry_run, commit_every)
+    except ImportJobConflict:
+        os.unlink(path)
+        raise HTTPException(status_code=409, detail=f"Import {batch_id} is already running")
+    return ImportJobOut.model_validate(state)
+
+@router.post("/google_sheet", response_model=ImportJobOut, status_code=status.HTTP_202_ACCEPTED)
+async def submit_google_sheet_import(
+    sheet_url: str = Query(..., description="Google Sheet link (viewer link ok)"),
+    dry_run: bool = Query(False),
+    import_batch_id: Optional[str] = Query(default=None),
+    commit_every: Optional[int] = Query(default=None, ge=0, description="Commit and checkpoint every N rows (default IMPORT_JOB_COMMIT_EVERY); 0 = single transaction"),
+):
+    batch_id = import_batch_id or str(uuid.uuid4())
+    try:
+        csv_url = gsheet_to_csv_url(sheet_url)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    try:
+        state = await import_jobs.submit(batch_id, "google_sheet", lambda: google_sheet_rows(csv_url), dry_run, commit_every)
+    except ImportJobConflict:
+        raise HTTPException(status_code=409, detail=f"Import {batch_id} is already running")
+    return ImportJobOut.model_validate(state)
+
+@router.get("/{batch_id}", response_model=ImportJobOut)
+async def get_import(batch_id: str):
+    state = await import_jobs.get(batch_id)
+    if state is None:
+        raise HTTPException(status_code=404, detail="Import not found")
+    return ImportJobOut.model_validate(state)
+
+@router.get("/{batch_id}/events")
+async def stream_import_events(batch_id: str, request: Request):
+    """Server-Sent Events: `progress` on every update, `done` once, `: keep-alive` comments while idle."""
+    if await import_jobs.get(batch_id) is None:
+        raise HTTPException(status_code=404, detail="Import not found")
+
+    async def events() -> AsyncIterator[str]:
+        async for state in import_jobs.follow(batch_id):
+            if await request.is_disconnected():
+                return
+            if state is None:
+                yield ": keep-alive\n\n"
+                continue
+            name = "done" if state.done else "progress"
+            yield f"event: {name}\ndata: {ImportJobOut.model_validate(state).model_dump_json()}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,61 +1,124 @@
 from __future__ import annotations
-from fastapi import APIRouter, UploadFile, File, Query, HTTPException, Depends,status
-from typing import Optional
-import uuid, csv, io, httpx
+from fastapi import APIRouter, UploadFile, File, Query, Header, HTTPException, Depends,status
+from functools import partial
+from typing import Dict, List, Literal, Optional, Sequence, Tuple, Union
+import uuid, httpx
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, desc, delete
-
-
-from auto_apply_ai.schemas.job_intake_scm import ImportResult,JobListResponse, JobPostingOut
-from auto_apply_ai.api.deps import get_session
-from auto_apply_ai.services.job_intake.import_pipeline import process_csv_reader
+from sqlalchemy import select, and_, or_, desc, literal
+
+
+from auto_apply_ai.schemas.job_intake_scm import (
+    BulkDeleteRequest, BulkDeleteResult, BulkStatusRequest, BulkStatusResult,
+    ImportResult, CompactImportResult, JobListResponse, JobPostingOut,
+)
+from auto_apply_ai.api.deps import get_http_client, get_read_session, get_session, get_writer
+from auto_apply_ai.api.responses import cached_json
+from auto_apply_ai.db.cache import read_cache
+from auto_apply_ai.db.writer import Writer
+from auto_apply_ai.db.repository import bulk_delete_postings, bulk_update_posting_status, posting_search
+from auto_apply_ai.services.job_intake.import_pipeline import CsvRows, process_csv_reader
+from auto_apply_ai.services.job_intake.ingest.csv_stream import aiter_csv_dicts, aiter_file_chunks
+from auto_apply_ai.services.job_intake.import_results import CompactIssueCollector
 from auto_apply_ai.utils.sheets import gsheet_to_csv_url
-from auto_apply_ai.models.entities import JobPosting, JobCapture, AtsResolution
+from auto_apply_ai.utils.cursor import decode_cursor, encode_cursor
+from auto_apply_ai.models.entities import JobPosting
 
 router = APIRouter(prefix="/job_intake", tags=["job_intake"])
 
-@router.post("/csv", response_model=ImportResult)
+ResultFormat = Literal["full", "compact"]
+
+async def _run_import(
+    reader: CsvRows,
+    session: AsyncSession,
+    dry_run: bool,
+    batch_id: str,
+    commit_every: Optional[int],
+    result_format: ResultFormat,
+) -> Union[ImportResult, CompactImportResult]:
+    if result_format == "compact":
+        issues = CompactIssueCollector()
+        acc, qua, _, _ = await process_csv_reader(reader, session, dry_run, batch_id, commit_every=commit_every, issues=issues)
+        return CompactImportResult(
+            accepted=acc, quarantined=qua,
+            errors=issues.error_summaries(), warnings=issues.warning_summaries(),
+            batch_id=batch_id,
+        )
+    acc, qua, warns, errs = await process_csv_reader(reader, session, dry_run, batch_id, commit_every=commit_every)
+    return ImportResult(accepted=acc, quarantined=qua, warnings_by_row=warns, errors_by_row=errs, batch_id=batch_id)
+
+@router.post("/csv", response_model=Union[ImportResult, CompactImportResult])
 async def import_csv(
     file: UploadFile = File(...),
     dry_run: bool = Query(False),
     import_batch_id: Optional[str] = Query(default=None),
+    commit_every: Optional[int] = Query(default=None, ge=0, description="Commit and checkpoint every N rows; 0 = single transaction"),
+    result_format: ResultFormat = Query("full", description="compact groups row issues by code"),
     session: AsyncSession = Depends(get_session),
 ):
-    text = (await file.read()).decode("utf-8", errors="replace")
-    reader = csv.DictReader(io.StringIO(text))
+    reader = aiter_csv_dicts(aiter_file_chunks(file))
     batch_id = import_batch_id or str(uuid.uuid4())
-    acc, qua, warns, errs = await process_csv_reader(reader, session, dry_run, batch_id)
-    return ImportResult(accepted=acc, quarantined=qua, warnings_by_row=warns, errors_by_row=errs, batch_id=batch_id)
+    return await _run_import(reader, session, dry_run, batch_id, commit_every, result_format)
 
-@router.post("/google_sheet", response_model=ImportResult)
+@router.post("/google_sheet", response_model=Union[ImportResult, CompactImportResult])
 async def import_google_sheet(
     sheet_url: str = Query(..., description="Google Sheet link (viewer link ok)"),
     dry_run: bool = Query(False),
     import_batch_id: Optional[str] = Query(default=None),
+    commit_every: Optional[int] = Query(default=None, ge=0, description="Commit and checkpoint every N rows; 0 = single transaction"),
+    result_format: ResultFormat = Query("full", description="compact groups row issues by code"),
     session: AsyncSession = Depends(get_session),
+    client: httpx.AsyncClient = Depends(get_http_client),
 ):
     batch_id = import_batch_id or str(uuid.uuid4())
     csv_url = gsheet_to_csv_url(sheet_url)
-    async with httpx.AsyncClient(timeout=20, follow_redirects=True) as client:
-        resp = await client.get(csv_url)
+    async with client.stream("GET", csv_url) as resp:
         if resp.status_code != 200:
             raise HTTPException(status_code=400, detail=f"Failed to fetch sheet CSV: {resp.status_code}")
-        text = resp.text
-    reader = csv.DictReader(io.StringIO(text))
-    acc, qua, warns, errs = await process_csv_reader(reader, session, dry_run, batch_id)
-    return ImportResult(accepted=acc, quarantined=qua, warnings_by_row=warns, errors_by_row=errs, batch_id=batch_id)
-
+        reader = aiter_csv_dicts(resp.aiter_bytes())
+        return await _run_import(reader, session, dry_run, batch_id, commit_every, result_format)
+
+
+# JobPostingOut fields backed by job_postings columns ("ats" is not stored yet and is always null)
+POSTING_OUT_COLUMNS = {name: getattr(JobPosting, name) for name in JobPostingOut.model_fields if name != "ats"}
+FIELDS_QUERY = Query(default=None, description="Comma-separated JobPostingOut fields to return (id is always included)")
+
+def _projection(fields: Optional[str]) -> Tuple[List[str], list]:
+    """
+    Output field names (JobPostingOut order, id first) and the columns to select for them.
+    Rows are selected as plain tuples and turned into dicts directly; no ORM objects or
+    pydantic models are built on the read path.
+    """
+    if fields:
+        wanted = {f.strip() for f in fields.split(",") if f.strip()}
+        unknown = wanted - set(JobPostingOut.model_fields)
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+        wanted.add("id")
+    else:
+        wanted = set(JobPostingOut.model_fields)
+    names = [n for n in JobPostingOut.model_fields if n in wanted]
+    columns = [POSTING_OUT_COLUMNS[n] for n in names if n != "ats"]
+    return names, columns
+
+def _posting_item(names: List[str], row: Sequence[object]) -> Dict[str, object]:
+    # row = selected columns in `names` order (+ trailing rank when searching); "ats" is the only unstored name
+    values = iter(row)
+    return {n: None if n == "ats" else next(values) for n in names}
 
 @router.get("", response_model=JobListResponse)
 async def list_jobs(
     status: Optional[str] = Query(default=None),
     company: Optional[str] = Query(default=None),
     host: Optional[str] = Query(default=None),
+    q: Optional[str] = Query(default=None, description="Full-text search over company, title and location (word prefixes, best match first)"),
     limit: int = Query(default=50, ge=1, le=200),
     cursor: Optional[str] = Query(default=None),
-    session: AsyncSession = Depends(get_session)
+    fields: Optional[str] = FIELDS_QUERY,
+    if_none_match: Optional[str] = Header(default=None),
+    session: AsyncSession = Depends(get_read_session)
 ):
+    names, columns = _projection(fields)
     where = []
     if status:
         where.append(JobPosting.status == status)
@@ -64,76 +127,88 @@ async def list_jobs(
     if host:
         where.append(JobPosting.source_host == host)
 
-    stmt = select(JobPosting)
+    search = posting_search(session.bind.dialect.name, q) if q else None
+    if cursor:
+        try:
+            if search is not None:
+                last_rank, last_id = decode_cursor(cursor, 2)
+                # bool is an int; a string rank would compare as text on SQLite
+                if isinstance(last_rank, bool) or not isinstance(last_rank, (int, float)):
+                    raise ValueError("malformed cursor")
+            else:
+                (last_id,) = decode_cursor(cursor, 1)
+            if not isinstance(last_id, str):  # `id < 5` is always false on SQLite: an empty page, not an error
+                raise ValueError("malformed cursor")
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        if search is not None:
+            where.append(or_(search.c.rank > last_rank, and_(search.c.rank == last_rank, JobPosting.id < last_id)))
+        else:
+            # ids are time-ordered (uuid7), so this is a range scan on the PK or (status|source_host, id)
+            where.append(JobPosting.id < last_id)
+
+    if search is not None:
+        stmt = select(*columns, search.c.rank).join(search, search.c.id == JobPosting.id)
+        order = (search.c.rank, desc(JobPosting.id))
+    else:
+        stmt = select(*columns, literal(None))
+        order = (desc(JobPosting.id),)
     if where:
         stmt = stmt.where(and_(*where))
-    stmt = stmt.order_by(desc(JobPosting.id)).limit(limit + 1)
-    if cursor:
-        stmt = stmt.where(JobPosting.id < cursor)
-
-    rows = (await session.execute(stmt)).scalars().all()
-    next_cursor = None
-    if len(rows) > limit:
-        next_cursor = str(rows[limit].id)
-        rows = rows[:limit]
-
-    items = [
-        JobPostingOut(
-            id=getattr(r, "id"),
-            canonical_url=getattr(r, "canonical_url"),
-            company=getattr(r, "company"),
-            job_title=getattr(r, "job_title"),
-            location=getattr(r, "location"),
-            source_host=getattr(r, "source_host"),
-            status=getattr(r, "status"),
-            next_action=getattr(r, "next_action"),
-            ats_req_id=getattr(r, "ats_req_id"),
-            ats=None,
-        )
-        for r in rows
-    ]
-    return JobListResponse(items=items, next_cursor=next_cursor)
+    stmt = stmt.order_by(*order).limit(limit + 1)
+
+    async def load() -> Dict[str, object]:
+        rows = (await session.execute(stmt)).all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]  # (id, ..., rank)
+            next_cursor = encode_cursor(last[-1], last[0]) if search is not None else encode_cursor(last[0])
+        return {"items": [_posting_item(names, row) for row in rows], "next_cursor": next_cursor}
+
+    etag = None
+    if read_cache is not None:
+        etag = await read_cache.alist_etag(repr((status, company, host, q, limit, cursor, names)))
+    return await cached_json(read_cache, etag, if_none_match, load)
 
 @router.get("/{job_id}", response_model=JobPostingOut)
-async def get_job(job_id: str, session: AsyncSession = Depends(get_session)):
-    r = (await session.execute(select(JobPosting).where(JobPosting.id == job_id))).scalar_one_or_none()
-    if not r:
-        raise HTTPException(status_code=404, detail="Job not found")
-    return JobPostingOut(
-        id=getattr(r, "id"),
-            canonical_url=getattr(r, "canonical_url"),
-            company=getattr(r, "company"),
-            job_title=getattr(r, "job_title"),
-            location=getattr(r, "location"),
-            source_host=getattr(r, "source_host"),
-            status=getattr(r, "status"),
-            next_action=getattr(r, "next_action"),
-            ats_req_id=getattr(r, "ats_req_id"),
-            ats=None,
-    )
+async def get_job(
+    job_id: str,
+    fields: Optional[str] = FIELDS_QUERY,
+    if_none_match: Optional[str] = Header(default=None),
+    session: AsyncSession = Depends(get_read_session),
+):
+    names, columns = _projection(fields)
 
+    async def load() -> Dict[str, object]:
+        row = (await session.execute(select(*columns).where(JobPosting.id == job_id))).one_or_none()
+        if row is None:
+            raise HTTPException(status_code=404, detail="Job not found")
+        return _posting_item(names, row)
 
-@router.delete("/{job_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_job(job_id: str, session: AsyncSession = Depends(get_session)):
-    # 1) load the posting
-    res = await session.execute(select(JobPosting).where(JobPosting.id == job_id))
-    posting = res.scalar_one_or_none()
-    if not posting:
-        raise HTTPException(status_code=404, detail="Job not found")
+    etag = await read_cache.aposting_etag(job_id, ",".join(names)) if read_cache is not None else None
+    return await cached_json(read_cache, etag, if_none_match, load)
 
-    # 2) delete related JobCaptures (capture_ids lives on the posting as a JSON list)
-    capture_ids = posting.capture_ids or []
-    if isinstance(capture_ids, list) and len(capture_ids) > 0:
-        await session.execute(
-            delete(JobCapture).where(JobCapture.id.in_(capture_ids))
-        )
-
-    # 3) delete related AtsResolution (defensive; DB may already cascade)
-    await session.execute(
-        delete(AtsResolution).where(AtsResolution.posting_id == job_id)
-    )
 
-    # 4) delete the posting
-    await session.delete(posting)
-    await session.commit()
-    return None
\ No newline at end of file
+@router.delete("/{job_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_job(job_id: str, writer: Writer = Depends(get_writer)):
+    # posting + its captures, posting_captures links and AtsResolution (explicit; the DB may not cascade)
+    counts = await writer.submit(partial(bulk_delete_postings, ids=[job_id]))
+    if not counts["postings"]:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return None
+
+@router.post("/bulk/delete", response_model=BulkDeleteResult)
+async def bulk_delete_jobs(body: BulkDeleteRequest, writer: Writer = Depends(get_writer)):
+    """Delete every posting matching `where` (with captures, links, ATS resolutions) in one transaction."""
+    w = body.where
+    counts = await writer.submit(partial(bulk_delete_postings, ids=w.ids, status=w.status, host=w.host))
+    return BulkDeleteResult(**counts)
+
+@router.post("/bulk/status", response_model=BulkStatusResult)
+async def bulk_update_job_status(body: BulkStatusRequest, writer: Writer = Depends(get_writer)):
+    """Set status and/or next_action on every posting matching `where`, in one transaction."""
+    values = {k: v for k, v in (("status", body.status), ("next_action", body.next_action)) if v is not None}
+    w = body.where
+    updated = await writer.submit(partial(bulk_update_posting_status, values=values, ids=w.ids, status=w.status, host=w.host))
+    return BulkStatusResult(updated=updated)
@@ -1,8 +1,125 @@
-# src/auto_apply_ai/core/settings.py
+# src/auto_apply_ai/config/settings.py
+from typing import Dict, Union
 from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
+    # SQLite (sqlite+aiosqlite:///...) or PostgreSQL (postgresql+asyncpg://...; pip install .[postgres])
     DATABASE_URL: str = "sqlite+aiosqlite:///./auto_apply_ai.db"
+    # SQLite storage profiles (db.sqlite_profiles): per-connection pragmas, SQLite defaults for the rest
+    SQLITE_PROFILES: Dict[str, Dict[str, Union[int, str]]] = {
+        "balanced": {"synchronous": "NORMAL", "cache_size": -32768, "mmap_size": 268435456, "temp_store": "MEMORY"},
+        # bigger cache, checkpoints every ~40MB of WAL instead of every ~4MB
+        "bulk_import": {"synchronous": "NORMAL", "cache_size": -262144, "mmap_size": 268435456,
+                        "temp_store": "MEMORY", "wal_autocheckpoint": 10000},
+        "read_heavy": {"synchronous": "NORMAL", "cache_size": -131072, "mmap_size": 1073741824, "temp_store": "MEMORY"},
+        # fsync the WAL on every commit
+        "durable": {"synchronous": "FULL"},
+    }
+    SQLITE_PROFILE: str = "balanced"
+    # Read-only pool in DB_WRITE_MODE=queue; None = SQLITE_PROFILE
+    SQLITE_READ_PROFILE: str | None = "read_heavy"
+    # Profile imports switch to for their duration; None = keep SQLITE_PROFILE
+    SQLITE_IMPORT_PROFILE: str | None = "bulk_import"
+    # Background maintenance (db.maintenance): passive WAL checkpoint every N seconds (0 = off),
+    # TRUNCATE the WAL once it holds more than N frames, PRAGMA optimize every N seconds (0 = off)
+    SQLITE_CHECKPOINT_INTERVAL_SECONDS: float = 30.0
+    SQLITE_WAL_TRUNCATE_FRAMES: int = 4096
+    SQLITE_OPTIMIZE_INTERVAL_SECONDS: float = 3600.0
+    # Connection pool for PostgreSQL; per API replica, so size * replicas must fit max_connections
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 5
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    # Startup (db.schema): create + stamp the schema on an empty database (dev), stamp a legacy
+    # create_all database at the init revision; off = fail unless already at the expected revision
+    DB_CREATE_SCHEMA: bool = True
     DEBUG: bool = True
+    # Rows buffered per bulk write during CSV imports; <= 1 falls back to row-by-row ORM writes
+    IMPORT_BATCH_SIZE: int = 2000
+    # PostgreSQL: load job_captures chunks with COPY instead of executemany INSERT
+    IMPORT_PG_COPY: bool = True
+    # Normalize/validate imports column-wise in blocks of IMPORT_BATCH_SIZE rows
+    IMPORT_COLUMNAR: bool = False
+    # Distinct source URLs memoized by ingest.normalizers.parse_source_url
+    URL_PARSE_CACHE_SIZE: int = 65536
+    # Commit + checkpoint every N rows so imports can resume; 0 = one transaction per import
+    IMPORT_COMMIT_EVERY: int = 0
+    # Compact import results (result_format=compact)
+    IMPORT_RESULT_MAX_RANGES: int = 1000
+    IMPORT_RESULT_SAMPLE_ROWS: int = 20
+    # Background imports (/job_intake/imports)
+    IMPORT_PROGRESS_EVERY: int = 1000
+    IMPORT_MAX_CONCURRENT_JOBS: int = 2  # always 1 on SQLite
+    # Background imports commit + checkpoint every N rows unless the request says otherwise, so
+    # the SQLite write lock is released regularly; 0 = one transaction per import
+    IMPORT_JOB_COMMIT_EVERY: int = 5000
+    IMPORT_SPOOL_DIR: str | None = None
+    # "direct": one pool for reads and writes; "queue" (SQLite only): single writer connection with
+    # group commit for API writes (db.writer) + a pool of read-only WAL connections
+    DB_WRITE_MODE: str = "direct"
+    DB_READ_POOL_SIZE: int = 4
+    # Units of work coalesced into one transaction, and how long to wait for more of them
+    DB_WRITER_MAX_BATCH: int = 64
+    DB_WRITER_MAX_DELAY_MS: float = 0.0
+    # How long a write waits for the single writer connection (e.g. behind an import)
+    DB_WRITER_TIMEOUT_SECONDS: float = 300.0
+    # Postings per set-based statement in /job_intake/bulk/* (and delete_job)
+    BULK_CHUNK_SIZE: int = 500
+    # Posting read cache + ETags for GET /job_intake[/{id}]: "none", "memory" or "redis".
+    # "memory" sees only this process's writes: use it with a single API worker and no other
+    # process (CLI imports, maintenance) writing postings; anything else needs "redis"
+    CACHE_BACKEND: str = "none"
+    CACHE_MAX_ENTRIES: int = 10000
+    CACHE_TTL_SECONDS: float = 300.0
+    CACHE_REDIS_URL: str = "redis://localhost:6379/0"
+    # Shared outbound HTTP client (services.http_client) for sheet downloads and page fetches;
+    # HTTP/2 needs h2 (pip install .[http2]), per-host cap 0 = pool limits only
+    HTTP_HTTP2: bool = True
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+    HTTP_MAX_CONNECTIONS_PER_HOST: int = 8
+    HTTP_CONNECT_TIMEOUT_SECONDS: float = 5.0
+    HTTP_TIMEOUT_SECONDS: float = 20.0
+    HTTP_USER_AGENT: str = "auto-apply-ai/0.1"
+    # Warm headless Chromium for the JD scraper (services.jd_parser.browser_pool), shared by all
+    # threads (one browser thread per browser);
+    # 0 = launch a browser per fetch. A browser is relaunched after BROWSER_MAX_PAGES pages or
+    # above BROWSER_MAX_RSS_MB for its process tree (Linux only; 0 = off). A context is reused
+    # (pages closed, cookies cleared) for up to BROWSER_CONTEXT_MAX_USES fetches.
+    BROWSER_POOL_SIZE: int = 2
+    BROWSER_MAX_PAGES: int = 200
+    BROWSER_MAX_RSS_MB: float = 1536.0
+    BROWSER_CONTEXT_MAX_USES: int = 20
+    # Async crawl engine (services.jd_parser.crawler): fetches in flight overall and per source
+    # host, minimum gap between two fetch starts on one host, per-fetch timeout, targets buffered
+    # ahead of the fetchers, and pages parsed by the LLM at once
+    CRAWL_CONCURRENCY: int = 16
+    CRAWL_PER_HOST: int = 2
+    CRAWL_HOST_DELAY_SECONDS: float = 1.0
+    CRAWL_FETCH_TIMEOUT_SECONDS: float = 60.0
+    CRAWL_MAX_QUEUED: int = 1000
+    CRAWL_PARSE_CONCURRENCY: int = 4
+    # Tiered JD fetch (services.jd_parser.tiered): plain GET + JSON-LD/description text first, the
+    # browser only when that yields fewer than FETCH_STATIC_MIN_CHARS characters of description
+    FETCH_STATIC_FIRST: bool = True
+    FETCH_STATIC_MIN_CHARS: int = 400
+    # Per-host fetch strategy (services.jd_parser.strategy, table host_fetch_stats): a tier is
+    # skipped on a host once its last FETCH_STRATEGY_WINDOW attempts there (at least
+    # MIN_SAMPLES) succeed less than MIN_SUCCESS_RATE; every REPROBE_EVERY-th fetch on a host
+    # starts at the cheapest tier again; changed rows are saved every FLUSH_EVERY attempts
+    FETCH_STRATEGY_ENABLED: bool = True
+    FETCH_STRATEGY_WINDOW: int = 20
+    FETCH_STRATEGY_MIN_SAMPLES: int = 3
+    FETCH_STRATEGY_MIN_SUCCESS_RATE: float = 0.5
+    FETCH_STRATEGY_REPROBE_EVERY: int = 50
+    FETCH_STRATEGY_FLUSH_EVERY: int = 50
+    # Browser page loads (services.jd_parser.page_profiles): DOMContentLoaded within
+    # PAGE_LOAD_TIMEOUT_SECONDS, then up to PAGE_READY_TIMEOUT_SECONDS for the ATS profile's
+    # description selector / text density; known trackers are aborted when PAGE_BLOCK_TRACKERS
+    PAGE_LOAD_TIMEOUT_SECONDS: float = 30.0
+    PAGE_READY_TIMEOUT_SECONDS: float = 10.0
+    PAGE_BLOCK_TRACKERS: bool = True
 
 settings = Settings()
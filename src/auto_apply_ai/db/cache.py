@@ -0,0 +1,260 @@
+# src/auto_apply_ai/db/cache.py
+"""
+Read-through cache for posting reads (GET /job_intake/{id} and list pages) with ETags.
+
+- every posting has a version: the value of a global change clock at its last committed
+  write; list pages are versioned by the clock itself (any posting change may move them)
+- ETags are epoch + version + a digest of the resource/params; cached bodies are stored
+  under their ETag, so a version bump is the invalidation and stale bodies just age out
+- a version missing from the cache (evicted/expired) is re-seeded from the current clock:
+  that can only cause a spurious miss, never a stale 304
+- writes are recorded on the session (mark_postings_changed, plus an after_flush hook for
+  ORM writes) and versions are bumped only after the outermost transaction commits
+Backends: MemoryCacheBackend (per process, LRU + TTL) or RedisCacheBackend (shared by workers).
+The change clock lives in the backend, so the memory backend only sees writes made by its own
+process; it is refused when WEB_CONCURRENCY asks for several workers.
+Request handlers use the async methods (aposting_etag, alist_etag, aget_body, aset_body), which
+run a blocking backend's network round trips in a worker thread instead of on the event loop.
+"""
+from __future__ import annotations
+import asyncio
+import hashlib
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional, Protocol, Tuple, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from auto_apply_ai.config.settings import settings
+from auto_apply_ai.models.entities import JobPosting
+
+CHANGED_POSTINGS = "changed_postings"  # session.info key
+VERSION_TTL_SECONDS = 24 * 3600
+T = TypeVar("T")
+
+class CacheBackend(Protocol):
+    blocking: bool  # calls do network I/O; keep them off the event loop
+    def get(self, key: str) -> Optional[bytes]: ...
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None: ...
+    def set_many(self, items: Dict[str, bytes], ttl: Optional[float] = None) -> None: ...
+    def add(self, key: str, value: bytes, ttl: Optional[float] = None) -> bool:
+        """Set only if absent; True if this call stored the value."""
+        ...
+    def incr(self, key: str) -> int:
+        """Increment a counter. Counters are never evicted."""
+        ...
+    def counter(self, key: str) -> int: ...
+    def clear(self) -> None: ...
+
+class MemoryCacheBackend:
+    """Bounded LRU with per-entry TTL; thread-safe."""
+
+    blocking = False
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max(max_entries, 1)
+        self._entries: OrderedDict[str, Tuple[bytes, float]] = OrderedDict()
+        self._counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _put(self, key: str, value: bytes, ttl: Optional[float]) -> None:
+        self._entries[key] = (value, time.monotonic() + ttl if ttl else float("inf"))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _live(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            return self._live(key)
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        with self._lock:
+            self._put(key, value, ttl)
+
+    def set_many(self, items: Dict[str, bytes], ttl: Optional[float] = None) -> None:
+        with self._lock:
+            for key, value in items.items():
+                self._put(key, value, ttl)
+
+    def add(self, key: str, value: bytes, ttl: Optional[float] = None) -> bool:
+        with self._lock:
+            if self._live(key) is not None:
+                return False
+            self._put(key, value, ttl)
+            return True
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+    def counter(self, key: str) -> int:
+        with self._lock:
+            return self._counters.get(key, 0)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+class RedisCacheBackend:
+    """
+    Shared backend (pip install redis). Counters are plain keys without TTL; configure
+    Redis with a volatile-* maxmemory policy so they are never evicted.
+    """
+
+    blocking = True
+
+    def __init__(self, url: str, prefix: str = "auto_apply_ai:") -> None:
+        import redis  # optional dependency
+
+        self._redis = redis.Redis.from_url(url)
+        self._prefix = prefix
+
+    def _ms(self, ttl: Optional[float]) -> Optional[int]:
+        return int(ttl * 1000) if ttl else None
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._redis.get(self._prefix + key)
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        self._redis.set(self._prefix + key, value, px=self._ms(ttl))
+
+    def set_many(self, items: Dict[str, bytes], ttl: Optional[float] = None) -> None:
+        pipe = self._redis.pipeline(transaction=False)
+        for key, value in items.items():
+            pipe.set(self._prefix + key, value, px=self._ms(ttl))
+        pipe.execute()
+
+    def add(self, key: str, value: bytes, ttl: Optional[float] = None) -> bool:
+        return bool(self._redis.set(self._prefix + key, value, nx=True, px=self._ms(ttl)))
+
+    def incr(self, key: str) -> int:
+        return int(self._redis.incr(self._prefix + "counter:" + key))
+
+    def counter(self, key: str) -> int:
+        return int(self._redis.get(self._prefix + "counter:" + key) or 0)
+
+    def clear(self) -> None:
+        for key in self._redis.scan_iter(match=self._prefix + "*"):
+            if not key.startswith((self._prefix + "counter:").encode()):
+                self._redis.delete(key)
+
+def _digest(*parts: Any) -> str:
+    return hashlib.blake2b("|".join(map(str, parts)).encode("utf-8"), digest_size=8).hexdigest()
+
+class PostingReadCache:
+    def __init__(self, backend: CacheBackend, ttl: float) -> None:
+        self.backend = backend
+        self.ttl = ttl
+        self._epoch: Optional[str] = None
+
+    @property
+    def epoch(self) -> str:
+        """Random per cache instance (shared through Redis), so ETags never repeat across restarts."""
+        if self._epoch is None:
+            self.backend.add("epoch", secrets.token_hex(4).encode())
+            self._epoch = (self.backend.get("epoch") or b"0").decode()
+        return self._epoch
+
+    def posting_version(self, posting_id: str) -> int:
+        key = f"pv:{posting_id}"
+        raw = self.backend.get(key)
+        if raw is None:
+            self.backend.add(key, str(self.backend.counter("clock")).encode(), VERSION_TTL_SECONDS)
+            raw = self.backend.get(key) or b"0"
+        return int(raw)
+
+    def bump(self, posting_ids: Iterable[str]) -> None:
+        ids = set(posting_ids)
+        if not ids:
+            return
+        clock = str(self.backend.incr("clock")).encode()
+        self.backend.set_many({f"pv:{i}": clock for i in ids}, VERSION_TTL_SECONDS)
+
+    def posting_etag(self, posting_id: str, variant: str = "") -> str:
+        return f'"{self.epoch}.p{self.posting_version(posting_id)}.{_digest(posting_id, variant)}"'
+
+    def list_etag(self, params: str) -> str:
+        return f'"{self.epoch}.l{self.backend.counter("clock")}.{_digest(params)}"'
+
+    def get_body(self, etag: str) -> Optional[bytes]:
+        return self.backend.get(f"body:{etag}")
+
+    def set_body(self, etag: str, body: bytes) -> None:
+        self.backend.set(f"body:{etag}", body, self.ttl)
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    async def _off_loop(self, fn: Callable[..., T], *args: Any) -> T:
+        if self.backend.blocking:
+            return await asyncio.to_thread(fn, *args)
+        return fn(*args)
+
+    async def aposting_etag(self, posting_id: str, variant: str = "") -> str:
+        return await self._off_loop(self.posting_etag, posting_id, variant)
+
+    async def alist_etag(self, params: str) -> str:
+        return await self._off_loop(self.list_etag, params)
+
+    async def aget_body(self, etag: str) -> Optional[bytes]:
+        return await self._off_loop(self.get_body, etag)
+
+    async def aset_body(self, etag: str, body: bytes) -> None:
+        await self._off_loop(self.set_body, etag, body)
+
+def build_read_cache() -> Optional[PostingReadCache]:
+    if settings.CACHE_BACKEND == "none":
+        return None
+    if settings.CACHE_BACKEND == "redis":
+        backend: CacheBackend = RedisCacheBackend(settings.CACHE_REDIS_URL)
+    else:
+        if int(os.environ.get("WEB_CONCURRENCY") or 1) > 1:
+            raise RuntimeError(
+                'CACHE_BACKEND="memory" serves stale ETags with several workers; use "redis" or "none"'
+            )
+        backend = MemoryCacheBackend(settings.CACHE_MAX_ENTRIES)
+    return PostingReadCache(backend, settings.CACHE_TTL_SECONDS)
+
+read_cache = build_read_cache()
+
+def mark_postings_changed(session: Any, posting_ids: Iterable[str]) -> None:
+    """Record postings written in this transaction (Session or AsyncSession); bumped on commit."""
+    session.info.setdefault(CHANGED_POSTINGS, set()).update(posting_ids)
+
+@event.listens_for(Session, "after_flush")
+def _track_flushed_postings(session: Session, _ctx: Any) -> None:
+    ids = [o.id for o in (*session.new, *session.dirty, *session.deleted) if isinstance(o, JobPosting)]
+    if ids:
+        mark_postings_changed(session, ids)
+
+@event.listens_for(Session, "after_commit")
+def _bump_committed_postings(session: Session) -> None:
+    if session.in_nested_transaction():  # SAVEPOINT released; the outer transaction may still fail
+        return
+    ids = session.info.pop(CHANGED_POSTINGS, None)
+    if ids and read_cache is not None:
+        read_cache.bump(ids)
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_postings(session: Session) -> None:
+    if session.in_nested_transaction():  # keep the rest of the transaction's writes (over-bumping is harmless)
+        return
+    session.info.pop(CHANGED_POSTINGS, None)
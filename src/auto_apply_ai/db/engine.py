@@ -1,18 +1,98 @@
 # src/auto_apply_ai/db/engine.py
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+"""
+Engines and session factories.
+
+- SQLite: WAL + foreign keys on every connection, other pragmas from a storage profile
+  (db.sqlite_profiles; SQLITE_PROFILE, SQLITE_READ_PROFILE for the read pool)
+- PostgreSQL (asyncpg): a sized, pre-pinged, recycled pool (DB_POOL_*); dialect-specific
+  SQL (upserts, COPY, search) lives in db.repository / db.search
+- DB_WRITE_MODE=direct: one engine/pool for reads and writes (default)
+- DB_WRITE_MODE=queue (SQLite): a single write connection (imports wait for it between
+  their commits; short API writes go through db.writer's group-commit queue) and a separate
+  pool of read-only WAL connections for reads
+"""
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 from sqlalchemy import event
+from sqlalchemy.engine import make_url
 from auto_apply_ai.config.settings import settings
+from auto_apply_ai.db.sqlite_profiles import install_sqlite_profiles
 
-engine = create_async_engine(settings.DATABASE_URL, future=True, echo=False)
+def is_sqlite(url: str) -> bool:
+    return make_url(url).get_backend_name() == "sqlite"
 
-@event.listens_for(engine.sync_engine, "connect")
 def _set_sqlite_pragma(dbapi_conn, _):
     cursor = dbapi_conn.cursor()
     cursor.execute("PRAGMA foreign_keys=ON;")
     cursor.execute("PRAGMA journal_mode=WAL;")
-    cursor.execute("PRAGMA synchronous=NORMAL;")
     cursor.close()
 
+def _set_query_only(dbapi_conn, _):
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA query_only=ON;")
+    cursor.close()
+
+def use_explicit_begin(engine: AsyncEngine) -> None:
+    """
+    Emit BEGIN IMMEDIATE ourselves (SQLite). pysqlite defers BEGIN to the first DML, so a
+    leading SAVEPOINT would open the transaction and its RELEASE would commit it, breaking
+    group commit; IMMEDIATE also takes the write lock up front.
+    """
+    def _autocommit_driver(dbapi_conn, *_):
+        dbapi_conn.isolation_level = None
+
+    def _begin(conn):
+        if conn.get_execution_options().get("isolation_level") != "AUTOCOMMIT":  # e.g. db.maintenance
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+    event.listen(engine.sync_engine, "connect", _autocommit_driver)
+    # SQLAlchemy's isolation level reset (e.g. after an AUTOCOMMIT connection) re-enables it
+    event.listen(engine.sync_engine, "checkout", _autocommit_driver)
+    event.listen(engine.sync_engine, "begin", _begin)
+
+def _create_pooled_engine(url: str) -> AsyncEngine:
+    connect_args = {}
+    if make_url(url).get_driver_name() == "asyncpg":
+        # short OLTP queries: JIT compilation costs more than it saves
+        connect_args["server_settings"] = {"application_name": "auto_apply_ai", "jit": "off"}
+    return create_async_engine(
+        url, future=True, echo=False,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args=connect_args,
+    )
+
+def create_write_engine(url: str, single_writer: bool = False, profile: Optional[str] = None) -> AsyncEngine:
+    if not is_sqlite(url):
+        return _create_pooled_engine(url)
+    if not single_writer:
+        eng = create_async_engine(url, future=True, echo=False)
+    else:
+        eng = create_async_engine(
+            url, future=True, echo=False,
+            pool_size=1, max_overflow=0, pool_timeout=settings.DB_WRITER_TIMEOUT_SECONDS,
+        )
+        use_explicit_begin(eng)
+    event.listen(eng.sync_engine, "connect", _set_sqlite_pragma)
+    install_sqlite_profiles(eng, profile)
+    return eng
+
+def create_read_engine(url: str, profile: Optional[str] = None) -> AsyncEngine:
+    """Read-only WAL connections: never take the write lock, never wait for the writer."""
+    eng = create_async_engine(url, future=True, echo=False, pool_size=settings.DB_READ_POOL_SIZE, max_overflow=0)
+    event.listen(eng.sync_engine, "connect", _set_sqlite_pragma)
+    event.listen(eng.sync_engine, "connect", _set_query_only)
+    install_sqlite_profiles(eng, profile or settings.SQLITE_READ_PROFILE)
+    return eng
+
+single_writer = settings.DB_WRITE_MODE == "queue" and is_sqlite(settings.DATABASE_URL)
+engine = create_write_engine(settings.DATABASE_URL, single_writer)
+read_engine = create_read_engine(settings.DATABASE_URL) if single_writer else engine
+
 AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+ReadSessionLocal = async_sessionmaker(read_engine, expire_on_commit=False, class_=AsyncSession)
 Base = declarative_base()
@@ -0,0 +1,83 @@
+# src/auto_apply_ai/db/maintenance.py
+"""
+Background SQLite upkeep for the write engine:
+- PASSIVE WAL checkpoint every SQLITE_CHECKPOINT_INTERVAL_SECONDS (never waits for readers
+  or writers); once everything is checkpointed and the WAL holds more than
+  SQLITE_WAL_TRUNCATE_FRAMES frames, a TRUNCATE checkpoint shrinks the file back to zero
+- PRAGMA optimize every SQLITE_OPTIMIZE_INTERVAL_SECONDS and on shutdown
+Both run on an AUTOCOMMIT connection (a checkpoint cannot run inside a transaction).
+"""
+from __future__ import annotations
+import asyncio
+import logging
+import time
+from typing import Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from auto_apply_ai.config.settings import settings
+from auto_apply_ai.db.engine import engine as write_engine, is_sqlite
+
+log = logging.getLogger(__name__)
+
+class SqliteMaintenance:
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        checkpoint_interval: Optional[float] = None,
+        truncate_frames: Optional[int] = None,
+        optimize_interval: Optional[float] = None,
+    ) -> None:
+        self.engine = engine
+        self.checkpoint_interval = settings.SQLITE_CHECKPOINT_INTERVAL_SECONDS if checkpoint_interval is None else checkpoint_interval
+        self.truncate_frames = settings.SQLITE_WAL_TRUNCATE_FRAMES if truncate_frames is None else truncate_frames
+        self.optimize_interval = settings.SQLITE_OPTIMIZE_INTERVAL_SECONDS if optimize_interval is None else optimize_interval
+        self._task: Optional[asyncio.Task] = None
+        self._last_optimize = time.monotonic()
+
+    async def checkpoint(self) -> Tuple[int, int, int]:
+        """(busy, wal frames, checkpointed frames) of the last checkpoint run."""
+        async with self.engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            busy, frames, done = (await conn.exec_driver_sql("PRAGMA wal_checkpoint(PASSIVE)")).one()
+            if not busy and frames > self.truncate_frames and done == frames:
+                busy, frames, done = (await conn.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")).one()
+        return busy, frames, done
+
+    async def optimize(self) -> None:
+        async with self.engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            await conn.exec_driver_sql("PRAGMA optimize")
+        self._last_optimize = time.monotonic()
+
+    def start(self) -> None:
+        if self._task is None and (self.checkpoint_interval > 0 or self.optimize_interval > 0):
+            self._task = asyncio.create_task(self._run(), name="sqlite-maintenance")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        try:
+            await self.optimize()
+        except Exception:
+            log.exception("PRAGMA optimize on shutdown failed")
+
+    async def _run(self) -> None:
+        intervals = [i for i in (self.checkpoint_interval, self.optimize_interval) if i > 0]
+        while True:
+            await asyncio.sleep(min(intervals))
+            try:
+                if self.checkpoint_interval > 0:
+                    await self.checkpoint()
+                if self.optimize_interval > 0 and time.monotonic() - self._last_optimize >= self.optimize_interval:
+                    await self.optimize()
+            except Exception:  # keep going; a locked database is retried next round
+                log.exception("SQLite maintenance failed")
+
+sqlite_maintenance = SqliteMaintenance(write_engine) if is_sqlite(settings.DATABASE_URL) else None
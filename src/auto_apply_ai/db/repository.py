@@ -1,17 +1,42 @@
 # src/auto_apply_ai/core/repo.py
 from __future__ import annotations
-from typing import Dict, Any, Optional, Tuple, List
-from sqlalchemy import select, update, insert
+import json
+from typing import Dict, Any, AsyncIterator, Optional, Tuple, List, Iterable, Set
+from sqlalchemy import JSON, select, update, insert, delete, func, bindparam, literal_column, Subquery
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from auto_apply_ai.models.entities import JobPosting, JobCapture
-from auto_apply_ai.services.job_intake.dedupe.keys import key_exact, key_company_title_host, host_of
+from auto_apply_ai.config.settings import settings
+from auto_apply_ai.models.entities import (
+    AtsResolution, HostFetchStat, JobPosting, JobCapture, PostingCapture, ImportCheckpoint, _uuid
+)
+from auto_apply_ai.db.cache import mark_postings_changed
+from auto_apply_ai.db.search import (
+    FTS_TABLE, PG_DOCUMENT, fts_match_expression, fts_postings, pg_tsquery_expression, search_keys
+)
+from auto_apply_ai.services.job_intake.dedupe.keys import DedupeKey, key_company_title_host
+from auto_apply_ai.services.job_intake.ingest.normalizers import source_url_record
+from auto_apply_ai.services.job_intake.dedupe.index import PostingDedupeIndex
+from auto_apply_ai.utils.time import now_utc
+
+def _dialect(session: AsyncSession) -> str:
+    return session.get_bind().dialect.name
+
+def _upsert(session: AsyncSession, target: Any) -> Any:
+    """INSERT with on_conflict_do_update/on_conflict_do_nothing for the session's backend."""
+    return pg_insert(target) if _dialect(session) == "postgresql" else sqlite_insert(target)
 
 async def create_capture(session: AsyncSession, data: Dict[str, Any]) -> str:
-    cap = JobCapture(**data)
+    cap = JobCapture(**{k: v for k, v in data.items() if not k.startswith("_")})
     session.add(cap)
     await session.flush()
     return str(cap.id)
 
+async def link_capture(session: AsyncSession, posting_id: str, capture_id: str) -> None:
+    await session.execute(
+        _upsert(session, PostingCapture).values(posting_id=posting_id, capture_id=capture_id).on_conflict_do_nothing()
+    )
+
 async def upsert_job_posting_for_capture(session: AsyncSession, capture_id: str, capture: Dict[str, Any]) -> str:
     """
     - Compute canonical_url (for now: cleaned source_url)
@@ -19,8 +44,9 @@ async def upsert_job_posting_for_capture(session: AsyncSession, capture_id: str,
     - Merge with existing by exact URL or company+title+host
     """
     canonical_url = capture["source_url"]
-    host = host_of(canonical_url)
-    dk_exact = key_exact(canonical_url)
+    parsed = source_url_record(capture)
+    host = parsed.host
+    dk_exact = parsed.key_exact
     dk_cth = key_company_title_host(capture.get("company"), capture.get("job_title"), host)
 
     # Try exact
@@ -41,24 +67,344 @@ async def upsert_job_posting_for_capture(session: AsyncSession, capture_id: str,
             source_host=host,
             status="new",
             next_action="retry_fetch",
-            capture_ids=[capture_id],
             dedupe_key_exact=dk_exact,
             dedupe_key_company_title_host=dk_cth,
             ats_req_id=None,
         )
         session.add(post)
         await session.flush()
+        await link_capture(session, str(post.id), capture_id)
         return str(post.id)
 
     # Merge
-    merged_capture_ids = list({*(post.capture_ids or []), capture_id})
     if not getattr(post, "company", None) and capture.get("company"):
         post.company = capture["company"]
     if not getattr(post, "job_title", None) and capture.get("job_title"):
         post.job_title = capture["job_title"]
     if not getattr(post, "location", None) and capture.get("location"):
         post.location = capture["location"]
-    # Ensure capture_ids is assigned a plain list of strings
-    post.capture_ids = [str(cid) for cid in merged_capture_ids] # type: ignore
     await session.flush()
-    return str(post.id)
\ No newline at end of file
+    await link_capture(session, str(post.id), capture_id)
+    return str(post.id)
+
+CAPTURE_COLUMNS = tuple(c.name for c in JobCapture.__table__.columns if c.name != "id")
+_CAPTURE_JSON_COLUMNS = frozenset(c.name for c in JobCapture.__table__.columns if isinstance(c.type, JSON))
+
+def _capture_values(capture_id: str, row: Dict[str, Any]) -> Dict[str, Any]:
+    values = {k: row.get(k) for k in CAPTURE_COLUMNS}
+    values["id"] = capture_id
+    values["tags"] = values["tags"] or []
+    values["hard_errors"] = values["hard_errors"] or []
+    values["soft_warnings"] = values["soft_warnings"] or []
+    return values
+
+async def bulk_create_captures(session: AsyncSession, rows: List[Dict[str, Any]]) -> List[str]:
+    """
+    Insert a chunk of normalized capture rows with one executemany INSERT
+    (COPY on PostgreSQL + asyncpg, see IMPORT_PG_COPY).
+    Ids are generated client-side so callers can link postings without a RETURNING round trip.
+    """
+    ids = [_uuid() for _ in rows]
+    if not rows:
+        return ids
+    values = [_capture_values(cid, row) for cid, row in zip(ids, rows)]
+    if settings.IMPORT_PG_COPY and _dialect(session) == "postgresql" and session.get_bind().dialect.driver == "asyncpg":
+        await _copy_captures(session, values)
+    else:
+        await session.execute(insert(JobCapture), values)
+    return ids
+
+async def _copy_captures(session: AsyncSession, values: List[Dict[str, Any]]) -> None:
+    """COPY ... FROM STDIN (binary) on the session's connection, inside its transaction."""
+    columns = ["id", *CAPTURE_COLUMNS]
+    records = [
+        tuple(json.dumps(v[c]) if c in _CAPTURE_JSON_COLUMNS else v[c] for c in columns)
+        for v in values
+    ]
+    conn = await session.connection()
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(JobCapture.__tablename__, records=records, columns=columns)
+
+async def load_dedupe_index(
+    session: AsyncSession,
+    index: PostingDedupeIndex,
+    exact_keys: Iterable[DedupeKey],
+    cth_keys: Iterable[DedupeKey],
+) -> None:
+    """Resolve the keys the index has not seen yet with a single IN (...) query."""
+    exact, cth = index.unresolved(exact_keys, cth_keys)
+    if not exact and not cth:
+        return
+    res = await session.execute(
+        select(
+            JobPosting.id,
+            JobPosting.company,
+            JobPosting.job_title,
+            JobPosting.location,
+            JobPosting.dedupe_key_exact,
+            JobPosting.dedupe_key_company_title_host,
+        ).where(
+            JobPosting.dedupe_key_exact.in_(exact)
+            | JobPosting.dedupe_key_company_title_host.in_(cth)
+        )
+    )
+    for r in res:
+        post = {
+            "id": r.id,
+            "company": r.company,
+            "job_title": r.job_title,
+            "location": r.location,
+        }
+        index.add(post, r.dedupe_key_exact, r.dedupe_key_company_title_host)
+    index.mark_resolved(exact, cth)
+
+async def bulk_upsert_job_postings_for_captures(
+    session: AsyncSession,
+    capture_ids: List[str],
+    captures: List[Dict[str, Any]],
+    index: Optional[PostingDedupeIndex] = None,
+) -> List[str]:
+    """
+    Set-based equivalent of calling upsert_job_posting_for_capture once per row:
+    - dedupe keys resolved through an import-scoped PostingDedupeIndex
+      (at most one SELECT per chunk, none once the keys are known)
+    - merge in memory (rows inside the import also dedupe against each other)
+    - one INSERT ... ON CONFLICT for new postings, one executemany UPDATE for merged ones
+    - posting_captures links inserted with executemany (no per-posting list rewrites)
+    Returns the posting id for every capture, in input order.
+    """
+    if index is None:
+        index = PostingDedupeIndex()
+    keyed: List[Tuple[str, Dict[str, Any], str, DedupeKey, DedupeKey]] = []
+    for capture_id, capture in zip(capture_ids, captures):
+        parsed = source_url_record(capture)
+        keyed.append((
+            capture_id,
+            capture,
+            parsed.host,
+            parsed.key_exact,
+            key_company_title_host(capture.get("company"), capture.get("job_title"), parsed.host),
+        ))
+    if not keyed:
+        return []
+    await load_dedupe_index(session, index, (k[3] for k in keyed), (k[4] for k in keyed))
+
+    created: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
+    created_ids: Set[str] = set()
+    created_urls: Dict[str, str] = {}
+    merged: Dict[str, Dict[str, Any]] = {}
+    posting_ids: List[str] = []
+    for _capture_id, capture, host, dk_exact, dk_cth in keyed:
+        post = index.lookup(dk_exact, dk_cth)
+        if post is None:
+            post = {
+                "id": _uuid(),
+                "company": capture.get("company") or "",
+                "job_title": capture.get("job_title") or "",
+                "location": capture.get("location"),
+            }
+            index.add(post, dk_exact, dk_cth)
+            created.append((post, {
+                "canonical_url": capture["source_url"],
+                "source_host": host,
+                "status": "new",
+                "next_action": "retry_fetch",
+                "dedupe_key_exact": dk_exact,
+                "dedupe_key_company_title_host": dk_cth,
+                "ats_req_id": None,
+            }))
+            created_ids.add(post["id"])
+            created_urls[post["id"]] = capture["source_url"]
+            posting_ids.append(post["id"])
+            continue
+
+        if not post["company"] and capture.get("company"):
+            post["company"] = capture["company"]
+        if not post["job_title"] and capture.get("job_title"):
+            post["job_title"] = capture["job_title"]
+        if not post["location"] and capture.get("location"):
+            post["location"] = capture["location"]
+        if post["id"] not in created_ids:
+            merged[post["id"]] = post
+        posting_ids.append(post["id"])
+
+    if created:
+        stmt = _upsert(session, JobPosting)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[JobPosting.canonical_url],
+            set_={
+                "company": func.coalesce(func.nullif(JobPosting.company, ""), stmt.excluded.company),
+                "job_title": func.coalesce(func.nullif(JobPosting.job_title, ""), stmt.excluded.job_title),
+                "location": func.coalesce(JobPosting.location, stmt.excluded.location),
+            },
+        )
+        await session.execute(stmt, [{**post, **extra} for post, extra in created])
+    if merged:
+        await session.execute(update(JobPosting), list(merged.values()))
+    # Core statements bypass the flush hook; ORM writes elsewhere are tracked automatically
+    mark_postings_changed(session, posting_ids)
+
+    links = [
+        {"capture_id": cid, "posting_id": pid}
+        for cid, pid in zip(capture_ids, posting_ids)
+        if pid not in created_ids
+    ]
+    if links:
+        await session.execute(_upsert(session, PostingCapture).on_conflict_do_nothing(), links)
+    # New postings are linked through their URL: if another writer inserted the same URL
+    # first, the ON CONFLICT above kept that row (and its id) instead of ours
+    new_links = [
+        {"capture_id": cid, "url": created_urls[pid]}
+        for cid, pid in zip(capture_ids, posting_ids)
+        if pid in created_ids
+    ]
+    if new_links:
+        await session.execute(
+            _upsert(session, PostingCapture.__table__).from_select(
+                ["posting_id", "capture_id"],
+                select(JobPosting.id, bindparam("capture_id", type_=PostingCapture.capture_id.type))
+                .where(JobPosting.canonical_url == bindparam("url")),
+            ).on_conflict_do_nothing(),
+            new_links,
+        )
+    return posting_ids
+
+async def get_import_checkpoint(session: AsyncSession, batch_id: str) -> Optional[ImportCheckpoint]:
+    return (await session.execute(
+        select(ImportCheckpoint).where(ImportCheckpoint.batch_id == batch_id)
+    )).scalar_one_or_none()
+
+async def save_import_checkpoint(
+    session: AsyncSession, batch_id: str, last_row_index: int, accepted: int, quarantined: int
+) -> None:
+    values = {
+        "last_row_index": last_row_index,
+        "accepted": accepted,
+        "quarantined": quarantined,
+        "updated_at": now_utc(),
+    }
+    stmt = _upsert(session, ImportCheckpoint).values(batch_id=batch_id, **values)
+    await session.execute(stmt.on_conflict_do_update(index_elements=[ImportCheckpoint.batch_id], set_=values))
+
+async def load_host_fetch_stats(session: AsyncSession) -> List[HostFetchStat]:
+    return list((await session.execute(select(HostFetchStat))).scalars())
+
+async def save_host_fetch_stats(session: AsyncSession, rows: List[Dict[str, Any]]) -> None:
+    """Upsert (source_host, tier) rows; each row has every HostFetchStat column."""
+    if not rows:
+        return
+    stmt = _upsert(session, HostFetchStat)
+    columns = [c.name for c in HostFetchStat.__table__.columns if not c.primary_key]
+    await session.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[HostFetchStat.source_host, HostFetchStat.tier],
+            set_={name: stmt.excluded[name] for name in columns},
+        ),
+        rows,
+    )
+
+async def _posting_id_chunks(
+    session: AsyncSession,
+    ids: Optional[List[str]],
+    status: Optional[str],
+    host: Optional[str],
+    chunk_size: int,
+) -> AsyncIterator[List[str]]:
+    """Ids of the postings matching `ids` AND the filters, at most chunk_size at a time (keyset on id)."""
+    where = []
+    if status:
+        where.append(JobPosting.status == status)
+    if host:
+        where.append(JobPosting.source_host == host)
+    if ids is not None:
+        unique = sorted(set(ids))
+        for i in range(0, len(unique), chunk_size):
+            found = (await session.execute(
+                select(JobPosting.id).where(JobPosting.id.in_(unique[i:i + chunk_size]), *where)
+            )).scalars().all()
+            if found:
+                yield list(found)
+        return
+    last: Optional[str] = None
+    while True:
+        stmt = select(JobPosting.id).where(*where)
+        if last is not None:
+            stmt = stmt.where(JobPosting.id > last)
+        chunk = (await session.execute(stmt.order_by(JobPosting.id).limit(chunk_size))).scalars().all()
+        if not chunk:
+            return
+        yield list(chunk)
+        last = chunk[-1]
+
+async def bulk_delete_postings(
+    session: AsyncSession,
+    ids: Optional[List[str]] = None,
+    status: Optional[str] = None,
+    host: Optional[str] = None,
+    chunk_size: Optional[int] = None,
+) -> Dict[str, int]:
+    """
+    Delete matching postings with their captures, links and ATS resolutions:
+    four set-based DELETEs per chunk, no ORM loads. The caller commits (one transaction).
+    Returns affected row counts.
+    """
+    counts = {"postings": 0, "captures": 0, "ats_resolutions": 0}
+    no_sync = {"synchronize_session": False}
+    async for chunk in _posting_id_chunks(session, ids, status, host, chunk_size or settings.BULK_CHUNK_SIZE):
+        linked = select(PostingCapture.capture_id).where(PostingCapture.posting_id.in_(chunk))
+        res = await session.execute(delete(JobCapture).where(JobCapture.id.in_(linked)).execution_options(**no_sync))
+        counts["captures"] += res.rowcount
+        await session.execute(delete(PostingCapture).where(PostingCapture.posting_id.in_(chunk)).execution_options(**no_sync))
+        res = await session.execute(delete(AtsResolution).where(AtsResolution.posting_id.in_(chunk)).execution_options(**no_sync))
+        counts["ats_resolutions"] += res.rowcount
+        res = await session.execute(delete(JobPosting).where(JobPosting.id.in_(chunk)).execution_options(**no_sync))
+        counts["postings"] += res.rowcount
+        mark_postings_changed(session, chunk)
+    return counts
+
+async def bulk_update_posting_status(
+    session: AsyncSession,
+    values: Dict[str, str],
+    ids: Optional[List[str]] = None,
+    status: Optional[str] = None,
+    host: Optional[str] = None,
+    chunk_size: Optional[int] = None,
+) -> int:
+    """Set `values` (status and/or next_action) on matching postings, one UPDATE per chunk. The caller commits."""
+    updated = 0
+    async for chunk in _posting_id_chunks(session, ids, status, host, chunk_size or settings.BULK_CHUNK_SIZE):
+        res = await session.execute(
+            update(JobPosting).where(JobPosting.id.in_(chunk)).values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        updated += res.rowcount
+        mark_postings_changed(session, chunk)
+    return updated
+
+def posting_search(dialect_name: str, q: str) -> Optional[Subquery]:
+    """
+    Subquery of (id, rank) for postings matching every word of `q` as a prefix;
+    lower rank = better match. None if `q` has no searchable words.
+    """
+    if dialect_name == "postgresql":
+        expr = pg_tsquery_expression(q)
+        if expr is None:
+            return None
+        doc = literal_column(PG_DOCUMENT)
+        query = func.to_tsquery(literal_column("'simple'::regconfig"), expr)
+        return (
+            select(JobPosting.id.label("id"), (-func.ts_rank(doc, query)).label("rank"))
+            .where(doc.op("@@")(query))
+            .subquery("search")
+        )
+    expr = fts_match_expression(q)
+    if expr is None:
+        return None
+    fts = literal_column(FTS_TABLE)
+    return (
+        select(search_keys.c.posting_id.label("id"), func.bm25(fts).label("rank"))
+        .select_from(fts_postings)
+        .join(search_keys, search_keys.c.key == fts_postings.c.rowid)
+        .where(fts.op("MATCH")(expr))
+        .subquery("search")
+    )
@@ -0,0 +1,93 @@
+# src/auto_apply_ai/db/schema.py
+"""
+Startup schema check (replaces create_all on every boot):
+- one SELECT against alembic_version; a database at SCHEMA_REVISION starts immediately
+- an empty database gets create_all + a stamp when DB_CREATE_SCHEMA is on (dev); otherwise
+  startup fails
+- a database with tables but no alembic_version was made by the old create_all startup:
+  create_all would only add the missing tables, so startup fails instead. If its tables are
+  the ones the init revision creates it is stamped BASE_REVISION first (DB_CREATE_SCHEMA on),
+  and `alembic upgrade head` then migrates it
+- any other revision fails with a hint to run `alembic upgrade head`
+SCHEMA_REVISION must be the alembic head (tests/db/test_schema.py checks it).
+"""
+from __future__ import annotations
+import logging
+from typing import Optional
+
+from sqlalchemy import Column, MetaData, String, Table, insert, inspect, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from auto_apply_ai.config.settings import settings
+from auto_apply_ai.db.engine import Base
+
+log = logging.getLogger(__name__)
+
+SCHEMA_REVISION = "6a2f8c4e1b93"
+# The init revision, i.e. the schema the old create_all startup built
+BASE_REVISION = "a8c10372e1a9"
+BASE_TABLES = frozenset({"job_captures", "job_postings", "ats_resolutions"})
+
+# alembic's own version table, so a stamp here is what `alembic stamp head` would write
+alembic_version = Table(
+    "alembic_version", MetaData(),
+    Column("version_num", String(32), primary_key=True),
+)
+
+class SchemaMismatch(RuntimeError):
+    pass
+
+def _current_revision(conn: Connection) -> Optional[str]:
+    try:
+        return conn.execute(select(alembic_version.c.version_num)).scalar()
+    except DBAPIError:  # no alembic_version table
+        return None
+
+def _table_names(conn: Connection) -> set:
+    return set(inspect(conn).get_table_names())
+
+def _stamp(conn: Connection, revision: str) -> None:
+    alembic_version.create(conn, checkfirst=True)
+    conn.execute(alembic_version.delete())
+    conn.execute(insert(alembic_version).values(version_num=revision))
+
+def _create_and_stamp(conn: Connection) -> None:
+    import auto_apply_ai.models.entities  # noqa: F401  (register tables on Base)
+
+    Base.metadata.create_all(conn)
+    _stamp(conn, SCHEMA_REVISION)
+
+async def ensure_schema(engine: AsyncEngine, create: Optional[bool] = None) -> str:
+    """Return the schema revision, creating it first on an unversioned database if allowed."""
+    create = settings.DB_CREATE_SCHEMA if create is None else create
+    async with engine.connect() as conn:
+        revision = await conn.run_sync(_current_revision)
+    if revision == SCHEMA_REVISION:
+        return revision
+    if revision is None:
+        async with engine.connect() as conn:
+            tables = await conn.run_sync(_table_names)
+        if not tables and create:
+            async with engine.begin() as conn:
+                await conn.run_sync(_create_and_stamp)
+            log.info("created database schema at %s", SCHEMA_REVISION)
+            return SCHEMA_REVISION
+        if tables == BASE_TABLES and create:
+            async with engine.begin() as conn:
+                await conn.run_sync(_stamp, BASE_REVISION)
+            log.warning("stamped unversioned database at %s", BASE_REVISION)
+            raise SchemaMismatch(
+                f"database was created without migrations; stamped it {BASE_REVISION}, "
+                f"this build expects {SCHEMA_REVISION}; run `alembic upgrade head`"
+            )
+        if tables:
+            raise SchemaMismatch(
+                f"database has tables ({', '.join(sorted(tables))}) but no alembic revision; "
+                "run `alembic stamp <the revision it matches>`, then `alembic upgrade head`"
+            )
+    raise SchemaMismatch(
+        f"database schema is at {revision or 'no alembic revision'}, this build expects {SCHEMA_REVISION}; "
+        "run `alembic upgrade head`"
+    )
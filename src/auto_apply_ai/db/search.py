@@ -0,0 +1,103 @@
+# src/auto_apply_ai/db/search.py
+"""
+Full-text search over job_postings (company, job_title, location).
+
+- SQLite: FTS5 table job_postings_fts keyed by job_postings_search_keys.key, an INTEGER
+  PRIMARY KEY per posting id (job_postings has a String primary key, so its implicit rowid
+  may be renumbered by VACUUM and cannot key the index). Triggers keep both in sync, so every
+  write path (ORM, bulk upserts, raw SQL) is covered.
+- PostgreSQL: GIN index on a 'simple' tsvector of the same columns.
+Both are created with the table (after_create) and by the Alembic migrations.
+"""
+from __future__ import annotations
+import re
+from typing import List, Optional
+
+from sqlalchemy import Column, DDL, Integer, MetaData, String, Table, Text, event, text
+from sqlalchemy.engine import Connection
+
+FTS_TABLE = "job_postings_fts"
+SEARCH_KEYS_TABLE = "job_postings_search_keys"
+
+# Not on Base.metadata: created by the DDL below (SQLite only), never by create_all
+_search_metadata = MetaData()
+fts_postings = Table(
+    FTS_TABLE, _search_metadata,
+    Column("rowid", Integer, primary_key=True),  # = search_keys.key
+    Column("company", Text),
+    Column("job_title", Text),
+    Column("location", Text),
+)
+search_keys = Table(
+    SEARCH_KEYS_TABLE, _search_metadata,
+    Column("key", Integer, primary_key=True),
+    Column("posting_id", String, nullable=False, unique=True),
+)
+
+_KEY_OF = f"(SELECT key FROM {SEARCH_KEYS_TABLE} WHERE posting_id = %s)"
+
+SQLITE_DDL: List[str] = [
+    f"CREATE TABLE IF NOT EXISTS {SEARCH_KEYS_TABLE} (key INTEGER PRIMARY KEY, posting_id VARCHAR NOT NULL UNIQUE)",
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+    "company, job_title, location, tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+    f"CREATE TRIGGER IF NOT EXISTS job_postings_fts_ai AFTER INSERT ON job_postings BEGIN "
+    f"INSERT INTO {SEARCH_KEYS_TABLE}(posting_id) VALUES (new.id); "
+    f"INSERT INTO {FTS_TABLE}(rowid, company, job_title, location) "
+    f"VALUES ({_KEY_OF % 'new.id'}, new.company, new.job_title, new.location); END",
+    f"CREATE TRIGGER IF NOT EXISTS job_postings_fts_ad AFTER DELETE ON job_postings BEGIN "
+    f"DELETE FROM {FTS_TABLE} WHERE rowid = {_KEY_OF % 'old.id'}; "
+    f"DELETE FROM {SEARCH_KEYS_TABLE} WHERE posting_id = old.id; END",
+    f"CREATE TRIGGER IF NOT EXISTS job_postings_fts_au AFTER UPDATE OF company, job_title, location "
+    f"ON job_postings BEGIN "
+    f"UPDATE {FTS_TABLE} SET company = new.company, job_title = new.job_title, location = new.location "
+    f"WHERE rowid IN (SELECT key FROM {SEARCH_KEYS_TABLE} WHERE posting_id IN (old.id, new.id)); END",
+    f"CREATE TRIGGER IF NOT EXISTS job_postings_fts_aid AFTER UPDATE OF id ON job_postings BEGIN "
+    f"UPDATE {SEARCH_KEYS_TABLE} SET posting_id = new.id WHERE posting_id = old.id; END",
+]
+
+# Must match repository.posting_search's expression for the planner to use the index
+PG_DOCUMENT = (
+    "to_tsvector('simple'::regconfig, coalesce(company, '') || ' ' || "
+    "coalesce(job_title, '') || ' ' || coalesce(location, ''))"
+)
+PG_DDL: List[str] = [
+    f"CREATE INDEX IF NOT EXISTS ix_job_postings_search ON job_postings USING gin ({PG_DOCUMENT})",
+]
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+def search_tokens(q: str) -> List[str]:
+    return _TOKEN.findall(q.lower())
+
+def fts_match_expression(q: str) -> Optional[str]:
+    """User input -> FTS5 MATCH string: every word must match as a prefix ("acm back" finds "Acme Backend")."""
+    tokens = search_tokens(q)
+    return " ".join(f'"{t}"*' for t in tokens) or None
+
+def pg_tsquery_expression(q: str) -> Optional[str]:
+    """Same semantics as fts_match_expression, for to_tsquery('simple', ...)."""
+    tokens = search_tokens(q)
+    return " & ".join(f"{t}:*" for t in tokens) or None
+
+def install_search_ddl(table: Table) -> None:
+    for stmt in SQLITE_DDL:
+        event.listen(table, "after_create", DDL(stmt).execute_if(dialect="sqlite"))
+    for stmt in PG_DDL:
+        event.listen(table, "after_create", DDL(stmt).execute_if(dialect="postgresql"))
+    for name in (FTS_TABLE, SEARCH_KEYS_TABLE):
+        event.listen(table, "before_drop", DDL(f"DROP TABLE IF EXISTS {name}").execute_if(dialect="sqlite"))
+
+def rebuild_search_index(conn: Connection) -> None:
+    """
+    Repopulate the search keys and the FTS5 table from job_postings (SQLite only; the PG
+    index needs no rebuild). Only needed to repair rows written with the triggers disabled.
+    """
+    if conn.dialect.name == "sqlite":
+        conn.execute(text(f"DELETE FROM {FTS_TABLE}"))
+        conn.execute(text(f"DELETE FROM {SEARCH_KEYS_TABLE}"))
+        conn.execute(text(f"INSERT INTO {SEARCH_KEYS_TABLE}(posting_id) SELECT id FROM job_postings"))
+        conn.execute(text(
+            f"INSERT INTO {FTS_TABLE}(rowid, company, job_title, location) "
+            f"SELECT k.key, p.company, p.job_title, p.location FROM {SEARCH_KEYS_TABLE} k "
+            "JOIN job_postings p ON p.id = k.posting_id"
+        ))
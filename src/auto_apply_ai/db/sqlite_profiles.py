@@ -0,0 +1,80 @@
+# src/auto_apply_ai/db/sqlite_profiles.py
+"""
+Named SQLite storage profiles (SQLITE_PROFILES): per-connection pragmas such as
+synchronous, cache_size, mmap_size, temp_store and wal_autocheckpoint.
+
+- every connection runs the engine's base profile (SQLITE_PROFILE)
+- `with sqlite_profile("bulk_import"):` switches the connections checked out inside the
+  block (a context variable, so only this task/import is affected); a connection that
+  comes back for someone else is switched back on its next checkout
+- pragmas a profile leaves out fall back to SQLite's defaults, so switches are complete
+"""
+from __future__ import annotations
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from auto_apply_ai.config.settings import settings
+
+PROFILE_KEY = "sqlite_profile"  # connection record info key
+
+# SQLite's own defaults; a profile only lists what it changes
+PRAGMA_DEFAULTS: Dict[str, Any] = {
+    "synchronous": "FULL",
+    "cache_size": -2000,
+    "mmap_size": 0,
+    "temp_store": "DEFAULT",
+    "wal_autocheckpoint": 1000,
+}
+
+_requested: ContextVar[Optional[str]] = ContextVar("sqlite_profile", default=None)
+
+def profile_pragmas(name: str) -> Tuple[Tuple[str, Any], ...]:
+    try:
+        profile = settings.SQLITE_PROFILES[name]
+    except KeyError:
+        raise ValueError(f"unknown SQLite profile {name!r} (SQLITE_PROFILES: {', '.join(settings.SQLITE_PROFILES)})")
+    unknown = set(profile) - set(PRAGMA_DEFAULTS)
+    if unknown:
+        raise ValueError(f"SQLite profile {name!r}: unsupported pragmas {', '.join(sorted(unknown))}")
+    return tuple({**PRAGMA_DEFAULTS, **profile}.items())
+
+def _apply(dbapi_conn: Any, pragmas: Tuple[Tuple[str, Any], ...]) -> None:
+    cursor = dbapi_conn.cursor()
+    for name, value in pragmas:
+        cursor.execute(f"PRAGMA {name}={value};")
+    cursor.close()
+
+def install_sqlite_profiles(engine: AsyncEngine, base: Optional[str] = None) -> None:
+    """Apply `base` (default SQLITE_PROFILE) on connect and the requested profile on checkout."""
+    base = base or settings.SQLITE_PROFILE
+    profile_pragmas(base)  # fail at startup on a bad name
+
+    def _connect(dbapi_conn: Any, record: Any) -> None:
+        _apply(dbapi_conn, profile_pragmas(base))
+        record.info[PROFILE_KEY] = base
+
+    def _checkout(dbapi_conn: Any, record: Any, _proxy: Any) -> None:
+        wanted = _requested.get() or base
+        if record.info.get(PROFILE_KEY) != wanted:
+            _apply(dbapi_conn, profile_pragmas(wanted))
+            record.info[PROFILE_KEY] = wanted
+
+    event.listen(engine.sync_engine, "connect", _connect)
+    event.listen(engine.sync_engine, "checkout", _checkout)
+
+@contextmanager
+def sqlite_profile(name: Optional[str]) -> Iterator[None]:
+    """Use profile `name` for connections checked out inside the block (None: no change)."""
+    if name is None:
+        yield
+        return
+    profile_pragmas(name)
+    token = _requested.set(name)
+    try:
+        yield
+    finally:
+        _requested.reset(token)
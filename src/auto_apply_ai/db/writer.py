@@ -0,0 +1,139 @@
+# src/auto_apply_ai/db/writer.py
+"""
+Write paths for short API transactions (deletes, bulk status changes).
+
+A unit of work is `async def work(session) -> result`: it writes through the session and
+must not commit or roll back; the writer owns the transaction.
+- SessionWriter: a session + commit per unit (DB_WRITE_MODE=direct)
+- GroupCommitWriter: one task drains the queue and runs everything waiting (up to
+  DB_WRITER_MAX_BATCH units) in a single transaction, each unit in its own SAVEPOINT, so
+  N small writes cost one fsync and a failing unit only rolls back itself
+The group-commit engine needs explicit BEGIN (db.engine.use_explicit_begin). Never submit
+while holding a write session yourself: in queue mode that waits on your own connection.
+"""
+from __future__ import annotations
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional, Protocol, Tuple, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from auto_apply_ai.config.settings import settings
+from auto_apply_ai.db.engine import AsyncSessionLocal, single_writer
+
+T = TypeVar("T")
+UnitOfWork = Callable[[AsyncSession], Awaitable[T]]
+
+class Writer(Protocol):
+    async def submit(self, work: UnitOfWork[T]) -> T: ...
+    async def stop(self) -> None: ...
+
+class SessionWriter:
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self._session_factory = session_factory
+
+    async def submit(self, work: UnitOfWork[T]) -> T:
+        async with self._session_factory() as session:
+            result = await work(session)
+            await session.commit()
+            return result
+
+    async def stop(self) -> None:
+        return None
+
+class GroupCommitWriter:
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        max_batch: Optional[int] = None,
+        max_delay_ms: Optional[float] = None,
+    ) -> None:
+        self._session_factory = session_factory
+        self.max_batch = max(max_batch or settings.DB_WRITER_MAX_BATCH, 1)
+        self.max_delay = (settings.DB_WRITER_MAX_DELAY_MS if max_delay_ms is None else max_delay_ms) / 1000
+        self._queue: Optional[asyncio.Queue[Tuple[UnitOfWork[Any], asyncio.Future]]] = None
+        self._task: Optional[asyncio.Task] = None
+        self.units = 0
+        self.commits = 0
+
+    async def submit(self, work: UnitOfWork[T]) -> T:
+        if self._task is None or self._task.done():
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run(), name="db-writer")
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        await self._queue.put((work, future))  # type: ignore[union-attr]
+        return await future
+
+    async def stop(self) -> None:
+        """Finish everything already queued, then stop the writer task."""
+        if self._task is None:
+            return
+        await self._queue.join()  # type: ignore[union-attr]
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _next_batch(self) -> List[Tuple[UnitOfWork[Any], asyncio.Future]]:
+        queue = self._queue
+        assert queue is not None
+        batch = [await queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_delay
+        while len(batch) < self.max_batch:
+            if not queue.empty():
+                batch.append(queue.get_nowait())
+                continue
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            try:
+                await self._commit_batch(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()  # type: ignore[union-attr]
+
+    async def _commit_batch(self, batch: List[Tuple[UnitOfWork[Any], asyncio.Future]]) -> None:
+        outcomes: List[Tuple[asyncio.Future, bool, Any]] = []
+        try:
+            async with self._session_factory() as session:
+                for work, future in batch:
+                    if future.done():  # submitter went away
+                        continue
+                    try:
+                        async with session.begin_nested():
+                            outcomes.append((future, True, await work(session)))
+                    except Exception as e:
+                        outcomes.append((future, False, e))
+                await session.commit()
+        except Exception as e:  # BEGIN/COMMIT failed: nothing in the batch was written
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        self.units += len(outcomes)
+        self.commits += 1
+        for future, ok, value in outcomes:
+            if future.done():
+                continue
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+
+def build_writer() -> Writer:
+    if single_writer:
+        return GroupCommitWriter(AsyncSessionLocal)
+    return SessionWriter(AsyncSessionLocal)
+
+db_writer = build_writer()
@@ -1,18 +1,23 @@
 # src/auto_apply_ai/models/entities.py
 from sqlalchemy import (
-    Column, String, DateTime, Enum, Float, ForeignKey, Text, UniqueConstraint, Index
+    Boolean, Column, String, DateTime, Enum, Float, ForeignKey, Integer, LargeBinary, Text, UniqueConstraint, Index
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.types import JSON
-import uuid
 from auto_apply_ai.db.engine import Base
+from auto_apply_ai.db.search import install_search_ddl
+from auto_apply_ai.utils.ids import uuid7
 
 Status = ("new","alive","dead_link","login_wall","expired","needs_review","resolved_ats","no_ats_link","error")
 NextAction = ("tailor_resume","review_details","retry_fetch","drop","none")
+ImportJobStatus = ("queued","running","succeeded","failed")
 ATSTypes = ("workday","greenhouse","lever","smartrecruiters","icims","taleo","ashby","bamboohr","teamtailor","unknown")
+FetchTiers = ("static","browser_lite","browser")  # cheapest first (services.jd_parser.tiered)
 
 def _uuid() -> str:
-    return str(uuid.uuid4())
+    # time-ordered, so ORDER BY id is creation order (list_jobs keyset pagination); postings
+    # created before uuid7 ids were re-keyed by migration 3e6b1d9c7f02
+    return uuid7()
 
 class JobCapture(Base):
     __tablename__ = "job_captures"
@@ -27,7 +32,7 @@ class JobCapture(Base):
     compensation_hint = Column(String, nullable=True)
     tags = Column(JSON, default=list)            # list[str]
     notes = Column(Text, nullable=True)
-    captured_at = Column(DateTime, nullable=False)
+    captured_at = Column(DateTime(timezone=True), nullable=False)
     import_batch_id = Column(String, nullable=True)
     hard_errors = Column(JSON, default=list)     # list[str]
     soft_warnings = Column(JSON, default=list)   # list[str]
@@ -42,20 +47,33 @@ class JobPosting(Base):
     source_host = Column(String, nullable=False)
     status = Column(Enum(*Status, name="posting_status"), nullable=False, default="new")
     next_action = Column(Enum(*NextAction, name="posting_next_action"), nullable=False, default="retry_fetch")
-    capture_ids = Column(JSON, default=list)     # list[str] of JobCapture ids
-    dedupe_key_exact = Column(String, nullable=False)
-    dedupe_key_company_title_host = Column(String, nullable=False)
+    dedupe_key_exact = Column(LargeBinary(16), nullable=False)               # dedupe.keys.key_exact
+    dedupe_key_company_title_host = Column(LargeBinary(16), nullable=False)  # dedupe.keys.key_company_title_host
     ats_req_id = Column(String, nullable=True)
-    last_checked_at = Column(DateTime, nullable=True)
+    last_checked_at = Column(DateTime(timezone=True), nullable=True)
 
     __table_args__ = (
         UniqueConstraint("canonical_url", name="uq_job_postings_canonical_url"),
         Index("ix_job_postings_dk_exact", "dedupe_key_exact"),
         Index("ix_job_postings_dk_cth", "dedupe_key_company_title_host"),
-        Index("ix_job_postings_status", "status"),
+        # filter + ORDER BY id DESC in one index range scan
+        Index("ix_job_postings_status_id", "status", "id"),
+        Index("ix_job_postings_source_host_id", "source_host", "id"),
         Index("ix_job_postings_company", "company"),
     )
 
+install_search_ddl(JobPosting.__table__)  # FTS5 table + sync triggers (SQLite), tsvector index (PostgreSQL)
+
+class PostingCapture(Base):
+    """Which captures were merged into which posting (many captures per posting)."""
+    __tablename__ = "posting_captures"
+    posting_id = Column(String, ForeignKey("job_postings.id", ondelete="CASCADE"), primary_key=True)
+    capture_id = Column(String, ForeignKey("job_captures.id", ondelete="CASCADE"), primary_key=True)
+
+    __table_args__ = (
+        Index("ix_posting_captures_capture_id", "capture_id"),
+    )
+
 class AtsResolution(Base):
     __tablename__ = "ats_resolutions"
     id = Column(String, primary_key=True, default=_uuid)
@@ -66,3 +84,44 @@ class AtsResolution(Base):
     method = Column(String, nullable=False, default="pattern")
 
     posting = relationship("JobPosting", backref="ats_resolution", uselist=False)
+
+
+class ImportJob(Base):
+    __tablename__ = "import_jobs"
+    id = Column(String, primary_key=True)        # the import_batch_id
+    source = Column(String, nullable=False)      # "csv" | "google_sheet"
+    status = Column(Enum(*ImportJobStatus, name="import_job_status"), nullable=False, default="queued")
+    dry_run = Column(Boolean, nullable=False, default=False)
+    rows_processed = Column(Integer, nullable=False, default=0)
+    accepted = Column(Integer, nullable=False, default=0)
+    quarantined = Column(Integer, nullable=False, default=0)
+    rows_per_sec = Column(Float, nullable=False, default=0.0)
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index("ix_import_jobs_status", "status"),
+    )
+
+class ImportCheckpoint(Base):
+    __tablename__ = "import_checkpoints"
+    batch_id = Column(String, primary_key=True)  # the import_batch_id
+    last_row_index = Column(Integer, nullable=False)
+    accepted = Column(Integer, nullable=False, default=0)
+    quarantined = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
+
+class HostFetchStat(Base):
+    """How each fetch tier has done on a source host (services.jd_parser.strategy)."""
+    __tablename__ = "host_fetch_stats"
+    source_host = Column(String, primary_key=True)
+    tier = Column(Enum(*FetchTiers, name="fetch_tier"), primary_key=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    successes = Column(Integer, nullable=False, default=0)
+    recent = Column(JSON, default=list)          # [[ok 0/1, ms], ...], last FETCH_STRATEGY_WINDOW attempts
+    success_rate = Column(Float, nullable=False, default=0.0)  # over `recent`
+    median_ms = Column(Float, nullable=True)     # of the successful attempts in `recent`
+    last_success_at = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
@@ -1,7 +1,9 @@
 # src/auto_apply_ai/api/schemas.py
 from __future__ import annotations
-from pydantic import BaseModel, Field
-from typing import List, Optional, Literal, Any
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from typing import List, Optional, Literal, Any, Tuple
+from datetime import datetime
+from auto_apply_ai.models.entities import NextAction, Status
 
 class ImportRowWarning(BaseModel):
     row_index: int
@@ -18,6 +20,37 @@ class ImportResult(BaseModel):
     errors_by_row: List[ImportRowError] = []
     batch_id: Optional[str] = None
 
+class ImportIssueSummary(BaseModel):
+    code: str
+    count: int
+    row_ranges: List[Tuple[int, int]] = []   # inclusive [first, last] row_index runs
+    ranges_truncated: bool = False
+    sample_rows: List[int] = []
+
+class CompactImportResult(BaseModel):
+    """ImportResult grouped by issue code instead of one entry per affected row."""
+    accepted: int
+    quarantined: int
+    errors: List[ImportIssueSummary] = []
+    warnings: List[ImportIssueSummary] = []
+    batch_id: Optional[str] = None
+
+class ImportJobOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    batch_id: str
+    source: str
+    status: str
+    dry_run: bool
+    rows_processed: int = 0
+    accepted: int = 0
+    quarantined: int = 0
+    rows_per_sec: float = 0.0
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
 class JobPostingOut(BaseModel):
     id: str
     canonical_url: str
@@ -32,4 +65,51 @@ class JobPostingOut(BaseModel):
 
 class JobListResponse(BaseModel):
     items: List[JobPostingOut]
-    next_cursor: Optional[str] = None
\ No newline at end of file
+    next_cursor: Optional[str] = None
+class BulkPostingFilter(BaseModel):
+    """Postings to act on: `ids` and/or filters, combined with AND. At least one is required."""
+    ids: Optional[List[str]] = None
+    status: Optional[str] = None
+    host: Optional[str] = None
+
+    @model_validator(mode="after")
+    def _require_selector(self) -> "BulkPostingFilter":
+        if self.ids is None and not self.status and not self.host:
+            raise ValueError("give ids, status or host (an empty filter would match every posting)")
+        return self
+
+class BulkDeleteRequest(BaseModel):
+    where: BulkPostingFilter
+
+class BulkStatusRequest(BaseModel):
+    where: BulkPostingFilter
+    status: Optional[str] = None
+    next_action: Optional[str] = None
+
+    @field_validator("status")
+    @classmethod
+    def _known_status(cls, v: Optional[str]) -> Optional[str]:
+        if v is not None and v not in Status:
+            raise ValueError(f"status must be one of {', '.join(Status)}")
+        return v
+
+    @field_validator("next_action")
+    @classmethod
+    def _known_next_action(cls, v: Optional[str]) -> Optional[str]:
+        if v is not None and v not in NextAction:
+            raise ValueError(f"next_action must be one of {', '.join(NextAction)}")
+        return v
+
+    @model_validator(mode="after")
+    def _require_change(self) -> "BulkStatusRequest":
+        if self.status is None and self.next_action is None:
+            raise ValueError("give status and/or next_action")
+        return self
+
+class BulkDeleteResult(BaseModel):
+    postings: int
+    captures: int
+    ats_resolutions: int
+
+class BulkStatusResult(BaseModel):
+    updated: int
@@ -0,0 +1,142 @@
+# src/auto_apply_ai/services/http_client.py
+"""
+One pooled httpx.AsyncClient per process for outbound HTTP (Google Sheet downloads, page
+fetches), so back-to-back requests reuse keep-alive / HTTP/2 connections instead of paying
+DNS + TCP + TLS setup each time.
+
+- created in the FastAPI lifespan (`await http_client.start()`), closed on shutdown; `.client`
+  also creates it on first use so scripts and background jobs work without the app
+- HTTP/2 when HTTP_HTTP2 is on and h2 is installed (pip install .[http2]), else HTTP/1.1
+- at most HTTP_MAX_CONNECTIONS_PER_HOST requests in flight per host (httpx only limits the
+  whole pool); a slot is held until the response body is closed, so streams count too
+- `.sync_client` is a blocking httpx.Client with the same settings for sync code (the scraper)
+"""
+from __future__ import annotations
+import asyncio
+import logging
+from typing import AsyncIterator, Callable, Dict, Optional
+
+import httpx
+
+from auto_apply_ai.config.settings import settings
+
+try:
+    import h2  # noqa: F401  (optional; enables HTTP/2)
+except ImportError:  # pragma: no cover - depends on the environment
+    h2 = None
+
+log = logging.getLogger(__name__)
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]) -> None:
+        self._stream = stream
+        self._release: Optional[Callable[[], None]] = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._release is not None:
+                self._release()
+                self._release = None
+
+class HostLimitedTransport(httpx.AsyncBaseTransport):
+    """Wraps a transport with a per-host (host:port) cap on in-flight requests."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, per_host: int) -> None:
+        self._transport = transport
+        self._per_host = per_host
+        self._slots: Dict[str, asyncio.Semaphore] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key = f"{request.url.host}:{request.url.port or request.url.scheme}"
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = self._slots[key] = asyncio.Semaphore(self._per_host)
+        await slot.acquire()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            slot.release()
+            raise
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_ReleasingStream(response.stream, slot.release),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+def build_client(http2: Optional[bool] = None, per_host: Optional[int] = None) -> httpx.AsyncClient:
+    http2 = settings.HTTP_HTTP2 if http2 is None else http2
+    if http2 and h2 is None:
+        log.warning("HTTP_HTTP2 is on but h2 is not installed; using HTTP/1.1")
+        http2 = False
+    limits = httpx.Limits(
+        max_connections=settings.HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY_SECONDS,
+    )
+    transport: httpx.AsyncBaseTransport = httpx.AsyncHTTPTransport(http2=http2, limits=limits, retries=1)
+    per_host = settings.HTTP_MAX_CONNECTIONS_PER_HOST if per_host is None else per_host
+    if per_host > 0:
+        transport = HostLimitedTransport(transport, per_host)
+    return httpx.AsyncClient(
+        transport=transport,
+        timeout=httpx.Timeout(settings.HTTP_TIMEOUT_SECONDS, connect=settings.HTTP_CONNECT_TIMEOUT_SECONDS),
+        follow_redirects=True,
+        headers={"User-Agent": settings.HTTP_USER_AGENT},
+    )
+
+def build_sync_client() -> httpx.Client:
+    """Blocking counterpart for sync callers (jd_parser.scraper); same limits, no per-host cap."""
+    http2 = settings.HTTP_HTTP2 and h2 is not None
+    limits = httpx.Limits(
+        max_connections=settings.HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY_SECONDS,
+    )
+    return httpx.Client(
+        transport=httpx.HTTPTransport(http2=http2, limits=limits, retries=1),
+        timeout=httpx.Timeout(settings.HTTP_TIMEOUT_SECONDS, connect=settings.HTTP_CONNECT_TIMEOUT_SECONDS),
+        follow_redirects=True,
+        headers={"User-Agent": settings.HTTP_USER_AGENT},
+    )
+
+class HttpClient:
+    def __init__(self) -> None:
+        self._client: Optional[httpx.AsyncClient] = None
+        self._sync_client: Optional[httpx.Client] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = build_client()
+        return self._client
+
+    @property
+    def sync_client(self) -> httpx.Client:
+        """Thread-safe pooled client for code that cannot await (created on first use)."""
+        if self._sync_client is None or self._sync_client.is_closed:
+            self._sync_client = build_sync_client()
+        return self._sync_client
+
+    async def start(self) -> None:
+        if self._client is None:
+            self._client = build_client()
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        if self._sync_client is not None:
+            self._sync_client.close()
+            self._sync_client = None
+
+http_client = HttpClient()
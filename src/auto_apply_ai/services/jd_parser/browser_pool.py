@@ -0,0 +1,435 @@
+# src/auto_apply_ai/services/jd_parser/browser_pool.py
+"""
+Warm headless Chromium browsers for the JD scraper, so a fetch costs a context + page instead
+of starting Playwright and launching Chromium (~1-2 s and a few hundred MB) every time.
+
+- BROWSER_POOL_SIZE browsers, launched by `start()` or on first lease
+- `with pool.lease() as context:` hands out a context on the least busy browser; on return its
+  pages are closed and cookies cleared, and it is reused for up to BROWSER_CONTEXT_MAX_USES
+  fetches (a lease that raised always gets a fresh one)
+- a browser is retired after BROWSER_MAX_PAGES pages or once its process tree holds more than
+  BROWSER_MAX_RSS_MB (Linux /proc, checked every few pages); a replacement is launched on the
+  next lease and the old one is closed when its last lease returns
+
+Sync Playwright objects belong to the thread that started them, so the process-wide pool from
+`get_browser_pool()` is a ThreadedBrowserPool: up to BROWSER_POOL_SIZE browser threads, each
+owning a one-browser BrowserPool, take `run(fn)` calls from a queue and call `fn(context)` on a
+leased context. Any thread may call `run`; the browsers never leave their threads, their number
+does not grow with the callers', and `close_browser_pool()` (registered with atexit) stops them.
+AsyncBrowserPool is the same pool on the async API (one per event loop, owned by its caller).
+"""
+from __future__ import annotations
+import asyncio
+import atexit
+import logging
+import os
+import queue
+import threading
+import uuid
+from concurrent.futures import Future
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar, Union
+
+from auto_apply_ai.config.settings import settings
+
+log = logging.getLogger(__name__)
+
+_MARKER_SWITCH = "--auto-apply-browser-pool"  # unknown to Chromium; tags the browser's command line
+_MEMORY_CHECK_EVERY = 10  # pages between /proc scans
+
+T = TypeVar("T")
+
+def process_tree_rss_mb(marker: str) -> Optional[float]:
+    """RSS of every process whose command line contains `marker`, plus descendants; None off Linux."""
+    proc = Path("/proc")
+    if not proc.is_dir():
+        return None
+    children: Dict[int, List[int]] = {}
+    marked: List[int] = []
+    needle = marker.encode()
+    for entry in proc.iterdir():
+        if not entry.name.isdigit():
+            continue
+        pid = int(entry.name)
+        try:
+            ppid = int((entry / "stat").read_text().rsplit(")", 1)[1].split()[1])
+            if needle in (entry / "cmdline").read_bytes():
+                marked.append(pid)
+        except (OSError, IndexError, ValueError):
+            continue  # exited while we looked
+        children.setdefault(ppid, []).append(pid)
+    if not marked:
+        return None
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    seen, stack, total = set(), list(marked), 0
+    while stack:
+        pid = stack.pop()
+        if pid in seen:
+            continue
+        seen.add(pid)
+        stack.extend(children.get(pid, ()))
+        try:
+            total += int((Path("/proc") / str(pid) / "statm").read_text().split()[1]) * page_size
+        except (OSError, IndexError, ValueError):
+            pass
+    return total / (1024 * 1024)
+
+@dataclass(eq=False)
+class _Browser:
+    browser: Any
+    marker: str
+    pages: int = 0
+    active: int = 0
+    checked_at: int = 0
+    idle: List[Any] = field(default_factory=list)
+    uses: Dict[Any, int] = field(default_factory=dict)
+
+class _PoolBase:
+    """
+    Slot bookkeeping shared by the sync and async pools; subclasses do the Playwright calls and
+    pass `launch(marker)`, which returns a browser (or, for the async pool, a coroutine).
+    """
+
+    def __init__(
+        self,
+        launch: Callable[[str], Any],
+        size: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        max_rss_mb: Optional[float] = None,
+        context_max_uses: Optional[int] = None,
+        context_options: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.size = max(1, settings.BROWSER_POOL_SIZE if size is None else size)
+        self.max_pages = settings.BROWSER_MAX_PAGES if max_pages is None else max_pages
+        self.max_rss_mb = settings.BROWSER_MAX_RSS_MB if max_rss_mb is None else max_rss_mb
+        self.context_max_uses = max(1, settings.BROWSER_CONTEXT_MAX_USES if context_max_uses is None else context_max_uses)
+        self.context_options = context_options or {}
+        self._launch = launch
+        self._playwright: Any = None
+        self._slots: List[Optional[_Browser]] = [None] * self.size
+        self._draining: List[_Browser] = []
+        self.launched = 0
+        self.retired = 0
+
+    @staticmethod
+    def _marker() -> str:
+        return f"{_MARKER_SWITCH}={uuid.uuid4().hex}"
+
+    def _pick(self) -> Union[_Browser, int]:
+        """The least busy browser, or the index of an empty slot to launch into."""
+        live = [s for s in self._slots if s is not None]
+        best = min(live, key=lambda s: s.active, default=None)
+        if best is None or (best.active and len(live) < self.size):
+            return self._slots.index(None)
+        return best
+
+    def _on_page(self, slot: _Browser) -> None:
+        slot.pages += 1
+
+    def _track(self, slot: _Browser, context: Any) -> Any:
+        context.on("page", lambda _page: self._on_page(slot))
+        slot.uses[context] = 0
+        return context
+
+    def _returned(self, slot: _Browser, context: Any, clean: bool) -> bool:
+        """Count the use; True if the context may go back to slot.idle (after a reset)."""
+        slot.active -= 1
+        slot.uses[context] += 1
+        return clean and slot.uses[context] < self.context_max_uses and slot not in self._draining
+
+    def _discarded(self, slot: _Browser, context: Any) -> None:
+        del slot.uses[context]
+
+    def _settle(self, slot: _Browser) -> bool:
+        """Retire a worn-out browser; True once a retired browser has no leases and can be closed."""
+        if slot not in self._draining and self._worn_out(slot):
+            self._slots[self._slots.index(slot)] = None
+            self._draining.append(slot)
+            self.retired += 1
+        if slot in self._draining and not slot.active:
+            self._draining.remove(slot)
+            return True
+        return False
+
+    def _worn_out(self, slot: _Browser) -> bool:
+        if self.max_pages > 0 and slot.pages >= self.max_pages:
+            return True
+        if self.max_rss_mb > 0 and slot.pages - slot.checked_at >= _MEMORY_CHECK_EVERY:
+            slot.checked_at = slot.pages
+            rss = self.browser_rss_mb(slot)
+            if rss is not None and rss > self.max_rss_mb:
+                log.info("retiring browser at %.0f MB RSS after %d pages", rss, slot.pages)
+                return True
+        return False
+
+    def browser_rss_mb(self, slot: _Browser) -> Optional[float]:
+        return process_tree_rss_mb(slot.marker)
+
+    def _take_all(self) -> List[_Browser]:
+        slots = [s for s in self._slots if s is not None] + self._draining
+        self._slots = [None] * self.size
+        self._draining = []
+        return slots
+
+    def stats(self) -> Dict[str, int]:
+        live = [s for s in self._slots if s is not None]
+        return {
+            "browsers": len(live),
+            "draining": len(self._draining),
+            "leased": sum(s.active for s in live + self._draining),
+            "idle_contexts": sum(len(s.idle) for s in live),
+            "launched": self.launched,
+            "retired": self.retired,
+        }
+
+class BrowserPool(_PoolBase):
+    """Sync Playwright pool; `launch(marker)` returns a browser (default: headless Chromium)."""
+
+    def __init__(self, launch: Optional[Callable[[str], Any]] = None, **kwargs: Any) -> None:
+        super().__init__(launch or self._launch_chromium, **kwargs)
+
+    def _launch_chromium(self, marker: str) -> Any:
+        if self._playwright is None:
+            from playwright.sync_api import sync_playwright  # heavy; only when a browser is needed
+
+            self._playwright = sync_playwright().start()
+        return self._playwright.chromium.launch(headless=True, args=[marker])
+
+    def _new_browser(self, index: int) -> _Browser:
+        marker = self._marker()
+        slot = self._slots[index] = _Browser(browser=self._launch(marker), marker=marker)
+        self.launched += 1
+        return slot
+
+    def start(self) -> None:
+        for i, slot in enumerate(self._slots):
+            if slot is None:
+                self._new_browser(i)
+
+    @contextmanager
+    def lease(self) -> Iterator[Any]:
+        slot = self._pick()
+        if isinstance(slot, int):
+            slot = self._new_browser(slot)
+        context = slot.idle.pop() if slot.idle else self._track(slot, slot.browser.new_context(**self.context_options))
+        slot.active += 1
+        clean = False
+        try:
+            yield context
+            clean = True
+        finally:
+            self._give_back(slot, context, clean)
+
+    def _give_back(self, slot: _Browser, context: Any, clean: bool) -> None:
+        reuse = self._returned(slot, context, clean)
+        if reuse:
+            try:
+                for page in list(context.pages):
+                    page.close()
+                context.clear_cookies()
+            except Exception:
+                log.warning("could not reset a pooled browser context; closing it", exc_info=True)
+                reuse = False
+        if reuse:
+            slot.idle.append(context)
+        else:
+            self._discarded(slot, context)
+            try:
+                context.close()
+            except Exception:
+                log.debug("closing a browser context failed", exc_info=True)
+        if self._settle(slot):
+            self._close_browser(slot)
+
+    def _close_browser(self, slot: _Browser) -> None:
+        try:
+            slot.browser.close()  # closes its contexts too
+        except Exception:
+            log.debug("closing a pooled browser failed", exc_info=True)
+
+    def close(self) -> None:
+        for slot in self._take_all():
+            self._close_browser(slot)
+        if self._playwright is not None:
+            try:
+                self._playwright.stop()
+            finally:
+                self._playwright = None
+
+class AsyncBrowserPool(_PoolBase):
+    """
+    The same pool on the async Playwright API, for the crawl engine (jd_parser.crawler); many
+    leases can be open on one browser at a time. `launch(marker)` is a coroutine function.
+    """
+
+    def __init__(self, launch: Optional[Callable[[str], Any]] = None, **kwargs: Any) -> None:
+        super().__init__(launch or self._launch_chromium, **kwargs)
+        self._launching = asyncio.Lock()
+
+    async def _launch_chromium(self, marker: str) -> Any:
+        if self._playwright is None:
+            from playwright.async_api import async_playwright  # heavy; only when a browser is needed
+
+            self._playwright = await async_playwright().start()
+        return await self._playwright.chromium.launch(headless=True, args=[marker])
+
+    async def _new_browser(self, index: int) -> _Browser:
+        marker = self._marker()
+        slot = self._slots[index] = _Browser(browser=await self._launch(marker), marker=marker)
+        self.launched += 1
+        return slot
+
+    async def start(self) -> None:
+        async with self._launching:
+            for i, slot in enumerate(self._slots):
+                if slot is None:
+                    await self._new_browser(i)
+
+    async def _acquire(self) -> Tuple[_Browser, Any]:
+        async with self._launching:  # one launch at a time, so two leases never fill the same slot
+            slot = self._pick()
+            if isinstance(slot, int):
+                slot = await self._new_browser(slot)
+            slot.active += 1
+        try:
+            if slot.idle:
+                return slot, slot.idle.pop()
+            return slot, self._track(slot, await slot.browser.new_context(**self.context_options))
+        except BaseException:
+            slot.active -= 1
+            raise
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[Any]:
+        slot, context = await self._acquire()
+        clean = False
+        try:
+            yield context
+            clean = True
+        finally:
+            await self._give_back(slot, context, clean)
+
+    async def _give_back(self, slot: _Browser, context: Any, clean: bool) -> None:
+        reuse = self._returned(slot, context, clean)
+        if reuse:
+            try:
+                for page in list(context.pages):
+                    await page.close()
+                await context.clear_cookies()
+            except Exception:
+                log.warning("could not reset a pooled browser context; closing it", exc_info=True)
+                reuse = False
+        if reuse:
+            slot.idle.append(context)
+        else:
+            self._discarded(slot, context)
+            try:
+                await context.close()
+            except Exception:
+                log.debug("closing a browser context failed", exc_info=True)
+        if self._settle(slot):
+            await self._close_browser(slot)
+
+    async def _close_browser(self, slot: _Browser) -> None:
+        try:
+            await slot.browser.close()
+        except Exception:
+            log.debug("closing a pooled browser failed", exc_info=True)
+
+    async def close(self) -> None:
+        for slot in self._take_all():
+            await self._close_browser(slot)
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            finally:
+                self._playwright = None
+
+class ThreadedBrowserPool:
+    """
+    Sync browsers shared by every thread: `run(fn)` queues `fn(context)` for one of up to `size`
+    browser threads (started as the queue needs them), each with its own BrowserPool(size=1),
+    and returns its result or raises its exception in the calling thread. `fn` runs on the
+    browser thread, so the context and its pages must not escape it.
+    """
+
+    def __init__(self, size: Optional[int] = None, pool_factory: Optional[Callable[[], BrowserPool]] = None) -> None:
+        self.size = max(1, settings.BROWSER_POOL_SIZE if size is None else size)
+        self._pool_factory = pool_factory or (lambda: BrowserPool(size=1))
+        self._jobs: "queue.Queue[Optional[Tuple[Callable[[Any], Any], Future]]]" = queue.Queue()
+        self._threads: List[threading.Thread] = []
+        self._busy = 0  # calls queued or running
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def run(self, fn: Callable[[Any], T]) -> T:
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("browser pool is closed")
+            self._busy += 1
+            if self._busy > len(self._threads) and len(self._threads) < self.size:
+                thread = threading.Thread(target=self._serve, name=f"browser-pool-{len(self._threads)}", daemon=True)
+                self._threads.append(thread)
+                thread.start()
+            self._jobs.put((fn, future))
+        return future.result()
+
+    def _serve(self) -> None:
+        pool = self._pool_factory()
+        try:
+            while True:
+                job = self._jobs.get()
+                if job is None:
+                    return
+                fn, future = job
+                try:
+                    with pool.lease() as context:
+                        result = fn(context)
+                except BaseException as exc:
+                    future.set_exception(exc)
+                else:
+                    future.set_result(result)
+                finally:
+                    with self._lock:
+                        self._busy -= 1
+        finally:
+            try:
+                pool.close()
+            except Exception:
+                log.debug("closing a browser thread's pool failed", exc_info=True)
+
+    def close(self, timeout: Optional[float] = 30.0) -> None:
+        """Stop the browser threads once the queued calls are done."""
+        with self._lock:
+            self._closed = True
+            threads, self._threads = self._threads, []
+        for _ in threads:
+            self._jobs.put(None)
+        for thread in threads:
+            thread.join(timeout)
+
+_shared: Optional[ThreadedBrowserPool] = None
+_shared_lock = threading.Lock()
+
+def get_browser_pool() -> ThreadedBrowserPool:
+    """The process-wide pool (created on first use, closed at exit)."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = ThreadedBrowserPool()
+        return _shared
+
+def close_browser_pool() -> None:
+    global _shared
+    with _shared_lock:
+        pool, _shared = _shared, None
+    if pool is not None:
+        try:
+            pool.close()
+        except Exception:
+            log.debug("closing the browser pool failed", exc_info=True)
+
+atexit.register(close_browser_pool)
@@ -0,0 +1,255 @@
+# src/auto_apply_ai/services/jd_parser/crawler.py
+"""
+Asyncio crawl engine for job pages, for use from the FastAPI app or any event loop (the sync
+scraper would block it).
+
+- targets are posting URLs keyed by host (`JobPosting.source_host`), from a list, an (async)
+  iterator such as `posting_targets()`, or an asyncio.Queue closed with a None sentinel; at most
+  CRAWL_MAX_QUEUED of them are buffered
+- at most CRAWL_CONCURRENCY fetches in flight overall and CRAWL_PER_HOST per host, with at
+  least CRAWL_HOST_DELAY_SECONDS between two fetch starts on the same host; a busy or cooling
+  host never holds up the others
+- each fetch gets CRAWL_FETCH_TIMEOUT_SECONDS; a failure or timeout becomes a CrawlResult with
+  `error` set instead of stopping the crawl
+- `crawl()` yields results in completion order; leaving the loop (break, exception, task
+  cancellation) cancels the fetches still running
+- `parse_results()` is the parsing stage: LLM parsing of each page in worker threads,
+  CRAWL_PARSE_CONCURRENCY at a time
+
+The default fetch is jd_parser.tiered.TieredFetcher (static HTTP + JSON-LD first, then the
+AsyncBrowserPool), which returns FetchedPage; pass `fetch=` for anything else (tests use plain
+HTTP).
+"""
+from __future__ import annotations
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import aclosing
+from dataclasses import dataclass
+from typing import (
+    Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Deque, Dict, Iterable, Optional, Sequence, Set, Union
+)
+from urllib.parse import urlsplit
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from auto_apply_ai.config.settings import settings
+from auto_apply_ai.models.entities import JobPosting
+from auto_apply_ai.services.jd_parser.schemas import JobDesc
+from auto_apply_ai.services.jd_parser.tiered import FetchedPage, TieredFetcher
+
+log = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class CrawlTarget:
+    url: str
+    host: str
+    posting_id: Optional[str] = None
+
+    @classmethod
+    def of(cls, target: Union["CrawlTarget", str]) -> "CrawlTarget":
+        if isinstance(target, CrawlTarget):
+            return target
+        return cls(url=target, host=(urlsplit(target).hostname or "").lower())
+
+@dataclass
+class CrawlResult:
+    target: CrawlTarget
+    content: Any = None
+    error: Optional[str] = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+Fetch = Callable[[CrawlTarget], Awaitable[Any]]
+Targets = Union[Iterable[Union[CrawlTarget, str]], AsyncIterable[Union[CrawlTarget, str]], "asyncio.Queue[Any]"]
+
+async def posting_targets(session: AsyncSession, statuses: Sequence[str] = ("new",)) -> AsyncIterator[CrawlTarget]:
+    """Postings to (re)fetch, streamed in id order."""
+    stmt = (
+        select(JobPosting.id, JobPosting.canonical_url, JobPosting.source_host)
+        .where(JobPosting.status.in_(statuses))
+        .order_by(JobPosting.id)
+    )
+    async for posting_id, url, host in await session.stream(stmt):
+        yield CrawlTarget(url=url, host=host, posting_id=posting_id)
+
+async def _iterate(targets: Targets) -> AsyncIterator[Union[CrawlTarget, str]]:
+    if isinstance(targets, asyncio.Queue):
+        while (item := await targets.get()) is not None:
+            yield item
+    elif hasattr(targets, "__aiter__"):
+        async for item in targets:
+            yield item
+    else:
+        for item in targets:
+            yield item
+
+class CrawlEngine:
+    def __init__(
+        self,
+        fetch: Optional[Fetch] = None,
+        concurrency: Optional[int] = None,
+        per_host: Optional[int] = None,
+        host_delay: Optional[float] = None,
+        timeout: Optional[float] = None,
+        max_queued: Optional[int] = None,
+    ) -> None:
+        """Without `fetch`, each crawl() uses a TieredFetcher with its own AsyncBrowserPool."""
+        self.fetch = fetch
+        self.concurrency = max(1, settings.CRAWL_CONCURRENCY if concurrency is None else concurrency)
+        self.per_host = max(1, settings.CRAWL_PER_HOST if per_host is None else per_host)
+        self.host_delay = settings.CRAWL_HOST_DELAY_SECONDS if host_delay is None else host_delay
+        self.timeout = settings.CRAWL_FETCH_TIMEOUT_SECONDS if timeout is None else timeout
+        self.max_queued = max(1, settings.CRAWL_MAX_QUEUED if max_queued is None else max_queued)
+
+    async def crawl(self, targets: Targets) -> AsyncIterator[CrawlResult]:
+        fetcher = TieredFetcher(timeout=self.timeout) if self.fetch is None else None
+        fetch = self.fetch or fetcher
+        try:
+            # aclosing: an early exit must reach _crawl's cleanup now, not when it is garbage collected
+            async with aclosing(self._crawl(targets, fetch)) as results:
+                async for result in results:
+                    yield result
+        finally:
+            if fetcher is not None:
+                await fetcher.aclose()
+
+    async def _fetch_one(self, fetch: Fetch, target: CrawlTarget) -> CrawlResult:
+        start = time.perf_counter()
+        try:
+            content = await asyncio.wait_for(fetch(target), self.timeout) if self.timeout > 0 else await fetch(target)
+            return CrawlResult(target, content=content, elapsed=time.perf_counter() - start)
+        except asyncio.TimeoutError:
+            error = f"timed out after {self.timeout:g}s"
+        except Exception as exc:
+            error = f"{type(exc).__name__}: {exc}"
+        return CrawlResult(target, error=error, elapsed=time.perf_counter() - start)
+
+    async def _crawl(self, targets: Targets, fetch: Fetch) -> AsyncIterator[CrawlResult]:
+        queues: Dict[str, Deque[CrawlTarget]] = {}
+        in_flight: Dict[str, int] = {}
+        next_start: Dict[str, float] = {}
+        running: Set[asyncio.Task] = set()
+        done: Deque[CrawlResult] = deque()
+        buffer = asyncio.Semaphore(self.max_queued)
+        wake = asyncio.Event()
+        fed = False
+
+        async def feed() -> None:
+            nonlocal fed
+            try:
+                async for item in _iterate(targets):
+                    await buffer.acquire()
+                    target = CrawlTarget.of(item)
+                    queues.setdefault(target.host, deque()).append(target)
+                    wake.set()
+            finally:
+                fed = True
+                wake.set()
+
+        def finished(task: asyncio.Task) -> None:
+            running.discard(task)
+            if not task.cancelled():
+                result = task.result()
+                in_flight[result.target.host] -= 1
+                done.append(result)
+            wake.set()
+
+        feeder = asyncio.create_task(feed(), name="crawl-feed")
+        try:
+            while True:
+                now = time.monotonic()
+                soonest: Optional[float] = None
+                for host in list(queues):
+                    queue, started = queues[host], False
+                    while queue and len(running) < self.concurrency and in_flight.get(host, 0) < self.per_host:
+                        ready_at = next_start.get(host, 0.0)
+                        if ready_at > now:
+                            soonest = ready_at if soonest is None else min(soonest, ready_at)
+                            break
+                        target = queue.popleft()
+                        buffer.release()
+                        in_flight[host] = in_flight.get(host, 0) + 1
+                        next_start[host] = now + self.host_delay
+                        task = asyncio.create_task(self._fetch_one(fetch, target))
+                        running.add(task)
+                        task.add_done_callback(finished)
+                        started = True
+                    if started:
+                        queues[host] = queues.pop(host)  # round-robin: other hosts go first next pass
+                while done:
+                    yield done.popleft()
+                if feeder.done() and feeder.exception() is not None:
+                    raise feeder.exception()
+                if fed and not running and not any(queues.values()):
+                    return
+                wake.clear()
+                if done:
+                    continue
+                wait = None if soonest is None else max(0.0, soonest - time.monotonic())
+                try:
+                    await asyncio.wait_for(wake.wait(), wait)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            feeder.cancel()
+            for task in running:
+                task.cancel()
+            await asyncio.gather(feeder, *running, return_exceptions=True)
+
+async def parse_results(
+    results: AsyncIterable[CrawlResult],
+    api_key: Optional[str] = None,
+    model: str = "gemini-2.0-flash-lite",
+    concurrency: Optional[int] = None,
+    parse: Optional[Callable[[Any], Optional[JobDesc]]] = None,
+) -> AsyncIterator[tuple[CrawlResult, Optional[JobDesc]]]:
+    """(result, JobDesc or None) per crawled page, in completion order; failed fetches pass through unparsed."""
+    if parse is None:
+        from auto_apply_ai.services.jd_parser.scraper import parse_jd_with_llm, parse_page
+
+        def parse(content: Any) -> Optional[JobDesc]:
+            if isinstance(content, FetchedPage):
+                return parse_page(content, api_key=api_key, model=model)
+            return parse_jd_with_llm(content, api_key=api_key, model=model)
+
+    slots = asyncio.Semaphore(max(1, settings.CRAWL_PARSE_CONCURRENCY if concurrency is None else concurrency))
+    out: asyncio.Queue = asyncio.Queue()
+    pending: Set[asyncio.Task] = set()
+
+    async def run(result: CrawlResult) -> None:
+        try:
+            job = await asyncio.to_thread(parse, result.content) if result.ok else None
+        except Exception:
+            log.exception("parsing %s failed", result.target.url)
+            job = None
+        finally:
+            slots.release()
+        await out.put((result, job))
+
+    async def produce() -> None:
+        try:
+            async for result in results:
+                await slots.acquire()
+                task = asyncio.create_task(run(result))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+            await asyncio.gather(*pending)
+        finally:
+            out.put_nowait(None)
+
+    producer = asyncio.create_task(produce(), name="crawl-parse")
+    try:
+        while (item := await out.get()) is not None:
+            yield item
+        await producer
+    finally:
+        producer.cancel()
+        for task in list(pending):
+            task.cancel()
+        await asyncio.gather(producer, *pending, return_exceptions=True)
@@ -0,0 +1,186 @@
+# src/auto_apply_ai/services/jd_parser/page_profiles.py
+"""
+Page-load profiles for the browser tiers: what to abort while a job page loads and when the
+page counts as ready, per ATS type (models.entities.ATSTypes; `detect_ats` maps a URL to one).
+
+- routing: known trackers / analytics / chat widgets are always aborted (PAGE_BLOCK_TRACKERS);
+  the "browser_lite" tier also aborts the profile's resource types (images, media, fonts,
+  stylesheets ...) and, where the profile says so, scripts and XHR from third-party hosts that
+  are not on its allow-list (the ATS's own CDNs)
+- readiness: instead of `networkidle` (which long-polling trackers can hold off for the whole
+  timeout) the page is loaded to DOMContentLoaded, then ready once one of the profile's
+  description selectors holds `min_chars` of text, or the whole body holds
+  `body_min_chars`. If neither happens within PAGE_READY_TIMEOUT_SECONDS the page is used as
+  it is; the tier's text check decides whether to escalate
+
+`load_page` (sync; jd_parser.scraper.open_page) and `load_page_async` (TieredFetcher) apply a
+profile to a new page in a browser context.
+"""
+from __future__ import annotations
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+from urllib.parse import urlsplit
+
+from auto_apply_ai.config.settings import settings
+from auto_apply_ai.models.entities import ATSTypes
+
+log = logging.getLogger(__name__)
+
+# Host suffixes that never carry page content
+TRACKER_HOSTS: Tuple[str, ...] = (
+    "google-analytics.com", "googletagmanager.com", "doubleclick.net", "googleadservices.com",
+    "googlesyndication.com", "facebook.net", "connect.facebook.com", "hotjar.com", "hotjar.io",
+    "segment.io", "segment.com", "mixpanel.com", "amplitude.com", "fullstory.com", "clarity.ms",
+    "bat.bing.com", "snap.licdn.com", "px.ads.linkedin.com", "ads-twitter.com", "analytics.tiktok.com",
+    "nr-data.net", "newrelic.com", "optimizely.com", "intercom.io", "intercomcdn.com", "drift.com",
+    "driftt.com", "qualtrics.com", "adroll.com", "quantserve.com", "scorecardresearch.com",
+    "pendo.io", "heapanalytics.com", "cookielaw.org", "onetrust.com", "cookiebot.com",
+)
+_ATS_HOSTS: Tuple[Tuple[str, str], ...] = (
+    ("myworkdayjobs.com", "workday"), ("myworkdaysite.com", "workday"), ("workday.com", "workday"),
+    ("greenhouse.io", "greenhouse"), ("lever.co", "lever"), ("smartrecruiters.com", "smartrecruiters"),
+    ("icims.com", "icims"), ("taleo.net", "taleo"), ("ashbyhq.com", "ashby"), ("bamboohr.com", "bamboohr"),
+    ("teamtailor.com", "teamtailor"),
+)
+_LITE_TYPES = frozenset({"image", "media", "font", "stylesheet", "texttrack", "eventsource", "websocket", "manifest"})
+
+@dataclass(frozen=True)
+class PageProfile:
+    ats_type: str
+    ready_selectors: Tuple[str, ...] = ()
+    min_chars: int = 200           # text a ready selector must hold
+    body_min_chars: int = 1500     # or the whole body (text-density fallback)
+    lite_block_types: FrozenSet[str] = _LITE_TYPES
+    block_third_party_scripts: bool = False  # lite tier: scripts/XHR from hosts not first-party or allowed
+    allow_hosts: Tuple[str, ...] = ()        # host suffixes treated as first-party (the ATS's CDNs)
+
+PROFILES: Dict[str, PageProfile] = {
+    "workday": PageProfile(
+        "workday", ("[data-automation-id=jobPostingDescription]", "[data-automation-id=job-posting-details]"),
+        allow_hosts=("myworkdayjobs.com", "myworkdaycdn.com", "myworkdaysite.com", "workday.com"),
+        block_third_party_scripts=True,
+    ),
+    "greenhouse": PageProfile(
+        "greenhouse", (".job__description", "#content .job-post", "#content"),
+        allow_hosts=("greenhouse.io",), block_third_party_scripts=True,
+    ),
+    "lever": PageProfile(
+        "lever", ("[data-qa=job-description]", ".posting-page .section-wrapper", ".posting-page"),
+        allow_hosts=("lever.co",), block_third_party_scripts=True,
+    ),
+    "smartrecruiters": PageProfile(
+        "smartrecruiters", ("[itemprop=description]", ".job-sections", "main"),
+        allow_hosts=("smartrecruiters.com", "smrtr.io"), block_third_party_scripts=True,
+    ),
+    "icims": PageProfile("icims", (".iCIMS_JobContent", ".iCIMS_InfoMsg_Job", "#iCIMS_Content"), allow_hosts=("icims.com",)),
+    "taleo": PageProfile("taleo", (".jobdescription", "#requisitionDescriptionInterface", ".editablesection"),
+                         allow_hosts=("taleo.net",)),
+    "ashby": PageProfile(
+        "ashby", (".ashby-job-posting-description", "[class*=_descriptionText]", "main"),
+        allow_hosts=("ashbyhq.com", "ashbyprd.com"), block_third_party_scripts=True,
+    ),
+    "bamboohr": PageProfile("bamboohr", (".BambooRich", "[class*=jobDescription]", "main"), allow_hosts=("bamboohr.com",)),
+    "teamtailor": PageProfile("teamtailor", ("[data-controller=job]", ".job-ad-body", "main"),
+                              allow_hosts=("teamtailor.com", "teamtailor-cdn.com")),
+    "unknown": PageProfile("unknown", ("main", "[role=main]", "article", "#job-description", ".job-description")),
+}
+assert set(PROFILES) == set(ATSTypes)
+
+# Resolved once the selector holds min_chars of text, or the body holds body_min_chars
+READY_SCRIPT = """([selectors, minChars, bodyMinChars]) => {
+  for (const selector of selectors) {
+    const node = document.querySelector(selector);
+    if (node && (node.innerText || "").trim().length >= minChars) return true;
+  }
+  return !!document.body && (document.body.innerText || "").trim().length >= bodyMinChars;
+}"""
+
+def _host(url: str) -> str:
+    return (urlsplit(url).hostname or "").lower()
+
+def _matches(host: str, suffixes: Tuple[str, ...]) -> bool:
+    return any(host == s or host.endswith("." + s) for s in suffixes)
+
+def _site(host: str) -> str:
+    """Rough registrable domain (last two labels) for first-party checks."""
+    return ".".join(host.rsplit(".", 2)[-2:])
+
+def detect_ats(url: str) -> str:
+    host = _host(url)
+    return next((ats for suffix, ats in _ATS_HOSTS if _matches(host, (suffix,))), "unknown")
+
+def profile_for(url: str, ats_type: Optional[str] = None) -> PageProfile:
+    return PROFILES.get(ats_type or detect_ats(url), PROFILES["unknown"])
+
+def should_block(profile: PageProfile, page_url: str, request_url: str, resource_type: str, lite: bool) -> bool:
+    host = _host(request_url)
+    if settings.PAGE_BLOCK_TRACKERS and _matches(host, TRACKER_HOSTS):
+        return True
+    if not lite:
+        return False
+    if resource_type in profile.lite_block_types:
+        return True
+    if profile.block_third_party_scripts and resource_type in ("script", "xhr", "fetch"):
+        first_party = _site(host) == _site(_host(page_url)) or _matches(host, profile.allow_hosts)
+        return not first_party
+    return False
+
+def _ready_args(profile: PageProfile) -> list:
+    return [list(profile.ready_selectors), profile.min_chars, profile.body_min_chars]
+
+def _timeouts(timeout: Optional[float]) -> Tuple[float, float]:
+    """(goto, readiness) timeouts in ms; readiness never outlasts the fetch's own timeout."""
+    load = settings.PAGE_LOAD_TIMEOUT_SECONDS if timeout is None else min(timeout, settings.PAGE_LOAD_TIMEOUT_SECONDS)
+    return load * 1000, min(load, settings.PAGE_READY_TIMEOUT_SECONDS) * 1000
+
+def load_page(
+    context: Any, url: str, lite: bool = False, profile: Optional[PageProfile] = None, timeout: Optional[float] = None
+) -> Any:
+    """
+    New page in a sync Playwright context with the profile's routing, loaded to
+    DOMContentLoaded and then to readiness; the caller closes it.
+    """
+    profile = profile or profile_for(url)
+    goto_ms, ready_ms = _timeouts(timeout)
+    page = context.new_page()
+    try:
+        page.route("**/*", lambda route: (
+            route.abort() if should_block(profile, url, route.request.url, route.request.resource_type, lite)
+            else route.continue_()
+        ))
+        page.goto(url, wait_until="domcontentloaded", timeout=goto_ms)
+        try:
+            page.wait_for_function(READY_SCRIPT, arg=_ready_args(profile), timeout=ready_ms)
+        except Exception as exc:  # playwright TimeoutError: use the page as it is
+            log.debug("%s not ready (%s profile): %s", url, profile.ats_type, exc)
+    except BaseException:
+        page.close()
+        raise
+    return page
+
+async def load_page_async(
+    context: Any, url: str, lite: bool = False, profile: Optional[PageProfile] = None, timeout: Optional[float] = None
+) -> Any:
+    """load_page on the async Playwright API."""
+    profile = profile or profile_for(url)
+    goto_ms, ready_ms = _timeouts(timeout)
+    page = await context.new_page()
+
+    async def route_handler(route: Any) -> None:
+        if should_block(profile, url, route.request.url, route.request.resource_type, lite):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    try:
+        await page.route("**/*", route_handler)
+        await page.goto(url, wait_until="domcontentloaded", timeout=goto_ms)
+        try:
+            await page.wait_for_function(READY_SCRIPT, arg=_ready_args(profile), timeout=ready_ms)
+        except Exception as exc:
+            log.debug("%s not ready (%s profile): %s", url, profile.ats_type, exc)
+    except BaseException:
+        await page.close()
+        raise
+    return page
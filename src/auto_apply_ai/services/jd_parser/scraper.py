@@ -1,39 +1,159 @@
 import os
-import requests
-from bs4 import BeautifulSoup
 import json
+import logging
+import threading
 from html import unescape
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.output_parsers import JsonOutputParser
 import sys
 import asyncio
 from pathlib import Path
-from playwright.sync_api import sync_playwright
 try:
     from .schemas import JobDesc
+    from .browser_pool import get_browser_pool
+    from .tiered import (
+        FetchedPage, TierRun, fetch_plan, merge_fields, static_from_response, tier_stats, url_host
+    )
+    from .page_profiles import load_page
+    from .strategy import strategy_table
 except Exception:
     # Allow running this file directly as a script
     sys.path.append(str(Path(__file__).resolve().parents[3] / "src"))
     from auto_apply_ai.services.jd_parser.schemas import JobDesc
+    from auto_apply_ai.services.jd_parser.browser_pool import get_browser_pool
+    from auto_apply_ai.services.jd_parser.tiered import (
+        FetchedPage, TierRun, fetch_plan, merge_fields, static_from_response, tier_stats, url_host
+    )
+    from auto_apply_ai.services.jd_parser.page_profiles import load_page
+    from auto_apply_ai.services.jd_parser.strategy import strategy_table
+from auto_apply_ai.config.settings import settings
+import time
 from typing import Optional
 
+log = logging.getLogger(__name__)
+_strategy_lock = threading.Lock()
 
 
 def open_browser():
+    from playwright.sync_api import sync_playwright  # heavy; only when a browser is needed
+
     p = sync_playwright().start()
     browser = p.chromium.launch(headless=True)
     context = browser.new_context()
     return p, browser, context
 
 
-def open_page(context, url: str):
-    page = context.new_page()
-    page.goto(url, wait_until="networkidle", timeout=60000)
-    return page
-    
+def open_page(context, url: str, lite: bool = False, profile=None):
+    """
+    Load `url` with the page-load profile of its ATS (jd_parser.page_profiles): trackers (and,
+    when lite, heavy resources) aborted, ready on the description selector or text density
+    rather than network idle.
+    """
+    return load_page(context, url, lite=lite, profile=profile)
+
+
+def snapshot_page(context, url: str, lite: bool = False):
+    page = open_page(context, url, lite=lite)
+    try:
+        return page.accessibility.snapshot()
+    finally:
+        page.close()
+
+
+def snapshot_fresh_browser(url: str, lite: bool = False):
+    """Launch-per-call path (BROWSER_POOL_SIZE=0)."""
+    p = browser = context = None
+    try:
+        p, browser, context = open_browser()
+        return snapshot_page(context, url, lite)
+    finally:
+        try:
+            if browser:
+                browser.close()
+        finally:
+            if p:
+                p.stop()
+
+
+def snapshot_browser(url: str, lite: bool = False):
+    """
+    Snapshot on the process-wide browser pool. Safe from any thread: the snapshot runs on one
+    of the pool's BROWSER_POOL_SIZE browser threads, which are stopped at exit (or by
+    browser_pool.close_browser_pool()), so callers never own a browser.
+    """
+    if settings.BROWSER_POOL_SIZE > 0:
+        return get_browser_pool().run(lambda context: snapshot_page(context, url, lite))
+    return snapshot_fresh_browser(url, lite)
+
+
+def fetch_static(url: str):
+    from auto_apply_ai.services.http_client import http_client
+
+    return static_from_response(http_client.sync_client.get(url), url)
 
 
+def fetch_tier(tier: str, url: str):
+    if tier == "static":
+        page = fetch_static(url)
+        return page.text, page.fields
+    return snapshot_browser(url, lite=tier == "browser_lite"), {}
+
+
+def load_strategies():
+    """The strategy table, loaded from host_fetch_stats on first use; None when disabled."""
+    if not settings.FETCH_STRATEGY_ENABLED:
+        return None
+    if not strategy_table.loaded:
+        with _strategy_lock:  # the first fetches of a thread pool start together
+            if not strategy_table.loaded:
+                try:
+                    strategy_table.load_sync()
+                except Exception:
+                    log.warning("could not load host fetch strategies; starting empty", exc_info=True)
+                    strategy_table.loaded = True
+    return strategy_table
+
+
+def flush_strategies():
+    """Save the changed host_fetch_stats rows (skipped while another thread is saving)."""
+    if not _strategy_lock.acquire(blocking=False):
+        return
+    try:
+        strategy_table.flush_sync()
+    except Exception:
+        log.warning("could not save host fetch strategies", exc_info=True)
+    finally:
+        _strategy_lock.release()
+
+
+def fetch_page(url: str) -> FetchedPage:
+    """
+    Sync tiered fetch (see jd_parser.tiered): start at the cheapest tier that works for the
+    host, escalate while the page yields too little description text. The strategy table is
+    loaded on the first fetch and saved every FETCH_STRATEGY_FLUSH_EVERY attempts.
+    """
+    strategies = load_strategies()
+    host = url_host(url)
+    run = TierRun(url, host, settings.FETCH_STATIC_MIN_CHARS, tier_stats, strategies)
+    try:
+        for tier in fetch_plan(host, settings.FETCH_STATIC_FIRST, strategies):
+            t = time.perf_counter()
+            try:
+                content, fields = fetch_tier(tier, url)
+                error = None
+            except Exception as exc:
+                content, fields, error = None, {}, exc
+            page = run.observe(tier, content, fields, error, time.perf_counter() - t)
+            if page is not None:
+                return page
+        return run.result()
+    finally:
+        if strategies is not None and strategies.pending >= settings.FETCH_STRATEGY_FLUSH_EVERY:
+            flush_strategies()
+
+
+def parse_page(page: FetchedPage, api_key: str, model: str = "gemini-2.0-flash-lite"):
+    """LLM parse of a fetched page; JSON-LD fields from the page override the LLM's."""
+    return merge_fields(parse_jd_with_llm(page.content, api_key=api_key, model=model), page.fields)
+
 
 def parse_jd_with_llm(content: str, api_key: str, model: str = "gemini-2.0-flash-lite") -> Optional[JobDesc]:
     """
@@ -41,6 +161,7 @@ def parse_jd_with_llm(content: str, api_key: str, model: str = "gemini-2.0-flash
     
     Args:
         content: Accessibility (AX) tree snapshot (e.g., from Playwright's page.accessibility.snapshot())
+            or the plain description text of a server-rendered page
         api_key: Google Generative AI API key
         model: Gemini model to use (default: gemini-2.0-flash-lite)
     
@@ -50,6 +171,11 @@ def parse_jd_with_llm(content: str, api_key: str, model: str = "gemini-2.0-flash
     if not content:
         return None
     
+    # langchain is heavy; only import it when a page is actually parsed
+    from langchain_google_genai import ChatGoogleGenerativeAI
+    from langchain_core.prompts import ChatPromptTemplate
+    from langchain_core.output_parsers import JsonOutputParser
+
     try:
         # Initialize the LLM (Gemini)
         llm = ChatGoogleGenerativeAI(
@@ -60,10 +186,10 @@ def parse_jd_with_llm(content: str, api_key: str, model: str = "gemini-2.0-flash
         
         # Create the prompt template
         prompt = ChatPromptTemplate.from_template("""
-        You are an expert at parsing job descriptions from accessibility (AX) trees.
-        The input is an accessibility snapshot representing the structure and text content of a job page. It consists of roles, names, values, and children rather than raw HTML.
+        You are an expert at parsing job descriptions from accessibility (AX) trees and page text.
+        The input is either an accessibility snapshot representing the structure and text content of a job page (roles, names, values, and children rather than raw HTML), or the plain text of the job description.
         
-        AX Tree Input:
+        Input:
         {ax_content}
         
         Extract the following fields for the JobDesc schema and return **valid JSON**:
@@ -105,8 +231,10 @@ def parse_jd_with_llm(content: str, api_key: str, model: str = "gemini-2.0-flash
 
 def fetch_and_parse_job(url: str, api_key: Optional[str] = None, model: str = "gemini-2.0-flash-lite") -> Optional[JobDesc]:
     """
-    High-level orchestration: given a job posting URL, launch a headless browser,
-    capture the page accessibility (AX) snapshot, and parse it into a JobDesc via LLM.
+    High-level orchestration: given a job posting URL, fetch it with the tiered fetch
+    (plain HTTP + JSON-LD, then a pooled headless browser for the accessibility (AX)
+    snapshot, starting at the tier that works for the host), and parse it into a JobDesc
+    via LLM. Thread-safe; the browsers are shared by all calling threads (see snapshot_browser).
 
     Args:
         url: Job description URL
@@ -119,22 +247,12 @@ def fetch_and_parse_job(url: str, api_key: Optional[str] = None, model: str = "g
     if not api_key:
         api_key = os.getenv("GEMINI_KEY")
 
-    p = browser = context = None
     try:
-        p, browser, context = open_browser()
-        page = open_page(context, url)
-        ax = page.accessibility.snapshot()
-        return parse_jd_with_llm(ax, api_key=api_key, model=model)
+        return parse_page(fetch_page(url), api_key=api_key, model=model)
     except Exception as e:
         print(f"Error in fetch_and_parse_job: {e}")
         return None
-    finally:
-        try:
-            if browser:
-                browser.close()
-        finally:
-            if p:
-                p.stop()
+
 
 
 if __name__ == "__main__":
@@ -0,0 +1,186 @@
+# src/auto_apply_ai/services/jd_parser/static_page.py
+"""
+Job details from server-rendered HTML, without a browser (the static tier of jd_parser.tiered).
+
+- `schema.org/JobPosting` JSON-LD (Greenhouse, Lever, Workday, most career sites) maps straight
+  onto JobDesc fields: title, hiring organization, location / remote, employment type, salary,
+  experience, skills; its `description` becomes the page text
+- otherwise the text of the description container: known ATS containers, then <main>,
+  [role=main], <article>, then <body> without scripts, navigation, header and footer
+- og:title / og:site_name fill role and company when there is no JSON-LD
+
+bs4 + lxml are imported on first use (jd_parser.scraper stays cheap to import).
+"""
+from __future__ import annotations
+import json
+import re
+from dataclasses import dataclass, field
+from html import unescape
+from typing import Any, Dict, Iterator, List, Optional
+
+# Description containers of the common ATS pages, tried before the generic landmarks
+_CONTAINERS = (
+    "[data-automation-id=jobPostingDescription]",  # workday
+    ".job__description", "#content .job-post", "#content",  # greenhouse
+    "[data-qa=job-description]", ".posting-page .section-wrapper",  # lever
+    ".ashby-job-posting-description", "#job-description", ".job-description",
+    "main", "[role=main]", "article",
+)
+_NOISE = ("script", "style", "noscript", "template", "svg", "nav", "header", "footer", "form", "iframe")
+_WS = re.compile(r"[ \t\r\f\v]+")
+_BLANKS = re.compile(r"\n\s*\n+")
+
+@dataclass
+class StaticPage:
+    url: str
+    text: str = ""
+    fields: Dict[str, Any] = field(default_factory=dict)  # JobDesc fields found on the page
+    source: str = "none"  # "json-ld", the CSS selector the text came from, or "body"
+
+    @property
+    def chars(self) -> int:
+        return len(self.text)
+
+def _clean(text: str) -> str:
+    return _BLANKS.sub("\n\n", "\n".join(_WS.sub(" ", line).strip() for line in text.splitlines())).strip()
+
+def html_text(fragment: str) -> str:
+    """Readable text of an HTML fragment (JSON-LD descriptions are HTML, often entity-escaped)."""
+    from bs4 import BeautifulSoup
+
+    if "<" not in fragment and "&lt;" in fragment:
+        fragment = unescape(fragment)
+    return _clean(BeautifulSoup(fragment, "lxml").get_text("\n"))
+
+def _walk(node: Any) -> Iterator[Dict[str, Any]]:
+    """Every JSON-LD object, through @graph and nested lists."""
+    if isinstance(node, list):
+        for item in node:
+            yield from _walk(item)
+    elif isinstance(node, dict):
+        yield node
+        yield from _walk(node.get("@graph", []))
+
+def _is_job_posting(node: Dict[str, Any]) -> bool:
+    kind = node.get("@type")
+    kinds = kind if isinstance(kind, list) else [kind]
+    return any(isinstance(k, str) and k.rsplit("/", 1)[-1] == "JobPosting" for k in kinds)
+
+def _name(value: Any) -> Optional[str]:
+    if isinstance(value, list):
+        value = value[0] if value else None
+    if isinstance(value, dict):
+        value = value.get("name")
+    return value.strip() or None if isinstance(value, str) else None
+
+def _strings(value: Any) -> List[str]:
+    if isinstance(value, str):
+        return [s.strip() for s in re.split(r"[,;\n]", value) if s.strip()]
+    if isinstance(value, list):
+        return [s for v in value for s in _strings(_name(v) if isinstance(v, dict) else v)]
+    return []
+
+def _location(posting: Dict[str, Any]) -> Optional[str]:
+    places = posting.get("jobLocation")
+    places = places if isinstance(places, list) else [places] if places else []
+    names = []
+    for place in places:
+        address = place.get("address") if isinstance(place, dict) else None
+        if isinstance(address, dict):
+            parts = [_name(address.get(k)) for k in ("addressLocality", "addressRegion", "addressCountry")]
+            label = ", ".join(dict.fromkeys(p for p in parts if p))
+        else:
+            label = _name(address) or _name(place)
+        if label and label not in names:
+            names.append(label)
+    remote = str(posting.get("jobLocationType", "")).upper() == "TELECOMMUTE"
+    if remote:
+        names.insert(0, "Remote")
+    return "; ".join(names) or None
+
+def _salary(value: Any) -> Optional[Dict[str, Any]]:
+    if not isinstance(value, dict):
+        return None
+    amount = value.get("value")
+    low = high = None
+    if isinstance(amount, dict):
+        low = amount.get("minValue", amount.get("value"))
+        high = amount.get("maxValue", amount.get("value"))
+    elif isinstance(amount, (int, float, str)):
+        low = high = amount
+    try:
+        low = float(low) if low is not None else None
+        high = float(high) if high is not None else None
+    except (TypeError, ValueError):
+        return None
+    if low is None and high is None:
+        return None
+    return {"min": low, "max": high, "currency": value.get("currency")}
+
+def _years(value: Any) -> Optional[Dict[str, int]]:
+    if isinstance(value, dict) and value.get("monthsOfExperience") is not None:
+        try:
+            return {"min": int(float(value["monthsOfExperience"]) // 12)}
+        except (TypeError, ValueError):
+            return None
+    return None
+
+def job_posting_fields(posting: Dict[str, Any]) -> Dict[str, Any]:
+    """JobDesc fields from one schema.org JobPosting object (only the ones it has)."""
+    employment = posting.get("employmentType")
+    fields: Dict[str, Any] = {
+        "role": _name(posting.get("title")),
+        "company": _name(posting.get("hiringOrganization")),
+        "location": _location(posting),
+        "employment_type": ", ".join(_strings(employment)).replace("_", " ").title() or None,
+        "salary": _salary(posting.get("baseSalary") or posting.get("estimatedSalary")),
+        "years_experience": _years(posting.get("experienceRequirements")),
+        "tools": _strings(posting.get("skills")),
+        "keywords": _strings(posting.get("occupationalCategory")) + _strings(posting.get("industry")),
+    }
+    meta = {k: posting[v] for k, v in (("date_posted", "datePosted"), ("valid_through", "validThrough"))
+            if isinstance(posting.get(v), str)}
+    identifier = posting.get("identifier")
+    if isinstance(identifier, dict) and identifier.get("value") is not None:
+        meta["ats_req_id"] = str(identifier["value"])
+    if meta:
+        fields["meta"] = meta
+    return {k: v for k, v in fields.items() if v not in (None, [], {})}
+
+def extract_page(html: str, url: str) -> StaticPage:
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "lxml")
+    page = StaticPage(url=url)
+    for script in soup.find_all("script", type="application/ld+json"):
+        try:
+            data = json.loads(script.string or script.get_text() or "null", strict=False)
+        except ValueError:
+            continue
+        posting = next((n for n in _walk(data) if _is_job_posting(n)), None)
+        if posting is not None:
+            page.fields = job_posting_fields(posting)
+            page.fields.setdefault("meta", {})["source"] = "json-ld"
+            description = posting.get("description")
+            if isinstance(description, str):
+                page.text, page.source = html_text(description), "json-ld"
+            break
+    if not page.fields:
+        og = {m.get("property"): m.get("content") for m in soup.find_all("meta", property=True)}
+        page.fields = {k: v.strip() for k, v in (("role", og.get("og:title")), ("company", og.get("og:site_name")))
+                       if isinstance(v, str) and v.strip()}
+
+    if page.text:
+        return page
+    for tag in soup(_NOISE):
+        tag.decompose()
+    for selector in _CONTAINERS:
+        node = soup.select_one(selector)
+        if node is not None:
+            text = _clean(node.get_text("\n"))
+            if text:
+                page.text, page.source = text, selector
+                return page
+    if soup.body is not None:
+        page.text, page.source = _clean(soup.body.get_text("\n")), "body"
+    return page
@@ -0,0 +1,216 @@
+# src/auto_apply_ai/services/jd_parser/strategy.py
+"""
+Per-host fetch strategy: which tier (jd_parser.tiered) to start at for a `source_host`, from
+how each tier did there before, so a static host never gets a browser and a JS-only host
+doesn't pay for a useless GET first.
+
+- every attempt is recorded per (host, tier): attempts, successes ("hit"), and the last
+  FETCH_STRATEGY_WINDOW outcomes with latencies, giving a recent success rate and median
+  latency
+- a fetch starts at the cheapest tier that is not known to fail there (a tier fails on a host
+  once it has FETCH_STRATEGY_MIN_SAMPLES recent attempts below FETCH_STRATEGY_MIN_SUCCESS_RATE)
+  and escalates from there as before
+- every FETCH_STRATEGY_REPROBE_EVERY-th fetch on a host starts at the cheapest tier again, so
+  a host that stopped needing JavaScript (or a tier that failed for a while) is noticed
+- the table lives in memory (thread-safe; the sync scraper and the crawl engine share it) and
+  is persisted to host_fetch_stats: `load()` once, `flush()` writes the rows that changed;
+  `load_sync()` / `flush_sync()` do the same for callers without an event loop, on a private
+  loop thread with their own unpooled engine for the same database
+"""
+from __future__ import annotations
+import asyncio
+import statistics
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Deque, Dict, List, Optional, Sequence, Set, Tuple, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from auto_apply_ai.config.settings import settings
+from auto_apply_ai.models.entities import FetchTiers
+from auto_apply_ai.utils.time import now_utc
+
+T = TypeVar("T")
+_io_loop: Optional[asyncio.AbstractEventLoop] = None
+_io_lock = threading.Lock()
+
+def _run_on_io_loop(coro: Awaitable[T]) -> T:
+    """Run `coro` on a long-lived event loop thread (sync callers may already be inside a loop)."""
+    global _io_loop
+    with _io_lock:
+        if _io_loop is None:
+            _io_loop = asyncio.new_event_loop()
+            threading.Thread(target=_io_loop.run_forever, name="fetch-strategy-io", daemon=True).start()
+    return asyncio.run_coroutine_threadsafe(coro, _io_loop).result()
+
+@dataclass
+class TierRecord:
+    attempts: int = 0
+    successes: int = 0
+    recent: Deque[Tuple[int, float]] = field(default_factory=deque)  # (ok, ms)
+    last_success_at: Optional[datetime] = None
+
+    @property
+    def success_rate(self) -> float:
+        return sum(ok for ok, _ in self.recent) / len(self.recent) if self.recent else 0.0
+
+    @property
+    def median_ms(self) -> Optional[float]:
+        latencies = [ms for ok, ms in self.recent if ok]
+        return round(statistics.median(latencies), 2) if latencies else None
+
+@dataclass
+class HostStrategy:
+    tiers: Dict[str, TierRecord] = field(default_factory=dict)
+    fetches: int = 0
+
+class StrategyTable:
+    def __init__(
+        self,
+        session_factory: Optional[async_sessionmaker[AsyncSession]] = None,
+        window: Optional[int] = None,
+        min_samples: Optional[int] = None,
+        min_success_rate: Optional[float] = None,
+        reprobe_every: Optional[int] = None,
+    ) -> None:
+        """`session_factory` defaults to db.engine.AsyncSessionLocal (imported on first load/flush)."""
+        self._session_factory = session_factory
+        self.window = max(1, settings.FETCH_STRATEGY_WINDOW if window is None else window)
+        self.min_samples = settings.FETCH_STRATEGY_MIN_SAMPLES if min_samples is None else min_samples
+        self.min_success_rate = settings.FETCH_STRATEGY_MIN_SUCCESS_RATE if min_success_rate is None else min_success_rate
+        self.reprobe_every = settings.FETCH_STRATEGY_REPROBE_EVERY if reprobe_every is None else reprobe_every
+        self._hosts: Dict[str, HostStrategy] = {}
+        self._dirty: Set[Tuple[str, str]] = set()
+        self._unsaved = 0  # attempts recorded since the last flush
+        self._io_session_factory: Optional[async_sessionmaker[AsyncSession]] = None
+        self._lock = threading.Lock()
+        self.loaded = False
+
+    @property
+    def session_factory(self) -> async_sessionmaker[AsyncSession]:
+        if self._session_factory is None:
+            from auto_apply_ai.db.engine import AsyncSessionLocal
+
+            self._session_factory = AsyncSessionLocal
+        return self._session_factory
+
+    def _failing(self, record: Optional[TierRecord]) -> bool:
+        return (
+            record is not None
+            and len(record.recent) >= self.min_samples
+            and record.success_rate < self.min_success_rate
+        )
+
+    def plan(self, host: str, tiers: Sequence[str] = FetchTiers) -> List[str]:
+        """Tiers to try for one fetch on `host`, cheapest first (the last one is always kept)."""
+        with self._lock:
+            strategy = self._hosts.setdefault(host, HostStrategy())
+            strategy.fetches += 1
+            if self.reprobe_every > 0 and strategy.fetches % self.reprobe_every == 0:
+                return list(tiers)
+            for i, tier in enumerate(tiers[:-1]):
+                if not self._failing(strategy.tiers.get(tier)):
+                    return list(tiers[i:])
+            return list(tiers[-1:])
+
+    def record(self, host: str, tier: str, outcome: str, seconds: float) -> None:
+        ok = outcome == "hit"
+        with self._lock:
+            record = self._hosts.setdefault(host, HostStrategy()).tiers.setdefault(tier, TierRecord())
+            record.attempts += 1
+            record.successes += ok
+            record.recent.append((int(ok), round(seconds * 1000, 2)))
+            while len(record.recent) > self.window:
+                record.recent.popleft()
+            if ok:
+                record.last_success_at = now_utc()
+            self._dirty.add((host, tier))
+            self._unsaved += 1
+
+    def snapshot(self, host: Optional[str] = None) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        with self._lock:
+            hosts = [host] if host is not None else list(self._hosts)
+            return {
+                h: {
+                    tier: {"attempts": r.attempts, "successes": r.successes,
+                           "success_rate": round(r.success_rate, 4), "median_ms": r.median_ms}
+                    for tier, r in self._hosts[h].tiers.items()
+                }
+                for h in hosts if h in self._hosts
+            }
+
+    @property
+    def io_session_factory(self) -> async_sessionmaker[AsyncSession]:
+        """
+        Sessions for load_sync/flush_sync: an engine of its own without a pool, so no connection
+        of the app engine (used from the app's loop) ever moves to the io loop.
+        """
+        if self._io_session_factory is None:
+            url = self.session_factory.kw["bind"].url
+            self._io_session_factory = async_sessionmaker(
+                create_async_engine(url, poolclass=NullPool), expire_on_commit=False, class_=AsyncSession
+            )
+        return self._io_session_factory
+
+    async def load(self, session_factory: Optional[async_sessionmaker[AsyncSession]] = None) -> None:
+        from auto_apply_ai.db.repository import load_host_fetch_stats
+
+        async with (session_factory or self.session_factory)() as session:
+            rows = await load_host_fetch_stats(session)
+        with self._lock:
+            for row in rows:
+                strategy = self._hosts.setdefault(row.source_host, HostStrategy())
+                if row.tier in strategy.tiers:  # recorded since startup; keep the live numbers
+                    continue
+                recent = deque((int(ok), float(ms)) for ok, ms in (row.recent or [])[-self.window:])
+                strategy.tiers[row.tier] = TierRecord(row.attempts, row.successes, recent, row.last_success_at)
+            self.loaded = True
+
+    async def ensure_loaded(self, session_factory: Optional[async_sessionmaker[AsyncSession]] = None) -> None:
+        if not self.loaded:
+            await self.load(session_factory)
+
+    async def flush(self, session_factory: Optional[async_sessionmaker[AsyncSession]] = None) -> int:
+        """Write the (host, tier) rows recorded since the last flush; returns how many."""
+        from auto_apply_ai.db.repository import save_host_fetch_stats
+
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+            unsaved, self._unsaved = self._unsaved, 0
+            now = now_utc()
+            rows = []
+            for host, tier in sorted(dirty):
+                r = self._hosts[host].tiers[tier]
+                rows.append({
+                    "source_host": host, "tier": tier, "attempts": r.attempts, "successes": r.successes,
+                    "recent": [list(x) for x in r.recent], "success_rate": round(r.success_rate, 4),
+                    "median_ms": r.median_ms, "last_success_at": r.last_success_at, "updated_at": now,
+                })
+        if not rows:
+            return 0
+        try:
+            async with (session_factory or self.session_factory)() as session:
+                await save_host_fetch_stats(session, rows)
+                await session.commit()
+        except BaseException:
+            with self._lock:
+                self._dirty |= dirty  # retry with the next flush
+                self._unsaved += unsaved
+            raise
+        return len(rows)
+
+    def load_sync(self) -> None:
+        _run_on_io_loop(self.ensure_loaded(self.io_session_factory))
+
+    def flush_sync(self) -> int:
+        return _run_on_io_loop(self.flush(self.io_session_factory))
+
+    @property
+    def pending(self) -> int:
+        """Attempts recorded since the last flush."""
+        return self._unsaved
+
+strategy_table = StrategyTable()
@@ -0,0 +1,285 @@
+# src/auto_apply_ai/services/jd_parser/tiered.py
+"""
+Tiered page fetch for the JD parser: the cheapest tier that yields a usable description wins.
+
+1. "static": one GET on the pooled HTTP client, JSON-LD / description text pulled out of the
+   HTML (jd_parser.static_page)
+2. "browser_lite": render in a pooled Chromium context with images, media, fonts, stylesheets
+   and off-site scripts aborted, and take the accessibility snapshot
+3. "browser": the same with every resource but known trackers loaded
+Browser pages load with the ATS's page-load profile (jd_parser.page_profiles): ready once the
+description is on the page rather than at network idle.
+A tier "hits" when it yields FETCH_STATIC_MIN_CHARS characters of text; otherwise (error, not
+HTML, a JS-only shell) the next tier is tried, and if none hits the fullest thin result is
+returned. Where a fetch starts comes from the per-host strategy table (jd_parser.strategy):
+the cheapest tier that has not been failing on that host.
+
+JSON-LD fields found by the static tier are kept even when the page escalates, and win over
+the LLM's reading of the same fields (`merge_fields`). Every attempt is counted in `tier_stats`
+(hit / thin / error and latency per tier); `tier_stats.snapshot()` has the hit rates and
+p50/p90. FETCH_STATIC_FIRST=false skips the static tier.
+
+TieredFetcher is the async version (a CrawlEngine fetch); jd_parser.scraper.fetch_page is the
+sync one used by fetch_and_parse_job. Both load the strategy table on their first fetch and
+flush it every FETCH_STRATEGY_FLUSH_EVERY attempts.
+"""
+from __future__ import annotations
+import asyncio
+import logging
+import statistics
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple, Union
+from urllib.parse import urlsplit
+
+import httpx
+
+from auto_apply_ai.config.settings import settings
+from auto_apply_ai.models.entities import FetchTiers
+from auto_apply_ai.services.jd_parser.page_profiles import load_page_async
+from auto_apply_ai.services.jd_parser.static_page import StaticPage, extract_page
+from auto_apply_ai.services.jd_parser.strategy import StrategyTable, strategy_table
+
+log = logging.getLogger(__name__)
+
+TIERS = FetchTiers
+
+class TierStats:
+    """Per-tier attempt outcomes and recent latencies; thread-safe (sync scraper threads + event loop)."""
+
+    def __init__(self, window: int = 1000) -> None:
+        self.window = window
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts: Dict[str, Dict[str, int]] = {}
+            self._latency: Dict[str, Deque[float]] = {}
+
+    def record(self, tier: str, outcome: str, seconds: float) -> None:
+        with self._lock:
+            counts = self._counts.setdefault(tier, {"hit": 0, "thin": 0, "error": 0})
+            counts[outcome] = counts.get(outcome, 0) + 1
+            self._latency.setdefault(tier, deque(maxlen=self.window)).append(seconds)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            out = {}
+            for tier, counts in self._counts.items():
+                attempts = sum(counts.values())
+                latency = sorted(self._latency[tier])
+                out[tier] = {
+                    "attempts": attempts,
+                    **counts,
+                    "hit_rate": round(counts["hit"] / attempts, 4) if attempts else 0.0,
+                    "p50_ms": round(statistics.median(latency) * 1000, 2) if latency else 0.0,
+                    "p90_ms": round(latency[max(0, int(len(latency) * 0.9) - 1)] * 1000, 2) if latency else 0.0,
+                }
+            return out
+
+tier_stats = TierStats()
+
+@dataclass
+class FetchedPage:
+    url: str
+    tier: str
+    content: Any  # description text (static) or AX snapshot (browser tiers)
+    fields: Dict[str, Any] = field(default_factory=dict)  # JobDesc fields read off the page (JSON-LD)
+    elapsed: float = 0.0
+    tried: List[Tuple[str, str, float]] = field(default_factory=list)  # (tier, outcome, seconds)
+
+def merge_fields(parsed: Optional[Dict[str, Any]], fields: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """LLM output with the page's structured fields on top (meta merged); None if there is neither."""
+    if parsed is None and not fields:
+        return None
+    merged = dict(parsed or {})
+    for key, value in fields.items():
+        if key == "meta":
+            merged["meta"] = {**(merged.get("meta") or {}), **value}
+        elif value not in (None, "", [], {}):
+            merged[key] = value
+    return merged
+
+def static_from_response(resp: httpx.Response, url: str) -> StaticPage:
+    resp.raise_for_status()
+    content_type = resp.headers.get("content-type", "")
+    if content_type and "html" not in content_type:
+        raise ValueError(f"not an HTML page ({content_type})")
+    return extract_page(resp.text, str(resp.url) or url)
+
+def content_chars(content: Any) -> int:
+    """Text length of description text or of the names/values in an AX snapshot."""
+    if isinstance(content, str):
+        return len(content)
+    if isinstance(content, dict):
+        own = sum(len(content[k]) for k in ("name", "value") if isinstance(content.get(k), str))
+        return own + content_chars(content.get("children") or [])
+    if isinstance(content, list):
+        return sum(content_chars(c) for c in content)
+    return 0
+
+def url_host(url: str) -> str:
+    return (urlsplit(url).hostname or "").lower()
+
+def fetch_plan(host: str, static_first: bool, strategies: Optional[StrategyTable]) -> List[str]:
+    tiers: Sequence[str] = TIERS if static_first else TIERS[1:]
+    return strategies.plan(host, tiers) if strategies is not None else list(tiers)
+
+class TierRun:
+    """One fetch walking up its tiers; shared by the sync and async fetchers."""
+
+    def __init__(
+        self, url: str, host: str, min_chars: int, stats: TierStats, strategies: Optional[StrategyTable]
+    ) -> None:
+        self.url = url
+        self.host = host
+        self.min_chars = min_chars
+        self.stats = stats
+        self.strategies = strategies
+        self.start = time.perf_counter()
+        self.tried: List[Tuple[str, str, float]] = []
+        self.fields: Dict[str, Any] = {}
+        self.best: Optional[Tuple[str, Any, int]] = None  # (tier, content, chars) of the fullest thin result
+        self.error: Optional[BaseException] = None
+
+    def page(self, tier: str, content: Any) -> FetchedPage:
+        return FetchedPage(self.url, tier, content, self.fields, time.perf_counter() - self.start, self.tried)
+
+    def observe(
+        self, tier: str, content: Any, fields: Dict[str, Any], error: Optional[BaseException], seconds: float
+    ) -> Optional[FetchedPage]:
+        """Record one attempt; the page if it hit, else None (try the next tier)."""
+        chars = 0 if error is not None else content_chars(content)
+        outcome = "error" if error is not None else "hit" if chars >= self.min_chars else "thin"
+        self.tried.append((tier, outcome, seconds))
+        self.stats.record(tier, outcome, seconds)
+        if self.strategies is not None:
+            self.strategies.record(self.host, tier, outcome, seconds)
+        if error is not None:
+            self.error = error
+            return None
+        if fields and not self.fields:
+            self.fields = fields
+        if outcome == "hit":
+            return self.page(tier, content)
+        if (chars or fields) and (self.best is None or chars > self.best[2]):
+            self.best = (tier, content, chars)
+        return None
+
+    def result(self) -> FetchedPage:
+        """No tier hit: the fullest thin result (a thin page beats nothing), else the last error."""
+        if self.best is not None:
+            return self.page(self.best[0], self.best[1])
+        raise self.error or ValueError(f"no content at {self.url}")
+
+class TieredFetcher:
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        pool: Any = None,
+        min_chars: Optional[int] = None,
+        static_first: Optional[bool] = None,
+        timeout: Optional[float] = None,
+        stats: Optional[TierStats] = None,
+        strategies: Optional[StrategyTable] = None,
+        use_strategies: Optional[bool] = None,
+    ) -> None:
+        """
+        `client` defaults to the shared services.http_client client; `pool` is an
+        AsyncBrowserPool, created (and closed by `aclose()`) here when not given; `strategies`
+        defaults to the process-wide table when FETCH_STRATEGY_ENABLED (or `use_strategies`).
+        """
+        self._client = client
+        self._pool = pool
+        self._owns_pool = pool is None
+        self.min_chars = settings.FETCH_STATIC_MIN_CHARS if min_chars is None else min_chars
+        self.static_first = settings.FETCH_STATIC_FIRST if static_first is None else static_first
+        self.timeout = settings.CRAWL_FETCH_TIMEOUT_SECONDS if timeout is None else timeout
+        self.stats = tier_stats if stats is None else stats
+        enabled = settings.FETCH_STRATEGY_ENABLED if use_strategies is None else use_strategies
+        self.strategies = (strategies or strategy_table) if enabled else None
+        self._flushing = False
+        self._loading = asyncio.Lock()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            from auto_apply_ai.services.http_client import http_client
+
+            return http_client.client
+        return self._client
+
+    @property
+    def pool(self) -> Any:
+        if self._pool is None:
+            from auto_apply_ai.services.jd_parser.browser_pool import AsyncBrowserPool
+
+            self._pool = AsyncBrowserPool()
+        return self._pool
+
+    async def static(self, url: str) -> StaticPage:
+        return static_from_response(await self.client.get(url), url)
+
+    async def browser(self, url: str, lite: bool = False) -> Any:
+        async with self.pool.lease() as context:
+            page = await load_page_async(context, url, lite=lite, timeout=self.timeout)
+            try:
+                return await page.accessibility.snapshot()
+            finally:
+                await page.close()
+
+    async def fetch_tier(self, tier: str, url: str) -> Tuple[Any, Dict[str, Any]]:
+        if tier == "static":
+            page = await self.static(url)
+            return page.text, page.fields
+        return await self.browser(url, lite=tier == "browser_lite"), {}
+
+    async def __call__(self, target: Union[str, Any]) -> FetchedPage:
+        url = target if isinstance(target, str) else target.url
+        host = url_host(url) if isinstance(target, str) else target.host
+        if self.strategies is not None and not self.strategies.loaded:
+            await self._load_strategies()
+        run = TierRun(url, host, self.min_chars, self.stats, self.strategies)
+        try:
+            for tier in fetch_plan(host, self.static_first, self.strategies):
+                t = time.perf_counter()
+                try:
+                    content, fields = await self.fetch_tier(tier, url)
+                    error = None
+                except Exception as exc:
+                    content, fields, error = None, {}, exc
+                page = run.observe(tier, content, fields, error, time.perf_counter() - t)
+                if page is not None:
+                    return page
+            return run.result()
+        finally:
+            if self.strategies is not None and self.strategies.pending >= settings.FETCH_STRATEGY_FLUSH_EVERY:
+                await self.flush()
+
+    async def _load_strategies(self) -> None:
+        async with self._loading:  # the first fetches of a crawl start together
+            try:
+                await self.strategies.ensure_loaded()
+            except Exception:
+                log.warning("could not load host fetch strategies; starting empty", exc_info=True)
+                self.strategies.loaded = True
+
+    async def flush(self) -> None:
+        if self.strategies is None or self._flushing:
+            return
+        self._flushing = True
+        try:
+            await self.strategies.flush()
+        except Exception:
+            log.warning("could not save host fetch strategies", exc_info=True)
+        finally:
+            self._flushing = False
+
+    async def aclose(self) -> None:
+        await self.flush()
+        if self._owns_pool and self._pool is not None:
+            await self._pool.close()
+            self._pool = None
@@ -0,0 +1,41 @@
+# src/auto_apply_ai/dedupe/index.py
+from __future__ import annotations
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+from auto_apply_ai.services.job_intake.dedupe.keys import DedupeKey
+
+PostingState = Dict[str, Any]  # id, company, job_title, location
+
+class PostingDedupeIndex:
+    """
+    Import-scoped, in-memory view of job_postings keyed by both dedupe key families.
+    - keys are resolved against the DB at most once per import (hits and misses are remembered)
+    - postings created during the import are added as they are planned, so later rows
+      (same chunk or later chunks) merge into them without touching the DB
+    Only valid while the importer holds the write lock (nobody else can create postings).
+    """
+
+    def __init__(self) -> None:
+        self.by_exact: Dict[DedupeKey, PostingState] = {}
+        self.by_cth: Dict[DedupeKey, PostingState] = {}
+        self._resolved_exact: Set[DedupeKey] = set()
+        self._resolved_cth: Set[DedupeKey] = set()
+
+    def unresolved(self, exact_keys: Iterable[DedupeKey], cth_keys: Iterable[DedupeKey]) -> Tuple[Set[DedupeKey], Set[DedupeKey]]:
+        return set(exact_keys) - self._resolved_exact, set(cth_keys) - self._resolved_cth
+
+    def mark_resolved(self, exact_keys: Iterable[DedupeKey], cth_keys: Iterable[DedupeKey]) -> None:
+        self._resolved_exact.update(exact_keys)
+        self._resolved_cth.update(cth_keys)
+
+    def add(self, post: PostingState, dk_exact: DedupeKey, dk_cth: DedupeKey) -> None:
+        # first posting wins for a key, matching the "exact, then company-title-host" lookup order
+        self.by_exact.setdefault(dk_exact, post)
+        self.by_cth.setdefault(dk_cth, post)
+        self._resolved_exact.add(dk_exact)
+        self._resolved_cth.add(dk_cth)
+
+    def lookup(self, dk_exact: DedupeKey, dk_cth: DedupeKey) -> Optional[PostingState]:
+        return self.by_exact.get(dk_exact) or self.by_cth.get(dk_cth)
+
+    def __len__(self) -> int:
+        return len(self.by_exact)
@@ -4,17 +4,22 @@ from hashlib import sha1
 from urllib.parse import urlparse
 from typing import Tuple
 
+# First 16 bytes of the SHA-1 digest, stored as a BLOB (vs. 40-char hex TEXT).
+# Truncating keeps existing keys derivable from their hex form: bytes.fromhex(hex[:32]).
+KEY_BYTES = 16
+DedupeKey = bytes
+
 def host_of(url: str) -> str:
     try:
         return urlparse(url).netloc.lower()
     except Exception:
         return ""
 
-def key_exact(url: str) -> str:
-    return sha1(url.encode("utf-8")).hexdigest()
+def key_exact(url: str) -> DedupeKey:
+    return sha1(url.encode("utf-8")).digest()[:KEY_BYTES]
 
-def key_company_title_host(company: str | None, title: str | None, host: str | None) -> str:
+def key_company_title_host(company: str | None, title: str | None, host: str | None) -> DedupeKey:
     c = (company or "").strip().lower()
     t = (title or "").strip().lower()
     h = (host or "").strip().lower()
-    return sha1(f"{c}|{t}|{h}".encode("utf-8")).hexdigest()
\ No newline at end of file
+    return sha1(f"{c}|{t}|{h}".encode("utf-8")).digest()[:KEY_BYTES]
\ No newline at end of file
@@ -0,0 +1,291 @@
+from __future__ import annotations
+import asyncio
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from typing import AsyncContextManager, AsyncIterator, Callable, Dict, Optional
+
+import httpx
+from sqlalchemy import update
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from auto_apply_ai.config.settings import settings
+from auto_apply_ai.db.engine import AsyncSessionLocal
+from auto_apply_ai.models.entities import ImportJob
+from auto_apply_ai.services.job_intake.import_pipeline import CsvRows, process_csv_reader
+from auto_apply_ai.services.http_client import http_client
+from auto_apply_ai.services.job_intake.ingest.csv_stream import aiter_csv_dicts, aiter_path_chunks
+from auto_apply_ai.utils.time import now_utc
+
+# Opens the row stream inside the worker (so sheet downloads don't hold the request open)
+RowSource = Callable[[], AsyncContextManager[CsvRows]]
+
+log = logging.getLogger(__name__)
+
+HEARTBEAT_SECONDS = 15.0
+MAX_FINISHED_IN_MEMORY = 500
+
+class ImportJobConflict(Exception):
+    """A job with this import_batch_id is already queued or running."""
+
+@dataclass
+class ImportJobState:
+    batch_id: str
+    source: str
+    dry_run: bool
+    status: str = "queued"
+    rows_processed: int = 0
+    accepted: int = 0
+    quarantined: int = 0
+    rows_per_sec: float = 0.0
+    error: Optional[str] = None
+    created_at: datetime = field(default_factory=now_utc)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    version: int = 0
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("succeeded", "failed")
+
+    def columns(self) -> Dict[str, object]:
+        return {
+            "source": self.source,
+            "status": self.status,
+            "dry_run": self.dry_run,
+            "rows_processed": self.rows_processed,
+            "accepted": self.accepted,
+            "quarantined": self.quarantined,
+            "rows_per_sec": self.rows_per_sec,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+class ImportJobRegistry:
+    """
+    Runs imports as asyncio tasks in this process and tracks their progress.
+    - state lives in memory for live polling / SSE and is mirrored to import_jobs
+    - progress rows are written inside the import transaction, so other processes
+      see them whenever the import commits (every `commit_every` rows, default
+      IMPORT_JOB_COMMIT_EVERY)
+    - at most IMPORT_MAX_CONCURRENT_JOBS imports run at once; the rest wait queued
+    - the queued row is written before the job waits for an import slot (by `submit`; on SQLite
+      by the job's task, since a running import holds the one write lock until its next commit
+      and the request should not wait for that); later job-state writes happen while the job
+      holds the slot, and imports run one at a time on SQLite, so they never wait on another
+      import's lock
+    - rows left queued/running by a process that died are failed by `fail_interrupted()` at
+      startup (run it before this process accepts imports; with several API workers, a worker
+      restarting mid-import in a sibling also fails the sibling's jobs)
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+        max_concurrent: Optional[int] = None,
+    ) -> None:
+        self._session_factory = session_factory
+        bind = session_factory.kw.get("bind")
+        self._sqlite = bind is not None and bind.dialect.name == "sqlite"
+        self._max_concurrent = 1 if self._sqlite else max_concurrent or settings.IMPORT_MAX_CONCURRENT_JOBS
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._jobs: Dict[str, ImportJobState] = {}
+        self._tasks: Dict[str, asyncio.Task[None]] = {}
+        self._changed: Dict[str, asyncio.Event] = {}
+
+    async def submit(
+        self,
+        batch_id: str,
+        source: str,
+        rows: RowSource,
+        dry_run: bool,
+        commit_every: Optional[int] = None,
+    ) -> ImportJobState:
+        task = self._tasks.get(batch_id)
+        if task is not None and not task.done():
+            raise ImportJobConflict(batch_id)
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrent)
+
+        state = ImportJobState(batch_id=batch_id, source=source, dry_run=dry_run)
+        if not self._sqlite:
+            await self._persist(state)
+        self._jobs[batch_id] = state
+        self._tasks[batch_id] = asyncio.create_task(self._run(state, rows, commit_every), name=f"import:{batch_id}")
+        self._prune()
+        return replace(state)
+
+    async def get(self, batch_id: str) -> Optional[ImportJobState]:
+        state = self._jobs.get(batch_id)
+        if state is not None:
+            return replace(state)
+        async with self._session_factory() as session:
+            row = await session.get(ImportJob, batch_id)
+        if row is None:
+            return None
+        return ImportJobState(
+            batch_id=row.id,
+            source=row.source,
+            dry_run=bool(row.dry_run),
+            status=row.status,
+            rows_processed=row.rows_processed,
+            accepted=row.accepted,
+            quarantined=row.quarantined,
+            rows_per_sec=row.rows_per_sec,
+            error=row.error,
+            created_at=row.created_at,
+            started_at=row.started_at,
+            finished_at=row.finished_at,
+        )
+
+    async def follow(self, batch_id: str) -> AsyncIterator[Optional[ImportJobState]]:
+        """
+        Yield a snapshot on every change until the job finishes.
+        Yields None every HEARTBEAT_SECONDS without changes (for SSE keep-alives).
+        Jobs not owned by this process yield their stored state once.
+        """
+        state = self._jobs.get(batch_id)
+        if state is None:
+            stored = await self.get(batch_id)
+            if stored is not None:
+                yield stored
+            return
+        seen = -1
+        while True:
+            if state.version != seen:
+                seen = state.version
+                yield replace(state)
+                if state.done:
+                    return
+                continue
+            event = self._changed.setdefault(batch_id, asyncio.Event())
+            try:
+                await asyncio.wait_for(event.wait(), timeout=HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                yield None
+
+    async def wait(self, batch_id: str) -> None:
+        task = self._tasks.get(batch_id)
+        if task is not None:
+            await asyncio.shield(task)
+
+    async def shutdown(self) -> None:
+        tasks = [t for t in self._tasks.values() if not t.done()]
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def fail_interrupted(self) -> int:
+        """Mark stored queued/running jobs this process does not own as failed ("interrupted")."""
+        async with self._session_factory() as session:
+            async with session.begin():
+                result = await session.execute(
+                    update(ImportJob)
+                    .where(ImportJob.status.in_(("queued", "running")), ImportJob.id.notin_(list(self._jobs)))
+                    .values(status="failed", error="interrupted", finished_at=now_utc())
+                )
+        return result.rowcount
+
+    def _notify(self, state: ImportJobState) -> None:
+        state.version += 1
+        event = self._changed.pop(state.batch_id, None)
+        if event is not None:
+            event.set()
+
+    def _prune(self) -> None:
+        finished = [k for k, s in self._jobs.items() if s.done and k not in self._changed]
+        for k in finished[: max(len(finished) - MAX_FINISHED_IN_MEMORY, 0)]:
+            self._jobs.pop(k, None)
+            self._tasks.pop(k, None)
+
+    async def _persist(self, state: ImportJobState) -> None:
+        async with self._session_factory() as session:
+            async with session.begin():
+                await session.merge(ImportJob(id=state.batch_id, **state.columns()))
+
+    async def _persist_queued(self, state: ImportJobState) -> None:
+        try:
+            await self._persist(state)
+        except OperationalError:  # busy timeout behind a long import transaction; written again on start
+            log.warning("could not store queued import job %s", state.batch_id, exc_info=True)
+
+    async def _finish(self, state: ImportJobState) -> None:
+        state.finished_at = now_utc()
+        try:
+            await self._persist(state)
+        finally:
+            self._notify(state)
+
+    async def _run(self, state: ImportJobState, rows: RowSource, commit_every: Optional[int]) -> None:
+        assert self._semaphore is not None
+        try:
+            if self._sqlite:
+                await self._persist_queued(state)
+            async with self._semaphore:
+                try:
+                    await self._import(state, rows, commit_every)
+                finally:
+                    # before releasing the slot: on SQLite the next import would hold the write lock
+                    await self._finish(state)
+        except asyncio.CancelledError:
+            if state.finished_at is None:  # cancelled while queued
+                state.status = "failed"
+                state.error = "cancelled"
+                await self._finish(state)
+            raise
+
+    async def _import(self, state: ImportJobState, rows: RowSource, commit_every: Optional[int]) -> None:
+        if commit_every is None:
+            commit_every = settings.IMPORT_JOB_COMMIT_EVERY
+        try:
+            state.status = "running"
+            state.started_at = now_utc()
+            await self._persist(state)
+            self._notify(state)
+            started = time.perf_counter()
+
+            async def on_progress(session: AsyncSession, processed: int, accepted: int, quarantined: int) -> None:
+                state.rows_processed = processed
+                state.accepted = accepted
+                state.quarantined = quarantined
+                state.rows_per_sec = round(processed / max(time.perf_counter() - started, 1e-9), 1)
+                await session.execute(update(ImportJob).where(ImportJob.id == state.batch_id).values(**state.columns()))
+                self._notify(state)
+
+            async with rows() as reader, self._session_factory() as session:
+                await process_csv_reader(
+                    reader, session, state.dry_run, state.batch_id,
+                    on_progress=on_progress, commit_every=commit_every,
+                )
+            state.status = "succeeded"
+        except asyncio.CancelledError:
+            state.status = "failed"
+            state.error = "cancelled"
+            raise
+        except Exception as e:
+            state.status = "failed"
+            state.error = f"{type(e).__name__}: {e}"
+
+@asynccontextmanager
+async def spooled_csv_rows(path: str) -> AsyncIterator[CsvRows]:
+    """Rows from an upload spooled to disk by the request handler; the file is removed afterwards."""
+    try:
+        yield aiter_csv_dicts(aiter_path_chunks(path))
+    finally:
+        os.unlink(path)
+
+@asynccontextmanager
+async def google_sheet_rows(csv_url: str, client: Optional[httpx.AsyncClient] = None) -> AsyncIterator[CsvRows]:
+    client = client or http_client.client
+    async with client.stream("GET", csv_url) as resp:
+        if resp.status_code != 200:
+            raise RuntimeError(f"Failed to fetch sheet CSV: {resp.status_code}")
+        yield aiter_csv_dicts(resp.aiter_bytes())
+
+import_jobs = ImportJobRegistry()
@@ -1,47 +1,190 @@
 from __future__ import annotations
-import csv
-from typing import List, Tuple
+from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Union
 from sqlalchemy.ext.asyncio import AsyncSession
+from auto_apply_ai.config.settings import settings
+from auto_apply_ai.db.sqlite_profiles import sqlite_profile
 from auto_apply_ai.schemas.job_intake_scm import ImportRowWarning, ImportRowError
 from auto_apply_ai.services.job_intake.ingest.normalizers import normalize_capture_row
 from auto_apply_ai.services.job_intake.ingest.validators import validate_row
-from auto_apply_ai.db.repository import create_capture, upsert_job_posting_for_capture
+from auto_apply_ai.services.job_intake.ingest.columnar import prepare_block
+from auto_apply_ai.db.repository import (
+    create_capture,
+    upsert_job_posting_for_capture,
+    bulk_create_captures,
+    bulk_upsert_job_postings_for_captures,
+    get_import_checkpoint,
+    save_import_checkpoint,
+)
+from auto_apply_ai.services.job_intake.dedupe.index import PostingDedupeIndex
+from auto_apply_ai.services.job_intake.import_results import FullIssueCollector, IssueCollector
 from auto_apply_ai.utils.time import parse_captured_at
 
+CsvRows = Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]]
+# (session, rows_processed, accepted, quarantined); awaited inside the import transaction
+ProgressCallback = Callable[[AsyncSession, int, int, int], Awaitable[None]]
+
+async def _aenumerate(rows: CsvRows) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+    if isinstance(rows, AsyncIterable):
+        idx = 0
+        async for raw in rows:
+            yield idx, raw
+            idx += 1
+    else:
+        for idx, raw in enumerate(rows):
+            yield idx, raw
+
+PreparedRow = Tuple[int, Dict[str, Any], List[str], List[str]]
+
+async def _prepare_rowwise(rows: AsyncIterator[Tuple[int, Dict[str, Any]]], batch_id: str) -> AsyncIterator[PreparedRow]:
+    async for idx, raw in rows:
+        row = normalize_capture_row(raw)
+        row["captured_at"] = parse_captured_at(row.get("captured_at"))
+        row["import_batch_id"] = batch_id
+        hard, soft = validate_row(row)
+        yield idx, row, hard, soft
+
+async def _prepare_columnar(
+    rows: AsyncIterator[Tuple[int, Dict[str, Any]]], batch_id: str, block_size: int
+) -> AsyncIterator[PreparedRow]:
+    block: List[Dict[str, Any]] = []
+    indexes: List[int] = []
+
+    def flush() -> List[PreparedRow]:
+        return [(i, row, hard, soft) for i, (row, hard, soft) in zip(indexes, prepare_block(block, batch_id))]
+
+    async for idx, raw in rows:
+        block.append(raw)
+        indexes.append(idx)
+        if len(block) >= block_size:
+            for item in flush():
+                yield item
+            block, indexes = [], []
+    for item in flush():
+        yield item
+
+async def _skip_through(rows: CsvRows, last_index: int) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+    async for idx, raw in _aenumerate(rows):
+        if idx > last_index:
+            yield idx, raw
+
+async def _write_chunk(session: AsyncSession, rows: List[Dict[str, Any]], index: PostingDedupeIndex) -> None:
+    capture_ids = await bulk_create_captures(session, rows)
+    await bulk_upsert_job_postings_for_captures(session, capture_ids, rows, index)
+
 async def process_csv_reader(
-    reader: csv.DictReader,
+    reader: CsvRows,
     session: AsyncSession,
     dry_run: bool,
     batch_id: str,
+    batch_size: Optional[int] = None,
+    on_progress: Optional[ProgressCallback] = None,
+    commit_every: Optional[int] = None,
+    issues: Optional[IssueCollector] = None,
+    columnar: Optional[bool] = None,
+    storage_profile: Optional[str] = None,
 ) -> Tuple[int, int, List[ImportRowWarning], List[ImportRowError]]:
+    """
+    Normalize, validate and persist every row of `reader`.
+    `reader` is a csv.DictReader or an async row stream (see ingest.csv_stream).
+    Accepted rows are buffered and written `batch_size` at a time with set-based
+    statements, deduped through one PostingDedupeIndex per transaction;
+    batch_size <= 1 keeps the original row-by-row ORM path.
+    With commit_every = 0 the whole import is one transaction. Otherwise the import
+    commits every `commit_every` rows together with an import_checkpoints row, and a
+    re-submitted batch_id resumes after the last committed row (counters carry over,
+    row warnings/errors are only reported for rows processed in this run).
+    `on_progress` is awaited every IMPORT_PROGRESS_EVERY rows and once at the end.
+    Row warnings/errors are returned as lists unless an `issues` collector is given
+    (e.g. CompactIssueCollector), in which case they go there and the lists are empty.
+    `columnar` (default IMPORT_COLUMNAR) normalizes/validates blocks of rows column-wise
+    (ingest.columnar) instead of row by row; the prepared rows are identical.
+    `storage_profile` (default SQLITE_IMPORT_PROFILE) is the SQLite storage profile used by
+    connections the import checks out (db.sqlite_profiles); ignored on other backends.
+    """
+    if batch_size is None:
+        batch_size = settings.IMPORT_BATCH_SIZE
+    if commit_every is None:
+        commit_every = settings.IMPORT_COMMIT_EVERY
+    if columnar is None:
+        columnar = settings.IMPORT_COLUMNAR
+    if storage_profile is None:
+        storage_profile = settings.SQLITE_IMPORT_PROFILE
+    checkpointing = commit_every > 0 and not dry_run
     accepted = 0
     quarantined = 0
-    warnings_by_row: List[ImportRowWarning] = []
-    errors_by_row: List[ImportRowError] = []
-
-    async with session.begin():
-        for idx, raw in enumerate(reader):
-            row = normalize_capture_row(raw)
-            row["captured_at"] = parse_captured_at(row.get("captured_at"))
-            row["import_batch_id"] = batch_id
-
-            hard, soft = validate_row(row)
-            if hard:
-                quarantined += 1
-                errors_by_row.append(ImportRowError(row_index=idx, errors=hard))
-                if soft:
-                    warnings_by_row.append(ImportRowWarning(row_index=idx, warnings=soft))
-                continue
-
-            if soft:
-                warnings_by_row.append(ImportRowWarning(row_index=idx, warnings=soft))
-
-            if dry_run:
+    full = FullIssueCollector() if issues is None else None
+    collector: IssueCollector = full if full is not None else issues  # type: ignore[assignment]
+    pending: List[Dict[str, Any]] = []
+    dedupe_index = PostingDedupeIndex()
+    progress_every = max(settings.IMPORT_PROGRESS_EVERY, 1)
+    processed = 0
+    resume_after = -1
+    uncommitted = 0
+
+    with sqlite_profile(None if dry_run else storage_profile):
+        try:
+            if checkpointing:
+                checkpoint = await get_import_checkpoint(session, batch_id)
+                if checkpoint is not None:
+                    resume_after = checkpoint.last_row_index
+                    accepted, quarantined = checkpoint.accepted, checkpoint.quarantined
+                    processed = resume_after + 1
+
+            remaining = _skip_through(reader, resume_after)
+            if columnar:
+                block_size = batch_size if batch_size > 1 else settings.IMPORT_BATCH_SIZE
+                prepared = _prepare_columnar(remaining, batch_id, block_size)
+            else:
+                prepared = _prepare_rowwise(remaining, batch_id)
+
+            async for idx, row, hard, soft in prepared:
+                if checkpointing and uncommitted >= commit_every:
+                    if pending:
+                        await _write_chunk(session, pending, dedupe_index)
+                        pending = []
+                    await save_import_checkpoint(session, batch_id, idx - 1, accepted, quarantined)
+                    if on_progress:
+                        await on_progress(session, idx, accepted, quarantined)
+                    await session.commit()
+                    # other writers may have touched job_postings between our transactions
+                    dedupe_index = PostingDedupeIndex()
+                    uncommitted = 0
+                elif on_progress and idx and idx % progress_every == 0:
+                    await on_progress(session, idx, accepted, quarantined)
+                processed = idx + 1
+                uncommitted += 1
+
+                if hard or soft:
+                    collector.add(idx, hard, soft)
+                if hard:
+                    quarantined += 1
+                    continue
+
+                if dry_run:
+                    accepted += 1
+                    continue
+
+                if batch_size <= 1:
+                    capture_id = await create_capture(session, row)
+                    await upsert_job_posting_for_capture(session, capture_id, row)
+                else:
+                    pending.append(row)
+                    if len(pending) >= batch_size:
+                        await _write_chunk(session, pending, dedupe_index)
+                        pending = []
                 accepted += 1
-                continue
 
-            capture_id = await create_capture(session, row)
-            await upsert_job_posting_for_capture(session, capture_id, row)
-            accepted += 1
+            if pending:
+                await _write_chunk(session, pending, dedupe_index)
+            if checkpointing and uncommitted:
+                await save_import_checkpoint(session, batch_id, processed - 1, accepted, quarantined)
+            if on_progress:
+                await on_progress(session, processed, accepted, quarantined)
+            await session.commit()
+        except BaseException:
+            await session.rollback()
+            raise
 
-    return accepted, quarantined, warnings_by_row, errors_by_row
\ No newline at end of file
+    if full is None:
+        return accepted, quarantined, [], []
+    return accepted, quarantined, full.warnings_by_row, full.errors_by_row
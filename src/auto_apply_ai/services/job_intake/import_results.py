@@ -0,0 +1,81 @@
+from __future__ import annotations
+from typing import Dict, List, Optional, Protocol, Sequence
+
+from auto_apply_ai.config.settings import settings
+from auto_apply_ai.schemas.job_intake_scm import ImportIssueSummary, ImportRowError, ImportRowWarning
+
+class IssueCollector(Protocol):
+    def add(self, row_index: int, errors: Sequence[str], warnings: Sequence[str]) -> None: ...
+
+class FullIssueCollector:
+    """One ImportRowError / ImportRowWarning per affected row (the classic ImportResult shape)."""
+
+    def __init__(self) -> None:
+        self.errors_by_row: List[ImportRowError] = []
+        self.warnings_by_row: List[ImportRowWarning] = []
+
+    def add(self, row_index: int, errors: Sequence[str], warnings: Sequence[str]) -> None:
+        if errors:
+            self.errors_by_row.append(ImportRowError(row_index=row_index, errors=list(errors)))
+        if warnings:
+            self.warnings_by_row.append(ImportRowWarning(row_index=row_index, warnings=list(warnings)))
+
+class _CodeStats:
+    __slots__ = ("count", "ranges", "truncated", "samples")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.ranges: List[List[int]] = []
+        self.truncated = False
+        self.samples: List[int] = []
+
+class CompactIssueCollector:
+    """
+    Per-code counts, run-length row ranges and a capped sample of row indexes.
+    Rows must be added in increasing row_index order (the pipeline guarantees it).
+    """
+
+    def __init__(self, max_ranges: Optional[int] = None, max_samples: Optional[int] = None) -> None:
+        self.max_ranges = settings.IMPORT_RESULT_MAX_RANGES if max_ranges is None else max_ranges
+        self.max_samples = settings.IMPORT_RESULT_SAMPLE_ROWS if max_samples is None else max_samples
+        self._errors: Dict[str, _CodeStats] = {}
+        self._warnings: Dict[str, _CodeStats] = {}
+
+    def add(self, row_index: int, errors: Sequence[str], warnings: Sequence[str]) -> None:
+        for code in errors:
+            self._record(self._errors, code, row_index)
+        for code in warnings:
+            self._record(self._warnings, code, row_index)
+
+    def _record(self, by_code: Dict[str, _CodeStats], code: str, row_index: int) -> None:
+        stats = by_code.get(code)
+        if stats is None:
+            stats = by_code[code] = _CodeStats()
+        stats.count += 1
+        if len(stats.samples) < self.max_samples:
+            stats.samples.append(row_index)
+        if stats.ranges and stats.ranges[-1][1] == row_index - 1:
+            stats.ranges[-1][1] = row_index
+        elif len(stats.ranges) < self.max_ranges:
+            stats.ranges.append([row_index, row_index])
+        else:
+            stats.truncated = True
+
+    @staticmethod
+    def _summaries(by_code: Dict[str, _CodeStats]) -> List[ImportIssueSummary]:
+        return [
+            ImportIssueSummary(
+                code=code,
+                count=s.count,
+                row_ranges=[(a, b) for a, b in s.ranges],
+                ranges_truncated=s.truncated,
+                sample_rows=s.samples,
+            )
+            for code, s in sorted(by_code.items(), key=lambda kv: -kv[1].count)
+        ]
+
+    def error_summaries(self) -> List[ImportIssueSummary]:
+        return self._summaries(self._errors)
+
+    def warning_summaries(self) -> List[ImportIssueSummary]:
+        return self._summaries(self._warnings)
@@ -0,0 +1,125 @@
+# src/auto_apply_ai/ingest/csv_stream.py
+from __future__ import annotations
+import asyncio
+import codecs
+import csv
+from typing import Any, AsyncIterable, AsyncIterator, Dict, List, Optional, Protocol
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+class AsyncReadable(Protocol):
+    async def read(self, size: int = -1) -> bytes: ...
+
+class _NeedMore(Exception):
+    """The record csv.reader is parsing continues past the lines read so far."""
+
+class _LineFeed:
+    """
+    Line source for csv.reader over an async stream. csv.reader restarts a record from scratch
+    on every next(), so when a record runs past the buffered lines it is replayed from its
+    first line once another line has arrived; only the current record is held.
+    """
+
+    def __init__(self) -> None:
+        self.lines: List[str] = []
+        self.pos = 0
+        self.eof = False
+
+    def __iter__(self) -> "_LineFeed":
+        return self
+
+    def __next__(self) -> str:
+        if self.pos < len(self.lines):
+            self.pos += 1
+            return self.lines[self.pos - 1]
+        if self.eof:
+            raise StopIteration
+        raise _NeedMore
+
+    def rewind(self) -> None:
+        self.pos = 0
+
+    def consumed(self) -> None:
+        del self.lines[: self.pos]
+        self.pos = 0
+
+async def aiter_file_chunks(upload: AsyncReadable, chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Read an UploadFile (or anything with an async read(size)) in fixed-size chunks."""
+    while True:
+        chunk = await upload.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+async def aiter_path_chunks(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Read a file from disk in chunks without blocking the event loop."""
+    with open(path, "rb") as fh:
+        while True:
+            chunk = await asyncio.to_thread(fh.read, chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+async def aiter_csv_dicts(
+    chunks: AsyncIterable[bytes],
+    encoding: str = "utf-8",
+    errors: str = "replace",
+) -> AsyncIterator[Dict[str, Optional[str]]]:
+    """
+    Streaming replacement for csv.DictReader(io.StringIO(payload.decode())).
+    - bytes go through an incremental decoder, so multi-byte characters may span chunks
+    - lines are fed to csv.reader as they arrive, so the csv module itself decides where a
+      record ends (quoted newlines, stray quotes inside unquoted fields)
+    - rows become dicts the way DictReader builds them (blank lines skipped, extra values
+      under None, missing ones None)
+    Memory is bounded by the chunk size plus the longest single record.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors=errors)
+    feed = _LineFeed()
+    reader = csv.reader(feed)
+    fieldnames: Optional[List[str]] = None
+    tail = ""
+
+    async def _lines() -> AsyncIterator[str]:
+        nonlocal tail
+        async for chunk in chunks:
+            text = tail + decoder.decode(chunk)
+            *lines, tail = text.split("\n")
+            for line in lines:
+                yield line + "\n"
+        text = tail + decoder.decode(b"", final=True)
+        tail = ""
+        if text:
+            yield text
+
+    lines = _lines()
+
+    async def more() -> None:
+        try:
+            feed.lines.append(await lines.__anext__())
+        except StopAsyncIteration:
+            feed.eof = True
+
+    while True:
+        if not feed.lines and not feed.eof:
+            await more()  # a line ahead, so single-line records parse without a replay
+        try:
+            row = next(reader)
+        except _NeedMore:
+            feed.rewind()
+            await more()
+            continue
+        except StopIteration:
+            return
+        feed.consumed()
+        if not row:
+            continue
+        if fieldnames is None:
+            fieldnames = row
+            continue
+        record: Dict[str, Any] = dict(zip(fieldnames, row))
+        if len(row) > len(fieldnames):
+            record[None] = row[len(fieldnames):]  # type: ignore[index]
+        for key in fieldnames[len(row):]:
+            record[key] = None
+        yield record
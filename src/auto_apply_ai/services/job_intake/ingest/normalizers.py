@@ -1,13 +1,20 @@
 # src/auto_apply_ai/ingest/normalizers.py
 from __future__ import annotations
-from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
-from typing import Dict, Any, Iterable, List
+from functools import lru_cache
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode, ParseResult
+from typing import Dict, Any, Iterable, List, Optional
 import re
 
+from auto_apply_ai.config.settings import settings
+from auto_apply_ai.services.job_intake.dedupe.keys import DedupeKey, key_exact
+
 TRACKING_PARAMS = {
     "utm_source","utm_medium","utm_campaign","utm_term","utm_content",
     "gclid","fbclid","msclkid","mc_cid","mc_eid","igshid","utm_id","utm_reader"
 }
+_MULTI_SLASH = re.compile(r"//+")
+_WHITESPACE = re.compile(r"\s+")
+_TAG_SPLIT = re.compile(r"[;,|\n]+")
 
 def clean_url(u: str) -> str:
     """
@@ -19,14 +26,20 @@ def clean_url(u: str) -> str:
     """
     if not u:
         return u
-    p = urlparse(u.strip())
+    return clean_parsed_url(urlparse(u.strip()))
+
+def clean_parsed_url(p: ParseResult) -> str:
+    """clean_url for an already parsed URL (lets callers reuse the parse)."""
     host = (p.netloc or "").lower()
-    query = [(k, v) for k, v in parse_qsl(p.query, keep_blank_values=False) if k not in TRACKING_PARAMS]
-    query.sort()
-    new_query = urlencode(query, doseq=True)
+    if p.query:
+        query = [(k, v) for k, v in parse_qsl(p.query, keep_blank_values=False) if k not in TRACKING_PARAMS]
+        query.sort()
+        new_query = urlencode(query, doseq=True)
+    else:
+        new_query = ""
     path = p.path or "/"
     # normalize: collapse multiple slashes (but not for http(s)://)
-    path = re.sub(r"//+", "/", path)
+    path = _MULTI_SLASH.sub("/", path)
     # strip trailing slash if path not root
     if path != "/" and path.endswith("/"):
         path = path[:-1]
@@ -36,10 +49,58 @@ def clean_url(u: str) -> str:
     newp = p._replace(netloc=host, query=new_query, path=path, fragment=frag)
     return urlunparse(newp)
 
+# Row key normalize_capture_row stores the ParsedUrl under (not a column, never persisted)
+PARSED_URL_KEY = "_source_url"
+
+class ParsedUrl:
+    """
+    Everything the import path needs from a source URL, from a single urlparse:
+    the canonical (cleaned) URL, its host, validate_row's scheme/netloc check and
+    the exact dedupe key. Instances are shared through the LRU cache; treat as immutable.
+    """
+    __slots__ = ("canonical", "host", "is_valid", "key_exact")
+
+    def __init__(self, canonical: str, host: str, is_valid: bool, key_exact: DedupeKey) -> None:
+        self.canonical = canonical
+        self.host = host
+        self.is_valid = is_valid
+        self.key_exact = key_exact
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, ParsedUrl) and self.canonical == other.canonical
+
+    def __hash__(self) -> int:
+        return hash(self.canonical)
+
+    def __repr__(self) -> str:
+        return f"ParsedUrl({self.canonical!r}, valid={self.is_valid})"
+
+@lru_cache(maxsize=settings.URL_PARSE_CACHE_SIZE)
+def parse_source_url(u: str) -> ParsedUrl:
+    """
+    Memoized: the same posting URL shows up many times within (and across) imports.
+    clean_parsed_url keeps the scheme and only lowercases the netloc, so the host and
+    validity of the canonical URL can be read off the original parse.
+    """
+    p = urlparse(u.strip())
+    canonical = clean_parsed_url(p)
+    host = p.netloc.lower()
+    return ParsedUrl(canonical, host, p.scheme in {"http", "https"} and bool(host), key_exact(canonical))
+
+def source_url_record(row: Dict[str, Any]) -> Optional[ParsedUrl]:
+    """The row's ParsedUrl if it still matches row["source_url"], else a fresh (cached) parse."""
+    url = row.get("source_url")
+    if not url:
+        return None
+    rec = row.get(PARSED_URL_KEY)
+    if rec is not None and rec.canonical == url:
+        return rec
+    return parse_source_url(url)
+
 def normalize_text(s: str | None) -> str | None:
     if s is None:
         return None
-    s = re.sub(r"\s+", " ", s.strip())
+    s = _WHITESPACE.sub(" ", s.strip())
     return s or None
 
 def normalize_tags(t: str | List[str] | None) -> List[str]:
@@ -48,13 +109,19 @@ def normalize_tags(t: str | List[str] | None) -> List[str]:
     if isinstance(t, list):
         vals = t
     else:
-        vals = re.split(r"[;,|\n]+", t)
+        vals = _TAG_SPLIT.split(t)
     out = sorted(set(filter(None, (x.strip().lower() for x in vals))))
     return out
 
 def normalize_capture_row(row: Dict[str, Any]) -> Dict[str, Any]:
     row = dict(row)
-    row["source_url"] = clean_url(row.get("source_url", ""))
+    src = row.get("source_url", "")
+    if src:
+        parsed = parse_source_url(src)
+        row["source_url"] = parsed.canonical
+        row[PARSED_URL_KEY] = parsed
+    else:
+        row["source_url"] = src
     row["apply_url_hint"] = clean_url(row.get("apply_url_hint", "")) if row.get("apply_url_hint") else None
     for k in ("job_title","company","location","seniority_hint","compensation_hint","notes","source_site"):
         row[k] = normalize_text(row.get(k))
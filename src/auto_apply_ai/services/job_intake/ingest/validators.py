@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Dict, Any, Tuple, List
 from urllib.parse import urlparse
 from datetime import datetime
+from auto_apply_ai.services.job_intake.ingest.normalizers import PARSED_URL_KEY
 
 def _valid_url(u: str) -> bool:
     try:
@@ -16,7 +17,12 @@ def validate_row(row: Dict[str, Any]) -> Tuple[List[str], List[str]]:
     soft: List[str] = []
 
     src = row.get("source_url")
-    if not src or not _valid_url(src):
+    parsed = row.get(PARSED_URL_KEY)
+    if parsed is not None and parsed.canonical == src:
+        valid = parsed.is_valid  # parsed once by normalize_capture_row
+    else:
+        valid = bool(src) and _valid_url(src)
+    if not valid:
         hard.append("invalid_source_url")
 
     cap = row.get("captured_at")
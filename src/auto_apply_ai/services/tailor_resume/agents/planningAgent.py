@@ -4,13 +4,11 @@ from dataclasses import dataclass
 import asyncio
 import json
 import os
-from google import genai
-from google.genai.types import GenerateContentConfig
-from dotenv import load_dotenv
-import opik
-from opik import track
-from opik.integrations.genai import track_genai
-load_dotenv()
+from auto_apply_ai.utils.lazy import lazy_decorator, lazy_import
+
+# imported on first use: google-genai and opik take ~1.5s to import
+genai = lazy_import("google.genai")
+opik = lazy_import("opik")
 
 class ContextItem(BaseModel):
     key: str
@@ -45,10 +43,14 @@ class TailoringPlan(BaseModel):
 class GeminiClient:
     """Thin wrapper around Google's Gen AI SDK that exposes an async .generate().
     The SDK call is sync, so we run it in a thread to keep our agent async-friendly.
-    Reads GEMINI_KEY from env by default (set via .env already loaded above).
+    Reads GEMINI_KEY from env by default (.env is loaded on construction).
     """
     def __init__(self, model: str = "gemini-2.5-flash", api_key: str | None = None, **default_config):
-        self._client = track_genai(genai.Client(api_key=api_key))
+        from dotenv import load_dotenv
+        from opik.integrations.genai import track_genai
+
+        load_dotenv()
+        self._client = track_genai(genai.Client(api_key=api_key or os.getenv("GEMINI_KEY")))
         self._model = model
         self._default_config = default_config or {}
 
@@ -56,7 +58,7 @@ class GeminiClient:
         cfg = {**self._default_config, **(override_config or {})}
 
         def _call_genai():
-            config=GenerateContentConfig(
+            config=genai.types.GenerateContentConfig(
                 response_mime_type="application/json",
                 response_schema=TailoringPlan,
                 temperature=0,
@@ -109,7 +111,7 @@ class PlanningAgent:
     def __init__(self, llm_client):
         self.llm = llm_client
         
-    @track(name="planning_agent.create_plan", tags=["agent:PlanningAgent"],project_name="Auto-apply-AI")
+    @lazy_decorator("opik", "track", name="planning_agent.create_plan", tags=["agent:PlanningAgent"],project_name="Auto-apply-AI")
     async def create_plan(self, resume: Resume, job_desc: JobDesc) -> TailoringPlan:
         """
         Uses Chain-of-Thought reasoning to create a tailoring plan
@@ -277,7 +279,7 @@ async def main():
         tools=["Docker", "Kubernetes"]
     )
     
-    llm_client = GeminiClient(api_key=os.getenv("GEMINI_KEY"),model="gemini-2.5-flash")
+    llm_client = GeminiClient(model="gemini-2.5-flash")  # GEMINI_KEY from the environment / .env
     planning_agent = PlanningAgent(llm_client)
     plan = await planning_agent.create_plan(resume, job_desc)
     print(json.dumps(plan.model_dump(), indent=2))
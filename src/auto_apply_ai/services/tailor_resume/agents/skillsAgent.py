@@ -1,16 +1,14 @@
 from pydantic import BaseModel
 from typing import Any, List, Optional, Dict, Generic, TypeVar
 from auto_apply_ai.services.tailor_resume.tailor_resume_scm import Experience, Basics
-from google import genai
-from google.genai.types import GenerateContentConfig
 import asyncio
 import json
 import os
-import opik
-from opik.integrations.genai import track_genai
-from opik import track
-from dotenv import load_dotenv
-load_dotenv()
+from auto_apply_ai.utils.lazy import lazy_decorator, lazy_import
+
+# imported on first use: google-genai and opik take ~1.5s to import
+genai = lazy_import("google.genai")
+opik = lazy_import("opik")
 
 
 T = TypeVar('T')
@@ -72,10 +70,14 @@ class SkillsGeminiSchema(BaseModel):
 class GeminiClient:
     """Thin wrapper around Google's Gen AI SDK that exposes an async .generate().
     The SDK call is sync, so we run it in a thread to keep our agent async-friendly.
-    Reads GEMINI_KEY from env by default (set via .env already loaded above).
+    Reads GEMINI_KEY from env by default (.env is loaded on construction).
     """
     def __init__(self, model: str = "gemini-2.5-flash", api_key: str | None = None, **default_config):
-        self._client = track_genai(genai.Client(api_key=api_key))
+        from dotenv import load_dotenv
+        from opik.integrations.genai import track_genai
+
+        load_dotenv()
+        self._client = track_genai(genai.Client(api_key=api_key or os.getenv("GEMINI_KEY")))
         self._model = model
         self._default_config = default_config or {}
 
@@ -83,7 +85,7 @@ class GeminiClient:
         cfg = {**self._default_config, **(override_config or {})}
 
         def _call_genai():
-            config=GenerateContentConfig(
+            config=genai.types.GenerateContentConfig(
                 response_mime_type="application/json",
                 response_schema=SkillsGeminiSchema,
                 temperature=0,
@@ -109,7 +111,7 @@ class SkillsAgent:
     def __init__(self, llm_client):
         self.llm = llm_client
     
-    @track(name="skillAgent.create_skills", tags=["agent:SkillsAgent"],project_name="Auto-apply-AI")
+    @lazy_decorator("opik", "track", name="skillAgent.create_skills", tags=["agent:SkillsAgent"],project_name="Auto-apply-AI")
     async def execute(self, task: AgentTask, resume: Resume, plan: TailoringPlan) -> AgentResult:
         """Execute skills optimization task"""
         
@@ -270,7 +272,7 @@ async def main():
         "ats_keywords": ["Senior Full Stack Developer","Python", "React", "AWS","Web Applications","Scalable","Docker","Kubernetes","JavaScript","SQL","Full Stack","Backend","Frontend","Cloud"]
     })
 
-    llm_client = GeminiClient(api_key=os.getenv("GEMINI_KEY"),model="gemini-2.5-flash")
+    llm_client = GeminiClient(model="gemini-2.5-flash")  # GEMINI_KEY from the environment / .env
     skills_agent = SkillsAgent(llm_client)
     plan = await skills_agent.execute(skills_task,resume,tailoring_plan)
     print(json.dumps(plan.model_dump(), indent=2))
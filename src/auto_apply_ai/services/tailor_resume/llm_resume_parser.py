@@ -1,17 +1,16 @@
 import re
 import json
-import fitz
-from langchain_core.language_models import LLM
-import spacy
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 from pydantic import BaseModel, ValidationError
-from openai import OpenAI
 from dataclasses import dataclass
 
 from auto_apply_ai.services.tailor_resume.tailor_resume_scm import Resume, Experience, Basics
-from dotenv import load_dotenv
-load_dotenv()
+from auto_apply_ai.utils.lazy import lazy_import
+
+# imported on first use (PyMuPDF, openai)
+fitz = lazy_import("fitz")
+openai = lazy_import("openai")
 
 
 # ========== PDF Text Extraction ==========
@@ -40,7 +39,10 @@ class LLMResumeParser:
             api_key: OpenAI API key (or set OPENAI_API_KEY env var)
             model: Model to use.
         """
-        self.client = OpenAI(api_key=api_key) if api_key else OpenAI()
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        self.client = openai.OpenAI(api_key=api_key) if api_key else openai.OpenAI()
         self.model = model
     
     def create_extraction_prompt(self, resume_text: str) -> str:
@@ -0,0 +1,20 @@
+from __future__ import annotations
+import base64
+import json
+from typing import Any, List
+
+def encode_cursor(*sort_key: Any) -> str:
+    """Opaque page cursor holding the sort key of the last row on the page."""
+    raw = json.dumps(list(sort_key), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """Inverse of encode_cursor; raises ValueError unless it holds exactly `size` values."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        key = json.loads(raw)
+    except (ValueError, TypeError) as e:  # binascii.Error and JSONDecodeError are ValueErrors
+        raise ValueError("malformed cursor") from e
+    if not isinstance(key, list) or len(key) != size:
+        raise ValueError("malformed cursor")
+    return key
@@ -0,0 +1,33 @@
+from __future__ import annotations
+import os
+import threading
+import time
+import uuid
+
+_lock = threading.Lock()
+_last_ms = 0
+_seq = 0
+
+def uuid7() -> str:
+    """
+    UUIDv7 (RFC 9562) string: 48-bit unix-ms timestamp, then a 12-bit per-millisecond
+    sequence (rand_a), then 62 random bits.
+    - ids from this process sort by creation time, also as strings (fixed-width hex)
+    - the sequence keeps ids minted in the same millisecond in order; on overflow the
+      timestamp is advanced by 1ms rather than going backwards
+    """
+    global _last_ms, _seq
+    with _lock:
+        ms = time.time_ns() // 1_000_000
+        if ms > _last_ms:
+            _last_ms = ms
+            _seq = int.from_bytes(os.urandom(2), "big") & 0x3FF  # random start, leaves room to count up
+        else:
+            _seq += 1
+            if _seq > 0xFFF:
+                _last_ms += 1
+                _seq = 0
+        ms, seq = _last_ms, _seq
+    rand_b = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+    value = (ms << 80) | (0x7 << 76) | (seq << 64) | (0b10 << 62) | rand_b
+    return str(uuid.UUID(int=value))
@@ -0,0 +1,65 @@
+# src/auto_apply_ai/utils/lazy.py
+"""
+Deferred imports for heavy optional SDKs (playwright, langchain, google-genai, opik, PyMuPDF,
+openai) so importing a module that *can* use them stays cheap:
+
+- `lazy_import("fitz")` returns a module object that is executed on first attribute access
+  (importlib.util.LazyLoader); a missing package raises ModuleNotFoundError on first use,
+  not at import. Locating a submodule imports its parent packages, so pass top-level
+  packages (or ones under a namespace package such as google.*)
+- `lazy_decorator("opik", "track", name=...)` applies a decorator from such a package on the
+  first call of the decorated function instead of at class/module definition
+"""
+from __future__ import annotations
+import functools
+import importlib
+import importlib.util
+import inspect
+import sys
+from types import ModuleType
+from typing import Any, Callable, Optional
+
+class _MissingModule(ModuleType):
+    def __getattr__(self, attr: str) -> Any:
+        if attr.startswith("__"):
+            raise AttributeError(attr)
+        raise ModuleNotFoundError(f"No module named {self.__name__!r}", name=self.__name__)
+
+def lazy_import(name: str) -> ModuleType:
+    if name in sys.modules:
+        return sys.modules[name]
+    try:
+        spec = importlib.util.find_spec(name)
+    except ModuleNotFoundError:
+        spec = None
+    if spec is None or spec.loader is None:
+        return _MissingModule(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+def lazy_decorator(module: str, attr: str, *args: Any, **kwargs: Any) -> Callable[[Callable], Callable]:
+    """`@lazy_decorator("opik", "track", name="x")` == `@opik.track(name="x")`, resolved on first call."""
+    def decorate(fn: Callable) -> Callable:
+        wrapped: Optional[Callable] = None
+
+        def resolve() -> Callable:
+            nonlocal wrapped
+            if wrapped is None:
+                wrapped = getattr(importlib.import_module(module), attr)(*args, **kwargs)(fn)
+            return wrapped
+
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*a: Any, **kw: Any) -> Any:
+                return await resolve()(*a, **kw)
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*a: Any, **kw: Any) -> Any:
+            return resolve()(*a, **kw)
+        return wrapper
+    return decorate
@@ -0,0 +1,20 @@
+import httpx
+import pytest_asyncio
+
+from auto_apply_ai.api.app import create_app
+from auto_apply_ai.api.deps import get_read_session, get_session, get_writer
+from auto_apply_ai.db.writer import SessionWriter
+
+
+@pytest_asyncio.fixture
+async def client(session_factory, read_cache):
+    async def session_override():
+        async with session_factory() as session:
+            yield session
+
+    app = create_app()
+    app.dependency_overrides[get_session] = session_override
+    app.dependency_overrides[get_read_session] = session_override
+    app.dependency_overrides[get_writer] = lambda: SessionWriter(session_factory)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as c:
+        yield c
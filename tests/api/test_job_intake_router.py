@@ -0,0 +1,207 @@
+import pytest
+
+from auto_apply_ai.models.entities import JobPosting
+from auto_apply_ai.services.job_intake.dedupe.keys import key_company_title_host, key_exact
+from auto_apply_ai.utils.cursor import encode_cursor
+
+
+def _posting(url, company, title, location=None, host="h.example", status="new"):
+    return JobPosting(
+        canonical_url=url, company=company, job_title=title, location=location, source_host=host,
+        status=status, next_action="none",
+        dedupe_key_exact=key_exact(url), dedupe_key_company_title_host=key_company_title_host(company, title, host),
+    )
+
+
+async def _seed(session_factory, n):
+    async with session_factory() as session:
+        async with session.begin():
+            session.add_all([
+                _posting(f"https://h{i % 2}.example/jobs/{i}", "Acme", f"Job {i}",
+                         host=f"h{i % 2}.example", status="new" if i % 3 else "alive")
+                for i in range(n)
+            ])
+
+
+async def _list(client, **params):
+    resp = await client.get("/job_intake", params={k: v for k, v in params.items() if v is not None})
+    assert resp.status_code == 200, resp.text
+    return resp.json()
+
+
+async def _walk(client, **filters):
+    seen, cursor = [], None
+    while True:
+        page = await _list(client, limit=4, cursor=cursor, **filters)
+        seen += [item["job_title"] for item in page["items"]]
+        if page["next_cursor"] is None:
+            return seen
+        cursor = page["next_cursor"]
+
+
+@pytest.mark.asyncio
+async def test_list_jobs_pages_newest_first_without_gaps(session_factory, client):
+    await _seed(session_factory, 11)
+    assert await _walk(client) == [f"Job {i}" for i in range(10, -1, -1)]
+    assert await _walk(client, status="alive") == ["Job 9", "Job 6", "Job 3", "Job 0"]
+    assert await _walk(client, host="h1.example") == [f"Job {i}" for i in (9, 7, 5, 3, 1)]
+    assert (await client.get("/job_intake", params={"cursor": "garbage"})).status_code == 400
+    for cursor in (encode_cursor(5), encode_cursor(None), encode_cursor("a", "b")):
+        assert (await client.get("/job_intake", params={"cursor": cursor})).status_code == 400
+    for cursor in (encode_cursor("1.5", "x"), encode_cursor(True, "x"), encode_cursor(1.5, 7)):
+        assert (await client.get("/job_intake", params={"cursor": cursor, "q": "acme"})).status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_list_and_get_return_projected_fields(session_factory, client):
+    await _seed(session_factory, 3)
+    full = (await _list(client))["items"][0]
+    assert list(full) == [
+        "id", "canonical_url", "company", "job_title", "location",
+        "source_host", "status", "next_action", "ats_req_id", "ats",
+    ]
+    assert (await client.get(f"/job_intake/{full['id']}")).json() == full
+
+    slim = await _list(client, fields="job_title, company", limit=2)
+    assert [list(i) for i in slim["items"]] == [["id", "company", "job_title"]] * 2
+    assert slim["next_cursor"] is not None
+    got = (await client.get(f"/job_intake/{full['id']}", params={"fields": "status"})).json()
+    assert got == {"id": full["id"], "status": full["status"]}
+
+    assert (await client.get("/job_intake", params={"fields": "id,capture_ids"})).status_code == 400
+    assert (await client.get("/job_intake/nope")).status_code == 404
+
+
+def _pairs(page):
+    return [(i["company"], i["job_title"]) for i in page["items"]]
+
+
+@pytest.mark.asyncio
+async def test_list_jobs_full_text_search(session_factory, client):
+    from sqlalchemy import delete, text, update
+
+    async with session_factory() as session:
+        async with session.begin():
+            session.add_all([
+                _posting("https://h.example/1", "Acme", "Backend Engineer", "Berlin"),
+                _posting("https://h.example/2", "Acme Backend Tools", "Backend Engineer", "Remote"),
+                _posting("https://h.example/3", "Globex", "Frontend Developer", "Berlin"),
+                _posting("https://h.example/4", "Initech", "Data Engineer", None),
+            ])
+
+    # every word is a prefix; more matching columns rank higher
+    assert _pairs(await _list(client, q="acm back")) == [
+        ("Acme Backend Tools", "Backend Engineer"), ("Acme", "Backend Engineer"),
+    ]
+    assert {i["company"] for i in (await _list(client, q="berl"))["items"]} == {"Acme", "Globex"}
+    assert len((await _list(client, q="***"))["items"]) == 4  # nothing searchable: no filter
+
+    # rank + id cursor walks the whole result set
+    first = await _list(client, q="engineer", limit=2)
+    rest = await _list(client, q="engineer", limit=2, cursor=first["next_cursor"])
+    assert rest["next_cursor"] is None
+    assert len({i["id"] for i in first["items"] + rest["items"]}) == 3
+
+    # triggers keep the index in sync with updates and deletes
+    async with session_factory() as session:
+        async with session.begin():
+            await session.execute(update(JobPosting).where(JobPosting.company == "Initech").values(company="Umbrella"))
+            await session.execute(delete(JobPosting).where(JobPosting.company == "Globex"))
+    assert _pairs(await _list(client, q="umbr")) == [("Umbrella", "Data Engineer")]
+    assert (await _list(client, q="initech"))["items"] == []
+    assert (await _list(client, q="globex"))["items"] == []
+
+    # VACUUM may renumber job_postings rowids (String primary key); the index does not use them
+    async with session_factory() as session:
+        async with session.begin():
+            await session.execute(text("UPDATE job_postings SET rowid = rowid + 100"))
+            session.add(_posting("https://h.example/5", "Hooli", "Backend Engineer", "Berlin"))
+    assert _pairs(await _list(client, q="umbr")) == [("Umbrella", "Data Engineer")]
+    assert {i["company"] for i in (await _list(client, q="berl"))["items"]} == {"Acme", "Hooli"}
+
+
+@pytest.mark.asyncio
+async def test_etags_and_invalidation_on_commit(session_factory, client):
+    import csv
+    import io
+
+    from sqlalchemy import update
+
+    from auto_apply_ai.services.job_intake.import_pipeline import process_csv_reader
+
+    await _seed(session_factory, 2)
+    page = await client.get("/job_intake")
+    job = page.json()["items"][0]
+    first = await client.get(f"/job_intake/{job['id']}")
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "no-cache"
+
+    revalidated = await client.get(f"/job_intake/{job['id']}", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304 and revalidated.headers["etag"] == etag
+
+    # ORM write: picked up by the flush hook, bumped on commit
+    async with session_factory() as session:
+        async with session.begin():
+            posting = await session.get(JobPosting, job["id"])
+            posting.company = "Renamed"
+    changed = await client.get(f"/job_intake/{job['id']}", headers={"If-None-Match": etag})
+    assert changed.status_code == 200 and changed.json()["company"] == "Renamed"
+    assert changed.headers["etag"] != etag
+
+    # a rolled back write does not invalidate
+    etag = changed.headers["etag"]
+    async with session_factory() as session:
+        await session.execute(update(JobPosting).values(company="Nope"))
+        await session.rollback()
+    assert (await client.get(f"/job_intake/{job['id']}", headers={"If-None-Match": etag})).status_code == 304
+
+    # bulk import path invalidates list pages
+    list_etag = (await client.get("/job_intake")).headers["etag"]
+    rows = csv.DictReader(io.StringIO("source_url,company,job_title\nhttps://h9.example/jobs/1,Initech,SRE\n"))
+    async with session_factory() as session:
+        await process_csv_reader(rows, session, False, "b-etag")
+    fresh = await client.get("/job_intake", headers={"If-None-Match": list_etag})
+    assert fresh.status_code == 200 and len(fresh.json()["items"]) == 3
+
+
+@pytest.mark.asyncio
+async def test_bulk_status_and_delete(session_factory, client, monkeypatch):
+    import csv
+    import io
+
+    from sqlalchemy import func, select
+
+    from auto_apply_ai.config.settings import settings
+    from auto_apply_ai.models.entities import JobCapture, PostingCapture
+    from auto_apply_ai.services.job_intake.import_pipeline import process_csv_reader
+
+    rows = csv.DictReader(io.StringIO("source_url,company,job_title\n" + "".join(
+        f"https://h{i % 2}.example/jobs/{i},Acme,Job {i}\n" for i in range(7)
+    )))
+    async with session_factory() as session:
+        await process_csv_reader(rows, session, False, "b-bulk")
+    monkeypatch.setattr(settings, "BULK_CHUNK_SIZE", 3)  # force several chunks
+
+    resp = await client.post("/job_intake/bulk/status", json={
+        "where": {"host": "h0.example"}, "status": "expired", "next_action": "drop",
+    })
+    assert resp.json() == {"updated": 4}
+    assert sorted(await _walk(client, status="expired")) == ["Job 0", "Job 2", "Job 4", "Job 6"]
+    assert {i["next_action"] for i in (await _list(client, status="expired"))["items"]} == {"drop"}
+
+    # ids AND filters: only the expired ones among the ids; unknown ids are ignored
+    ids = [i["id"] for i in (await _list(client))["items"] if i["job_title"] in ("Job 6", "Job 5", "Job 4")]
+    resp = await client.post("/job_intake/bulk/delete", json={"where": {"ids": ids + ["nope"], "status": "expired"}})
+    assert resp.json() == {"postings": 2, "captures": 2, "ats_resolutions": 0}
+
+    resp = await client.post("/job_intake/bulk/delete", json={"where": {"status": "expired"}})
+    assert resp.json()["postings"] == 2
+    assert sorted(await _walk(client)) == ["Job 1", "Job 3", "Job 5"]
+    async with session_factory() as session:
+        assert await session.scalar(select(func.count()).select_from(JobCapture)) == 3
+        assert await session.scalar(select(func.count()).select_from(PostingCapture)) == 3
+
+    # an empty selector would match everything; unknown statuses are rejected
+    assert (await client.post("/job_intake/bulk/delete", json={"where": {}})).status_code == 422
+    assert (await client.post("/job_intake/bulk/status", json={"where": {"host": "h1.example"}, "status": "gone"})).status_code == 422
+    assert (await client.post("/job_intake/bulk/status", json={"where": {"host": "h1.example"}})).status_code == 422
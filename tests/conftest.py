@@ -0,0 +1,24 @@
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+
+from auto_apply_ai.db.cache import MemoryCacheBackend, PostingReadCache
+from auto_apply_ai.db.engine import Base
+import auto_apply_ai.models.entities  # noqa: F401  (register tables on Base)
+
+
+@pytest_asyncio.fixture
+async def session_factory(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def read_cache(monkeypatch):
+    """A fresh in-process posting read cache (CACHE_BACKEND="memory"), installed for this test."""
+    cache = PostingReadCache(MemoryCacheBackend(max_entries=1000), ttl=60)
+    monkeypatch.setattr("auto_apply_ai.db.cache.read_cache", cache)
+    monkeypatch.setattr("auto_apply_ai.api.routers.job_intake.read_cache", cache)
+    return cache
@@ -0,0 +1,77 @@
+import threading
+import time
+
+import pytest
+
+from auto_apply_ai.api.responses import cached_json
+from auto_apply_ai.config.settings import settings
+from auto_apply_ai.db.cache import MemoryCacheBackend, PostingReadCache, build_read_cache
+
+
+def test_memory_backend_evicts_lru_and_expires():
+    backend = MemoryCacheBackend(max_entries=2)
+    backend.set("a", b"1")
+    backend.set("b", b"2")
+    assert backend.get("a") == b"1"  # a is now most recent
+    backend.set("c", b"3")
+    assert backend.get("b") is None and backend.get("a") == b"1"
+
+    backend.set("t", b"x", ttl=0.01)
+    time.sleep(0.02)
+    assert backend.get("t") is None
+    assert not backend.add("a", b"other") and backend.add("t", b"y")
+
+
+def test_versions_survive_eviction_without_stale_etags():
+    cache = PostingReadCache(MemoryCacheBackend(max_entries=2), ttl=60)
+    before = cache.posting_etag("p1")
+    assert cache.posting_etag("p1") == before
+    cache.bump(["p1"])
+    after = cache.posting_etag("p1")
+    assert after != before
+
+    cache.backend.clear()  # versions evicted: re-seeded from the clock, never back to an old value
+    assert cache.posting_etag("p1") != before
+    assert cache.list_etag("page") != before
+
+
+class BlockingBackend(MemoryCacheBackend):
+    """Stands in for Redis: records which threads the cache calls ran on."""
+
+    blocking = True
+
+    def __init__(self):
+        super().__init__(max_entries=100)
+        self.threads = set()
+
+    def get(self, key):
+        self.threads.add(threading.get_ident())
+        return super().get(key)
+
+    def set(self, key, value, ttl=None):
+        self.threads.add(threading.get_ident())
+        super().set(key, value, ttl)
+
+
+@pytest.mark.asyncio
+async def test_blocking_backend_is_called_off_the_event_loop():
+    backend = BlockingBackend()
+    cache = PostingReadCache(backend, ttl=60)
+
+    async def load():
+        return {"id": "p1"}
+
+    etag = await cache.aposting_etag("p1")
+    first = await cached_json(cache, etag, None, load)
+    second = await cached_json(cache, etag, None, load)
+    assert first.body == second.body == b'{"id":"p1"}' and first.headers["etag"] == etag
+    assert backend.threads and threading.get_ident() not in backend.threads
+
+
+def test_memory_backend_is_opt_in_and_refused_with_several_workers(monkeypatch):
+    assert build_read_cache() is None  # default: no cache, nothing to go stale
+    monkeypatch.setattr(settings, "CACHE_BACKEND", "memory")
+    assert isinstance(build_read_cache().backend, MemoryCacheBackend)
+    monkeypatch.setenv("WEB_CONCURRENCY", "4")
+    with pytest.raises(RuntimeError, match="redis"):
+        build_read_cache()
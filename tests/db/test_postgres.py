@@ -0,0 +1,109 @@
+"""
+PostgreSQL backend parity. Needs a throwaway database:
+
+    TEST_POSTGRES_URL=postgresql+asyncpg://postgres@localhost/auto_apply_test pytest tests/db/test_postgres.py
+"""
+import csv
+import io
+import os
+
+import httpx
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from auto_apply_ai.db.engine import Base, create_write_engine
+from auto_apply_ai.models.entities import ImportCheckpoint, JobCapture, JobPosting, PostingCapture
+from auto_apply_ai.services.job_intake.import_pipeline import process_csv_reader
+
+PG_URL = os.environ.get("TEST_POSTGRES_URL")
+pytestmark = pytest.mark.skipif(not PG_URL, reason="TEST_POSTGRES_URL not set")
+
+CSV_TEXT = """source_url,company,job_title,location,tags,captured_at
+https://boards.greenhouse.io/acme/jobs/1?utm_source=x,Acme,Backend Engineer,Remote,"python, sql",2025-01-01T00:00:00Z
+https://boards.greenhouse.io/acme/jobs/1,,Backend Engineer,,,2025-01-02T00:00:00Z
+https://www.linkedin.com/jobs/view/99,Acme,Backend Engineer,Berlin,,2025-01-03T00:00:00Z
+https://jobs.lever.co/acme/2,Acme,Data Engineer,,,2025-01-04T00:00:00Z
+not-a-url,Acme,Broken,,,2025-01-05T00:00:00Z
+https://www.linkedin.com/jobs/view/100,Acme,Data Engineer,NYC,,2025-01-06T00:00:00Z
+"""
+
+
+def _reader():
+    return csv.DictReader(io.StringIO(CSV_TEXT))
+
+
+@pytest_asyncio.fixture
+async def pg_session_factory():
+    engine = create_write_engine(PG_URL)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
+
+
+async def _snapshot(factory):
+    async with factory() as session:
+        rows = (await session.execute(
+            select(JobPosting.canonical_url, JobPosting.company, JobPosting.job_title, JobPosting.location,
+                   func.count(PostingCapture.capture_id))
+            .outerjoin(PostingCapture, PostingCapture.posting_id == JobPosting.id)
+            .group_by(JobPosting.id)
+        )).all()
+        captures = (await session.execute(select(JobCapture.source_url, JobCapture.tags))).all()
+    return sorted(map(tuple, rows)), sorted((u, tuple(t)) for u, t in captures)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("batch_size, copy", [(1, False), (1000, False), (1000, True)])
+async def test_import_matches_sqlite(session_factory, pg_session_factory, monkeypatch, batch_size, copy):
+    # batch_size=1: ORM path + link_capture upsert; 1000: executemany or COPY + INSERT ... ON CONFLICT merges
+    from auto_apply_ai.config.settings import settings
+
+    monkeypatch.setattr(settings, "IMPORT_PG_COPY", copy)
+    for factory in (session_factory, pg_session_factory):
+        async with factory() as session:
+            assert (await process_csv_reader(_reader(), session, False, "b1", batch_size=batch_size, commit_every=2))[:2] == (5, 1)
+        async with factory() as session:  # re-import: everything dedupes onto the same postings
+            await process_csv_reader(_reader(), session, False, "b2", batch_size=batch_size)
+    assert await _snapshot(pg_session_factory) == await _snapshot(session_factory)
+    async with pg_session_factory() as session:
+        assert (await session.get(ImportCheckpoint, "b1")).last_row_index == 5
+
+
+@pytest.mark.asyncio
+async def test_api_on_postgres(pg_session_factory, read_cache):
+    from auto_apply_ai.api.app import create_app
+    from auto_apply_ai.api.deps import get_read_session, get_session, get_writer
+    from auto_apply_ai.db.writer import SessionWriter
+
+    async def session_override():
+        async with pg_session_factory() as session:
+            yield session
+
+    app = create_app()
+    app.dependency_overrides[get_session] = session_override
+    app.dependency_overrides[get_read_session] = session_override
+    app.dependency_overrides[get_writer] = lambda: SessionWriter(pg_session_factory)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        resp = await client.post("/job_intake/csv", files={"file": ("jobs.csv", CSV_TEXT)})
+        assert resp.json()["accepted"] == 5
+
+        first = (await client.get("/job_intake", params={"limit": 2})).json()
+        rest = (await client.get("/job_intake", params={"limit": 2, "cursor": first["next_cursor"]})).json()
+        assert len(first["items"]) + len(rest["items"]) == 4 and rest["next_cursor"] is None
+
+        found = (await client.get("/job_intake", params={"q": "data eng"})).json()["items"]
+        assert {i["canonical_url"] for i in found} == {
+            "https://jobs.lever.co/acme/2", "https://www.linkedin.com/jobs/view/100",
+        }
+
+        resp = await client.post("/job_intake/bulk/delete", json={"where": {"host": "www.linkedin.com"}})
+        assert resp.json() == {"postings": 2, "captures": 2, "ats_resolutions": 0}
+        (lever,) = [i["id"] for i in found if i["canonical_url"] == "https://jobs.lever.co/acme/2"]
+        assert (await client.delete(f"/job_intake/{lever}")).status_code == 204
+        assert (await client.delete(f"/job_intake/{lever}")).status_code == 404
@@ -0,0 +1,184 @@
+import asyncio
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, inspect, select, text, update
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from auto_apply_ai.db.schema import BASE_REVISION, SCHEMA_REVISION, SchemaMismatch, alembic_version, ensure_schema
+from auto_apply_ai.utils.ids import uuid7
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def test_schema_revision_is_alembic_head():
+    alembic_config = pytest.importorskip("alembic.config")
+    from alembic.script import ScriptDirectory
+
+    config = alembic_config.Config(str(ROOT / "alembic.ini"))
+    config.set_main_option("script_location", str(ROOT / "alembic"))
+    assert ScriptDirectory.from_config(config).get_current_head() == SCHEMA_REVISION
+
+
+@pytest.mark.asyncio
+async def test_ensure_schema_creates_once_then_only_checks(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'app.db'}")
+    try:
+        with pytest.raises(SchemaMismatch, match="no alembic revision"):
+            await ensure_schema(engine, create=False)
+
+        assert await ensure_schema(engine, create=True) == SCHEMA_REVISION
+        async with engine.connect() as conn:
+            tables = await conn.run_sync(lambda c: set(inspect(c).get_table_names()))
+            assert {"job_postings", "job_captures", "alembic_version"} <= tables
+            assert (await conn.execute(select(alembic_version.c.version_num))).scalar() == SCHEMA_REVISION
+        assert await ensure_schema(engine, create=False) == SCHEMA_REVISION
+
+        async with engine.begin() as conn:
+            await conn.execute(update(alembic_version).values(version_num="a8c10372e1a9"))
+        with pytest.raises(SchemaMismatch, match="a8c10372e1a9.*alembic upgrade head"):
+            await ensure_schema(engine, create=True)  # never create_all over an older schema
+    finally:
+        await engine.dispose()
+
+
+def _alembic(url, monkeypatch):
+    alembic_config = pytest.importorskip("alembic.config")
+    from alembic import command
+
+    monkeypatch.setattr("auto_apply_ai.config.settings.settings.DATABASE_URL", url)  # read by alembic/env.py
+    config = alembic_config.Config()  # no ini file: env.py leaves the test run's logging alone
+    config.set_main_option("script_location", str(ROOT / "alembic"))
+    return command, config
+
+
+def test_legacy_create_all_database_is_stamped_base_and_must_be_upgraded(tmp_path, monkeypatch):
+    url = f"sqlite+aiosqlite:///{tmp_path / 'legacy.db'}"
+    command, config = _alembic(url, monkeypatch)
+    command.upgrade(config, BASE_REVISION)  # the tables the old create_all startup made ...
+    sync_url = f"sqlite:///{tmp_path / 'legacy.db'}"
+    with create_engine(sync_url).begin() as conn:
+        conn.execute(text("DROP TABLE alembic_version"))  # ... without a version table
+        conn.execute(text(
+            "INSERT INTO job_postings (id, canonical_url, company, job_title, source_host, status, next_action, "
+            "capture_ids, dedupe_key_exact, dedupe_key_company_title_host) VALUES ('p1', 'https://a.example/1', "
+            "'Acme', 'SRE', 'a.example', 'new', 'retry_fetch', '[\"c1\", \"gone\"]', :exact, :cth)"
+        ), {"exact": "ab" * 20, "cth": "cd" * 20})
+        conn.execute(text("INSERT INTO job_captures (id, source_url, captured_at) VALUES ('c1', 'https://a.example/1', '2025-01-01')"))
+
+    async def check(create):
+        engine = create_async_engine(url)
+        try:
+            return await ensure_schema(engine, create=create)
+        finally:
+            await engine.dispose()
+
+    with pytest.raises(SchemaMismatch, match="no alembic revision"):
+        asyncio.run(check(False))  # nothing written without DB_CREATE_SCHEMA
+    with pytest.raises(SchemaMismatch, match=f"stamped it {BASE_REVISION}.*alembic upgrade head"):
+        asyncio.run(check(True))
+    with pytest.raises(SchemaMismatch, match=f"schema is at {BASE_REVISION}"):
+        asyncio.run(check(True))  # never create_all over the legacy tables
+
+    command.upgrade(config, "head")
+    assert asyncio.run(check(False)) == SCHEMA_REVISION
+    with create_engine(sync_url).connect() as conn:
+        inspector = inspect(conn)
+        assert "job_postings_fts" in inspector.get_table_names()
+        assert "capture_ids" not in {c["name"] for c in inspector.get_columns("job_postings")}
+        keys = conn.execute(text("SELECT dedupe_key_exact, dedupe_key_company_title_host FROM job_postings")).one()
+        assert tuple(keys) == (bytes.fromhex("ab" * 16), bytes.fromhex("cd" * 16))
+        (posting_id,) = conn.execute(text("SELECT id FROM job_postings")).one()  # 'p1', re-keyed to a uuid7
+        assert conn.execute(text("SELECT posting_id, capture_id FROM posting_captures")).all() == [(posting_id, "c1")]
+
+
+def test_legacy_posting_ids_are_rekeyed_in_capture_order(tmp_path, monkeypatch):
+    url = f"sqlite+aiosqlite:///{tmp_path / 'ids.db'}"
+    command, config = _alembic(url, monkeypatch)
+    command.upgrade(config, "9b4d2f6e8a15")
+    legacy = [str(uuid.uuid4()) for _ in range(3)]
+    kept = uuid7()
+    with create_engine(f"sqlite:///{tmp_path / 'ids.db'}").begin() as conn:
+        for i, posting_id in enumerate(legacy + [kept]):
+            conn.execute(text(
+                "INSERT INTO job_postings (id, canonical_url, company, job_title, source_host, status, next_action, "
+                "dedupe_key_exact, dedupe_key_company_title_host) VALUES (:id, :url, 'Acme', 'SRE', 'a.example', "
+                "'new', 'retry_fetch', :key, :key)"
+            ), {"id": posting_id, "url": f"https://a.example/{i}", "key": bytes([i]) * 16})
+        # legacy[0] captured last, legacy[1] first (twice), legacy[2] never
+        for capture_id, posting_id, captured_at in [("c1", legacy[0], "2025-03-01 10:00:00.000000"),
+                                                     ("c2", legacy[1], "2025-01-01 00:00:00+00:00"),
+                                                     ("c3", legacy[1], "2025-02-01 00:00:00")]:
+            conn.execute(text("INSERT INTO job_captures (id, source_url, captured_at) VALUES (:id, 'x', :at)"),
+                         {"id": capture_id, "at": captured_at})
+            conn.execute(text("INSERT INTO posting_captures (posting_id, capture_id) VALUES (:p, :c)"),
+                         {"p": posting_id, "c": capture_id})
+        conn.execute(text("INSERT INTO ats_resolutions (id, posting_id, ats_type, confidence, method) "
+                          "VALUES ('r1', :p, 'lever', 1.0, 'url')"),
+                     {"p": legacy[0]})
+
+    command.upgrade(config, "head")
+    with create_engine(f"sqlite:///{tmp_path / 'ids.db'}").connect() as conn:
+        ids = dict(conn.execute(text("SELECT canonical_url, id FROM job_postings")).all())
+        links = dict(conn.execute(text("SELECT capture_id, posting_id FROM posting_captures")).all())
+        resolution = conn.execute(text("SELECT posting_id FROM ats_resolutions")).scalar()
+    first, second, never, new = (ids[f"https://a.example/{i}"] for i in range(4))
+    assert new == kept
+    assert all(uuid.UUID(i).version == 7 for i in (first, second, never))
+    assert never < second < first < kept < uuid7()  # ORDER BY id is creation order again
+    assert uuid.UUID(second).int >> 80 == int(datetime(2025, 1, 1, tzinfo=timezone.utc).timestamp() * 1000)
+    assert links == {"c1": first, "c2": second, "c3": second} and resolution == first
+
+
+def test_search_index_moves_to_stable_keys_and_back(tmp_path, monkeypatch):
+    url = f"sqlite+aiosqlite:///{tmp_path / 'fts.db'}"
+    command, config = _alembic(url, monkeypatch)
+    command.upgrade(config, "3e6b1d9c7f02")
+    engine = create_engine(f"sqlite:///{tmp_path / 'fts.db'}")
+    with engine.begin() as conn:
+        for i, company in enumerate(["Acme", "Globex", "Initech"]):
+            conn.execute(text(
+                "INSERT INTO job_postings (id, canonical_url, company, job_title, source_host, status, next_action, "
+                "dedupe_key_exact, dedupe_key_company_title_host) VALUES (:id, :url, :company, 'SRE', 'a.example', "
+                "'new', 'retry_fetch', :key, :key)"
+            ), {"id": f"p{i}", "url": f"https://a.example/{i}", "company": company, "key": bytes([i]) * 16})
+
+    def search(conn, word):
+        return conn.execute(text(
+            "SELECT k.posting_id FROM job_postings_fts f JOIN job_postings_search_keys k ON k.key = f.rowid "
+            "WHERE job_postings_fts MATCH :q"
+        ), {"q": word}).scalars().all()
+
+    command.upgrade(config, "6a2f8c4e1b93")
+    with engine.begin() as conn:
+        assert search(conn, "globex") == ["p1"]  # backfilled
+        conn.execute(text("UPDATE job_postings SET rowid = rowid + 10"))
+        conn.execute(text("UPDATE job_postings SET company = 'Umbrella' WHERE id = 'p2'"))
+        conn.execute(text("DELETE FROM job_postings WHERE id = 'p0'"))
+        assert search(conn, "umbrella") == ["p2"] and search(conn, "acme") == []
+
+    command.downgrade(config, "3e6b1d9c7f02")
+    with engine.connect() as conn:
+        found = conn.execute(text(
+            "SELECT p.id FROM job_postings_fts f JOIN job_postings p ON p.rowid = f.rowid "
+            "WHERE job_postings_fts MATCH 'umbrella'"
+        )).scalars().all()
+        assert found == ["p2"]
+    engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_unversioned_database_with_other_tables_is_not_touched(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'other.db'}")
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text("CREATE TABLE job_postings (id VARCHAR PRIMARY KEY)"))
+            await conn.execute(text("CREATE TABLE import_jobs (id VARCHAR PRIMARY KEY)"))
+        with pytest.raises(SchemaMismatch, match="import_jobs, job_postings.*alembic stamp"):
+            await ensure_schema(engine, create=True)
+        async with engine.connect() as conn:
+            assert await conn.run_sync(lambda c: set(inspect(c).get_table_names())) == {"import_jobs", "job_postings"}
+    finally:
+        await engine.dispose()
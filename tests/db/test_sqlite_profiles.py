@@ -0,0 +1,74 @@
+import os
+
+import pytest
+from sqlalchemy import event, text
+
+from auto_apply_ai.db.engine import Base, create_write_engine
+from auto_apply_ai.db.maintenance import SqliteMaintenance
+from auto_apply_ai.db.sqlite_profiles import PROFILE_KEY, sqlite_profile
+
+
+async def _pragmas(engine):
+    async with engine.connect() as conn:
+        return tuple([(await conn.exec_driver_sql(f"PRAGMA {p}")).scalar() for p in ("synchronous", "cache_size", "mmap_size")])
+
+
+@pytest.mark.asyncio
+async def test_profile_switch_applies_inside_block_only(tmp_path):
+    engine = create_write_engine(f"sqlite+aiosqlite:///{tmp_path / 'p.db'}", profile="balanced")
+    try:
+        balanced = await _pragmas(engine)
+        assert balanced == (1, -32768, 268435456)
+        with sqlite_profile("durable"):
+            assert await _pragmas(engine) == (2, -2000, 0)  # unlisted pragmas reset to SQLite defaults
+        assert await _pragmas(engine) == balanced
+        with pytest.raises(ValueError, match="unknown SQLite profile"):
+            with sqlite_profile("turbo"):
+                pass
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_import_runs_with_import_profile(tmp_path):
+    import csv
+    import io
+
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    from auto_apply_ai.services.job_intake.import_pipeline import process_csv_reader
+
+    engine = create_write_engine(f"sqlite+aiosqlite:///{tmp_path / 'i.db'}", profile="balanced")
+    seen = []
+    event.listen(engine.sync_engine, "checkout", lambda _c, record, _p: seen.append(record.info[PROFILE_KEY]))
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        rows = csv.DictReader(io.StringIO("source_url,company,job_title\nhttps://h.example/jobs/1,Acme,SRE\n"))
+        async with async_sessionmaker(engine, class_=AsyncSession)() as session:
+            await process_csv_reader(rows, session, False, "b1", storage_profile="bulk_import")
+        assert seen[-1] == "bulk_import"
+        assert await _pragmas(engine) == (1, -32768, 268435456)
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_truncates_wal(tmp_path):
+    path = tmp_path / "w.db"
+    engine = create_write_engine(f"sqlite+aiosqlite:///{path}", single_writer=True)
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text("CREATE TABLE t (x BLOB)"))
+        for _ in range(20):
+            async with engine.begin() as conn:
+                await conn.execute(text("INSERT INTO t VALUES (randomblob(8000))"))
+        assert os.path.getsize(f"{path}-wal") > 0
+
+        busy, frames, done = await SqliteMaintenance(engine, truncate_frames=10).checkpoint()
+        assert busy == 0 and frames == done == 0  # TRUNCATE ran: nothing left in the log
+        assert os.path.getsize(f"{path}-wal") == 0
+        async with engine.begin() as conn:  # explicit BEGIN still in force after the AUTOCOMMIT connection
+            await conn.execute(text("INSERT INTO t VALUES (1)"))
+    finally:
+        await engine.dispose()
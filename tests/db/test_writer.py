@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from auto_apply_ai.db.cache import mark_postings_changed
+from auto_apply_ai.db.engine import Base, create_read_engine, create_write_engine
+from auto_apply_ai.db.writer import GroupCommitWriter
+from auto_apply_ai.models.entities import ImportCheckpoint
+from auto_apply_ai.utils.time import now_utc
+
+
+@pytest_asyncio.fixture
+async def single_writer_db(tmp_path):
+    url = f"sqlite+aiosqlite:///{tmp_path / 'writer.db'}"
+    engine = create_write_engine(url, single_writer=True)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield url, async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+    await engine.dispose()
+
+
+def _checkpoint(batch_id, fail=False):
+    async def work(session):
+        session.add(ImportCheckpoint(batch_id=batch_id, last_row_index=0, updated_at=now_utc()))
+        mark_postings_changed(session, [f"posting-{batch_id}"])
+        await session.flush()
+        if fail:
+            raise ValueError(batch_id)
+        return batch_id
+    return work
+
+
+@pytest.mark.asyncio
+async def test_group_commit_coalesces_units_and_isolates_failures(single_writer_db, read_cache):
+    _, factory = single_writer_db
+    writer = GroupCommitWriter(factory, max_batch=8, max_delay_ms=20)
+    version = read_cache.posting_version("posting-b0")
+    try:
+        results = await asyncio.gather(
+            *(writer.submit(_checkpoint(f"b{i}", fail=i == 3)) for i in range(20)), return_exceptions=True,
+        )
+    finally:
+        await writer.stop()
+
+    assert [r for r in results if isinstance(r, Exception)] == [results[3]]
+    assert isinstance(results[3], ValueError)
+    assert results[:3] == ["b0", "b1", "b2"]
+    assert writer.units == 20 and writer.commits < 20
+    async with factory() as session:
+        ids = (await session.execute(select(ImportCheckpoint.batch_id))).scalars().all()
+    assert sorted(ids) == sorted(f"b{i}" for i in range(20) if i != 3)
+    assert read_cache.posting_version("posting-b0") > version  # bumped once the outer transaction committed
+
+
+@pytest.mark.asyncio
+async def test_read_engine_is_read_only(single_writer_db):
+    url, factory = single_writer_db
+    async with factory() as session:
+        session.add(ImportCheckpoint(batch_id="w", last_row_index=0, updated_at=now_utc()))
+        await session.commit()
+
+    reader = create_read_engine(url)
+    try:
+        async with reader.connect() as conn:
+            assert await conn.scalar(select(func.count()).select_from(ImportCheckpoint)) == 1
+            with pytest.raises(OperationalError, match="readonly"):
+                await conn.execute(text("DELETE FROM import_checkpoints"))
+    finally:
+        await reader.dispose()
@@ -0,0 +1,163 @@
+import threading
+
+import pytest
+
+from auto_apply_ai.services.jd_parser.browser_pool import BrowserPool, ThreadedBrowserPool
+
+
+class FakePage:
+    def __init__(self, context):
+        self.context = context
+
+    def close(self):
+        self.context.pages.remove(self)
+
+
+class FakeContext:
+    def __init__(self, browser):
+        self.browser = browser
+        self.pages = []
+        self.handlers = []
+        self.cookies_cleared = 0
+        self.closed = False
+
+    def on(self, event, handler):
+        assert event == "page"
+        self.handlers.append(handler)
+
+    def new_page(self):
+        page = FakePage(self)
+        self.pages.append(page)
+        for handler in self.handlers:
+            handler(page)
+        return page
+
+    def clear_cookies(self):
+        self.cookies_cleared += 1
+
+    def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self, marker):
+        self.marker = marker
+        self.contexts = []
+        self.closed = False
+
+    def new_context(self, **options):
+        context = FakeContext(self)
+        self.contexts.append(context)
+        return context
+
+    def close(self):
+        self.closed = True
+
+
+def make_pool(**kwargs):
+    browsers = []
+
+    def launch(marker):
+        browsers.append(FakeBrowser(marker))
+        return browsers[-1]
+
+    kwargs.setdefault("max_rss_mb", 0)
+    return BrowserPool(launch=launch, **kwargs), browsers
+
+
+def test_contexts_are_reused_then_replaced_and_browsers_stay_warm():
+    pool, browsers = make_pool(size=2, max_pages=0, context_max_uses=3)
+    pool.start()
+    assert len(browsers) == 2
+
+    seen = []
+    for _ in range(4):
+        with pool.lease() as context:
+            context.new_page()
+            seen.append(context)
+    assert len(browsers) == 2  # no launch per fetch
+    assert seen[0] is seen[1] is seen[2] and seen[3] is not seen[0]
+    assert seen[0].closed and seen[0].cookies_cleared == 2
+
+    with pytest.raises(RuntimeError):
+        with pool.lease() as context:
+            raise RuntimeError("navigation failed")
+    assert context.closed  # never handed out again
+    pool.close()
+    assert all(b.closed for b in browsers)
+
+
+def test_nested_leases_spread_over_browsers():
+    pool, browsers = make_pool(size=2, max_pages=0)
+    with pool.lease() as first, pool.lease() as second:
+        assert first.browser is not second.browser
+        assert pool.stats()["leased"] == 2
+    assert len(browsers) == 2
+
+
+def test_browser_recycled_after_page_budget_once_idle():
+    pool, browsers = make_pool(size=1, max_pages=3)
+    with pool.lease() as outer:
+        for _ in range(3):
+            with pool.lease() as context:
+                context.new_page()
+        # worn out: the next lease gets a new browser, the old one waits for `outer`
+        assert pool.stats()["draining"] == 1
+        assert not browsers[0].closed
+        with pool.lease() as context:
+            assert context.browser is browsers[1]
+    assert browsers[0].closed and not browsers[1].closed
+    stats = pool.stats()
+    assert (stats["browsers"], stats["draining"], stats["launched"], stats["retired"]) == (1, 0, 2, 1)
+
+
+def test_browser_recycled_above_memory_threshold(monkeypatch):
+    pool, browsers = make_pool(size=1, max_pages=0, max_rss_mb=500)
+    rss = {"mb": 100.0}
+    monkeypatch.setattr(pool, "browser_rss_mb", lambda slot: rss["mb"])
+    for _ in range(10):
+        with pool.lease() as context:
+            context.new_page()
+    assert len(browsers) == 1
+    rss["mb"] = 900.0
+    for _ in range(10):
+        with pool.lease() as context:
+            context.new_page()
+    assert browsers[0].closed
+    with pool.lease() as context:
+        assert context.browser is browsers[1]
+
+
+def test_threaded_pool_bounds_browsers_across_calling_threads():
+    pools, browsers = [], []
+
+    def pool_factory():
+        pool, launched = make_pool(size=1, max_pages=0)
+        pools.append(pool)
+        browsers.append(launched)
+        return pool
+
+    shared = ThreadedBrowserPool(size=2, pool_factory=pool_factory)
+    gate = threading.Barrier(2)
+
+    def work(context):
+        gate.wait(timeout=5)  # two calls in flight at once need both browser threads
+        context.new_page()
+        return threading.current_thread().name
+
+    names = []
+    callers = [threading.Thread(target=lambda: names.append(shared.run(work))) for _ in range(8)]
+    for caller in callers:
+        caller.start()
+    for caller in callers:
+        caller.join()
+    assert len(names) == 8 and len(set(names)) == 2
+    assert not any(name == threading.current_thread().name for name in names)
+    assert len(pools) == 2 and sum(len(b) for b in browsers) == 2  # not one pool per caller
+
+    with pytest.raises(ValueError):
+        shared.run(lambda context: int("not a number"))
+    shared.close()
+    assert all(b.closed for launched in browsers for b in launched)
+    with pytest.raises(RuntimeError):
+        shared.run(work)
@@ -0,0 +1,147 @@
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import httpx
+import pytest
+
+from auto_apply_ai.services.jd_parser.crawler import CrawlEngine, CrawlTarget, parse_results
+
+
+@pytest.fixture
+def fixture_server():
+    """Local job pages; ?sleep=<s> delays the response. Records in-flight requests per `host` param."""
+    lock = threading.Lock()
+    state = {"in_flight": {}, "peak": {}, "peak_total": 0, "starts": {}}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            query = parse_qs(urlsplit(self.path).query)
+            host = query.get("host", ["-"])[0]
+            with lock:
+                state["in_flight"][host] = state["in_flight"].get(host, 0) + 1
+                state["peak"][host] = max(state["peak"].get(host, 0), state["in_flight"][host])
+                state["peak_total"] = max(state["peak_total"], sum(state["in_flight"].values()))
+                state["starts"].setdefault(host, []).append(time.monotonic())
+            time.sleep(float(query.get("sleep", ["0.05"])[0]))
+            with lock:
+                state["in_flight"][host] -= 1
+            body = f"<main><h1>{self.path}</h1></main>".encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", state
+    server.shutdown()
+
+
+def http_fetch(client):
+    async def fetch(target):
+        resp = await client.get(target.url)
+        resp.raise_for_status()
+        return resp.text
+    return fetch
+
+
+def targets(base, hosts, per_host, sleep=0.05):
+    return [
+        CrawlTarget(url=f"{base}/jobs/{h}-{i}?host={h}&sleep={sleep}", host=h)
+        for i in range(per_host) for h in hosts
+    ]
+
+
+@pytest.mark.asyncio
+async def test_crawl_respects_global_and_per_host_limits(fixture_server):
+    base, state = fixture_server
+    async with httpx.AsyncClient(limits=httpx.Limits(max_connections=50)) as client:
+        engine = CrawlEngine(fetch=http_fetch(client), concurrency=6, per_host=2, host_delay=0, timeout=5)
+        results = [r async for r in engine.crawl(targets(base, ["a", "b", "c", "d"], 6))]
+    assert len(results) == 24 and all(r.ok for r in results)
+    assert {r.target.url for r in results} == {t.url for t in targets(base, ["a", "b", "c", "d"], 6)}
+    assert max(state["peak"].values()) == 2
+    assert state["peak_total"] <= 6
+
+
+@pytest.mark.asyncio
+async def test_host_delay_spaces_starts_without_blocking_other_hosts(fixture_server):
+    base, _ = fixture_server
+    slow_host = [CrawlTarget(url=f"{base}/jobs/s{i}?host=slow&sleep=0", host="slow") for i in range(3)]
+    others = targets(base, ["x"], 1, sleep=0)
+    starts = []
+    async with httpx.AsyncClient() as client:
+        fetch = http_fetch(client)
+
+        async def timed_fetch(target):
+            if target.host == "slow":
+                starts.append(time.monotonic())
+            return await fetch(target)
+
+        engine = CrawlEngine(fetch=timed_fetch, concurrency=4, per_host=4, host_delay=0.2, timeout=5)
+        order = [r.target.host async for r in engine.crawl(slow_host + others)]
+    assert all(b - a >= 0.19 for a, b in zip(starts, starts[1:]))
+    assert order.index("x") < 2  # not queued behind the delayed host
+
+
+@pytest.mark.asyncio
+async def test_timeouts_and_errors_become_results(fixture_server):
+    base, _ = fixture_server
+    urls = [f"{base}/jobs/slow?sleep=1", f"{base}/jobs/fast?sleep=0"]
+
+    async def fetch(target):
+        if "fast" in target.url:
+            raise ValueError("boom")
+        async with httpx.AsyncClient() as client:
+            return (await client.get(target.url)).text
+
+    results = {r.target.url: r async for r in CrawlEngine(fetch=fetch, host_delay=0, timeout=0.2).crawl(urls)}
+    assert results[urls[0]].error.startswith("timed out")
+    assert results[urls[1]].error == "ValueError: boom"
+    assert results[urls[0]].target.host == "127.0.0.1"
+
+
+@pytest.mark.asyncio
+async def test_results_stream_and_leaving_the_loop_cancels_fetches(fixture_server):
+    base, _ = fixture_server
+    cancelled = []
+    queue = asyncio.Queue()
+
+    async def fetch(target):
+        if "hang" in target.url:
+            try:
+                await asyncio.sleep(30)
+            except asyncio.CancelledError:
+                cancelled.append(target.url)
+                raise
+        return target.url
+
+    crawl = CrawlEngine(fetch=fetch, host_delay=0, timeout=60).crawl(queue)
+    await queue.put(f"{base}/jobs/hang")
+    await queue.put(f"{base}/jobs/ok")
+    first = await anext(crawl)  # arrives while the other fetch and the queue are still open
+    assert first.content.endswith("/jobs/ok")
+    await crawl.aclose()
+    assert cancelled == [f"{base}/jobs/hang"]
+
+
+@pytest.mark.asyncio
+async def test_parse_stage_runs_on_finished_pages(fixture_server):
+    base, _ = fixture_server
+
+    async def fetch(target):
+        if target.url.endswith("bad"):
+            raise RuntimeError("404")
+        return target.url
+
+    results = CrawlEngine(fetch=fetch, host_delay=0).crawl([f"{base}/jobs/1", f"{base}/jobs/bad"])
+    parsed = {r.target.url: job async for r, job in parse_results(results, parse=lambda content: {"url": content})}
+    assert parsed == {f"{base}/jobs/1": {"url": f"{base}/jobs/1"}, f"{base}/jobs/bad": None}
@@ -0,0 +1,144 @@
+import pytest
+
+from auto_apply_ai.config.settings import settings
+from auto_apply_ai.models.entities import ATSTypes
+from auto_apply_ai.services.jd_parser.page_profiles import (
+    PROFILES, detect_ats, load_page, load_page_async, profile_for, should_block
+)
+
+GH = "https://boards.greenhouse.io/acme/jobs/1"
+WD = "https://acme.wd5.myworkdayjobs.com/en-US/Careers/job/SRE_1"
+
+
+class Route:
+    def __init__(self, url, resource_type):
+        self.request = type("Request", (), {"url": url, "resource_type": resource_type})()
+        self.outcome = None
+
+    def abort(self):
+        self.outcome = "abort"
+
+    def continue_(self):
+        self.outcome = "continue"
+
+
+class FakePage:
+    """Sync page that plays the given requests through the route handler on goto."""
+
+    def __init__(self, requests=(), ready=True):
+        self.requests = [Route(url, kind) for url, kind in requests]
+        self.ready = ready
+        self.calls = []
+        self.closed = False
+
+    def new_page(self):
+        return self
+
+    def route(self, pattern, handler):
+        self.handler = handler
+
+    def goto(self, url, **kwargs):
+        self.calls.append(("goto", kwargs["wait_until"], kwargs["timeout"]))
+        for route in self.requests:
+            self.handler(route)
+
+    def wait_for_function(self, script, arg, timeout):
+        self.calls.append(("ready", arg, timeout))
+        if not self.ready:
+            raise TimeoutError("Timeout exceeded")
+
+    def close(self):
+        self.closed = True
+
+
+def test_every_ats_type_has_a_profile_and_hosts_map_to_them():
+    assert set(PROFILES) == set(ATSTypes)
+    assert detect_ats(GH) == "greenhouse" and detect_ats(WD) == "workday"
+    assert detect_ats("https://jobs.lever.co/acme/123") == "lever"
+    assert detect_ats("https://careers.acme.com/jobs/1") == "unknown"
+    assert detect_ats("https://notgreenhouse.io/x") == "unknown"  # suffix match is on label boundaries
+    assert profile_for(GH).ats_type == "greenhouse" and profile_for(GH, "lever").ats_type == "lever"
+
+
+def test_trackers_are_always_blocked_heavy_resources_only_when_lite(monkeypatch):
+    gh = PROFILES["greenhouse"]
+    assert should_block(gh, GH, "https://www.googletagmanager.com/gtm.js", "script", lite=False)
+    assert not should_block(gh, GH, "https://boards.greenhouse.io/logo.png", "image", lite=False)
+    assert should_block(gh, GH, "https://boards.greenhouse.io/logo.png", "image", lite=True)
+    assert should_block(gh, GH, "https://fonts.gstatic.com/x.woff2", "font", lite=True)
+    monkeypatch.setattr(settings, "PAGE_BLOCK_TRACKERS", False)
+    assert not should_block(gh, GH, "https://www.googletagmanager.com/gtm.js", "script", lite=False)
+
+
+def test_lite_third_party_scripts_blocked_unless_first_party_or_allowed():
+    wd = PROFILES["workday"]
+    assert not should_block(wd, WD, "https://acme.wd5.myworkdayjobs.com/wday/cxs/job", "fetch", lite=True)
+    assert not should_block(wd, WD, "https://wd5.myworkdaycdn.com/app.js", "script", lite=True)
+    assert should_block(wd, WD, "https://cdn.widgets.example/chat.js", "script", lite=True)
+    assert not should_block(wd, WD, "https://cdn.widgets.example/page", "document", lite=True)
+    # no allow-list for arbitrary career sites: their own CDN scripts run
+    unknown = PROFILES["unknown"]
+    assert not should_block(unknown, "https://careers.acme.com/1", "https://cdn.jsdelivr.net/app.js", "script", lite=True)
+
+
+def test_load_page_waits_for_readiness_not_network_idle(monkeypatch):
+    monkeypatch.setattr(settings, "PAGE_LOAD_TIMEOUT_SECONDS", 30.0)
+    monkeypatch.setattr(settings, "PAGE_READY_TIMEOUT_SECONDS", 10.0)
+    page = FakePage([("https://boards.greenhouse.io/app.css", "stylesheet"),
+                     ("https://www.google-analytics.com/collect", "xhr"),
+                     ("https://boards.greenhouse.io/acme/jobs/1", "document")])
+    assert load_page(page, GH, lite=True) is page
+    assert [r.outcome for r in page.requests] == ["abort", "abort", "continue"]
+    assert page.calls[0] == ("goto", "domcontentloaded", 30000)
+    selectors, min_chars, body_min_chars = page.calls[1][1]
+    assert selectors[0] == ".job__description" and page.calls[1][2] == 10000
+    assert not page.closed
+
+
+def test_load_page_uses_an_unready_page_and_caps_timeouts_at_the_fetch_timeout():
+    page = FakePage(ready=False)
+    assert load_page(page, "https://careers.acme.com/1", timeout=5) is page
+    assert page.calls == [("goto", "domcontentloaded", 5000), ("ready", page.calls[1][1], 5000)]
+
+
+def test_load_page_closes_the_page_when_navigation_fails():
+    page = FakePage()
+
+    def goto(url, **kwargs):
+        raise RuntimeError("net::ERR_NAME_NOT_RESOLVED")
+    page.goto = goto
+    with pytest.raises(RuntimeError):
+        load_page(page, GH)
+    assert page.closed
+
+
+@pytest.mark.asyncio
+async def test_load_page_async_routes_through_the_profile():
+    class AsyncRoute(Route):
+        async def abort(self):
+            self.outcome = "abort"
+
+        async def continue_(self):
+            self.outcome = "continue"
+
+    class AsyncPage:
+        def __init__(self):
+            self.routes = [AsyncRoute("https://static.hotjar.com/c.js", "script"),
+                           AsyncRoute("https://boards.greenhouse.io/img.png", "image")]
+
+        async def new_page(self):
+            return self
+
+        async def route(self, pattern, handler):
+            self.handler = handler
+
+        async def goto(self, url, **kwargs):
+            for route in self.routes:
+                await self.handler(route)
+
+        async def wait_for_function(self, script, arg, timeout):
+            raise TimeoutError("Timeout exceeded")
+
+    page = AsyncPage()
+    assert await load_page_async(page, GH) is page
+    assert [r.outcome for r in page.routes] == ["abort", "continue"]  # full tier: trackers only
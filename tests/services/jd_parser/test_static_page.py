@@ -0,0 +1,58 @@
+import json
+
+from auto_apply_ai.services.jd_parser.static_page import extract_page
+
+POSTING = {
+    "@context": "https://schema.org",
+    "@type": "JobPosting",
+    "title": "Senior Data Engineer",
+    "hiringOrganization": {"@type": "Organization", "name": "Acme"},
+    "jobLocation": [{"@type": "Place", "address": {"addressLocality": "London", "addressCountry": "GB"}}],
+    "jobLocationType": "TELECOMMUTE",
+    "employmentType": ["FULL_TIME"],
+    "baseSalary": {"@type": "MonetaryAmount", "currency": "GBP",
+                   "value": {"@type": "QuantitativeValue", "minValue": 70000, "maxValue": "90000"}},
+    "experienceRequirements": {"@type": "OccupationalExperienceRequirements", "monthsOfExperience": 60},
+    "skills": "Python, SQL, Airflow",
+    "identifier": {"@type": "PropertyValue", "value": 4711},
+    "datePosted": "2025-01-02",
+    "description": "&lt;p&gt;Build &lt;b&gt;pipelines&lt;/b&gt;.&lt;/p&gt;&lt;ul&gt;&lt;li&gt;Own ingestion&lt;/li&gt;&lt;/ul&gt;",
+}
+
+
+def test_json_ld_job_posting_maps_to_job_desc_fields():
+    html = (
+        "<html><head><script type='application/ld+json'>"
+        + json.dumps({"@graph": [{"@type": "WebPage"}, POSTING]})
+        + "</script></head><body><div id='app'></div></body></html>"
+    )
+    page = extract_page(html, "https://boards.greenhouse.io/acme/jobs/4711")
+    assert page.source == "json-ld"
+    assert page.fields == {
+        "role": "Senior Data Engineer",
+        "company": "Acme",
+        "location": "Remote; London, GB",
+        "employment_type": "Full Time",
+        "salary": {"min": 70000.0, "max": 90000.0, "currency": "GBP"},
+        "years_experience": {"min": 5},
+        "tools": ["Python", "SQL", "Airflow"],
+        "meta": {"date_posted": "2025-01-02", "ats_req_id": "4711", "source": "json-ld"},
+    }
+    assert page.text == "Build\npipelines\n.\nOwn ingestion"
+
+
+def test_description_container_and_og_tags_without_json_ld():
+    html = """<html><head><meta property="og:title" content="Backend Engineer">
+      <meta property="og:site_name" content="Lever Co"><script>var x = 1;</script></head>
+      <body><header>Careers home</header><nav>Jobs</nav>
+      <div data-qa="job-description"><h2>About the role</h2><p>Write   Python
+      services.</p></div><footer>Privacy</footer></body></html>"""
+    page = extract_page(html, "https://jobs.lever.co/x/1")
+    assert page.fields == {"role": "Backend Engineer", "company": "Lever Co"}
+    assert page.source == "[data-qa=job-description]"
+    assert page.text == "About the role\nWrite Python\nservices."
+
+
+def test_js_shell_yields_no_text():
+    page = extract_page("<html><body><div id='root'></div><script>boot()</script></body></html>", "u")
+    assert page.text == "" and page.fields == {}
@@ -0,0 +1,47 @@
+import pytest
+
+from auto_apply_ai.services.jd_parser.strategy import StrategyTable
+
+
+def test_plan_starts_at_cheapest_tier_not_failing_on_the_host():
+    table = StrategyTable(window=4, min_samples=2, min_success_rate=0.5, reprobe_every=0)
+    assert table.plan("new.test") == ["static", "browser_lite", "browser"]  # no data: try everything
+
+    for _ in range(2):
+        table.record("js.test", "static", "thin", 0.1)
+        table.record("js.test", "browser_lite", "error", 1.0)
+    assert table.plan("js.test") == ["browser"]  # the last tier is always kept
+
+    table.record("flaky.test", "static", "hit", 0.1)
+    table.record("flaky.test", "static", "thin", 0.1)
+    assert table.plan("flaky.test")[0] == "static"  # 50% still counts as working
+
+    for _ in range(4):  # recent outcomes only: the window forgets old failures
+        table.record("js.test", "static", "hit", 0.2)
+    assert table.plan("js.test")[0] == "static"
+    assert table.snapshot("js.test")["js.test"]["static"] == {
+        "attempts": 6, "successes": 4, "success_rate": 1.0, "median_ms": 200.0,
+    }
+
+
+def test_reprobe_every_nth_fetch_on_a_host():
+    table = StrategyTable(min_samples=1, reprobe_every=3)
+    table.record("js.test", "static", "thin", 0.1)
+    starts = [table.plan("js.test")[0] for _ in range(6)]
+    assert starts == ["browser_lite", "browser_lite", "static", "browser_lite", "browser_lite", "static"]
+
+
+@pytest.mark.asyncio
+async def test_flush_writes_changed_rows_and_load_restores_them(session_factory):
+    table = StrategyTable(session_factory, min_samples=1)
+    table.record("a.test", "static", "hit", 0.05)
+    table.record("a.test", "browser", "hit", 2.0)
+    assert await table.flush() == 2
+    assert await table.flush() == 0  # nothing changed since
+    table.record("a.test", "static", "thin", 0.05)
+    assert await table.flush() == 1
+
+    fresh = StrategyTable(session_factory, min_samples=1)
+    fresh.record("b.test", "static", "hit", 0.01)  # recorded before the load: kept
+    await fresh.load()
+    assert fresh.snapshot() == table.snapshot() | fresh.snapshot("b.test")
@@ -0,0 +1,164 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from auto_apply_ai.config.settings import settings
+from auto_apply_ai.db.engine import Base
+from auto_apply_ai.services.jd_parser import scraper
+from auto_apply_ai.services.jd_parser.strategy import StrategyTable
+from auto_apply_ai.services.jd_parser.tiered import TierStats, TieredFetcher, merge_fields
+
+LONG = "<main>" + "<p>Responsibilities: build and run data pipelines.</p>" * 20 + "</main>"
+JSON_LD = ('<script type="application/ld+json">{"@type": "JobPosting", "title": "SRE", '
+           '"hiringOrganization": {"name": "Acme"}, "description": "short"}</script>')
+
+
+class FakePool:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.renders = []
+        self.routed = []
+
+    @asynccontextmanager
+    async def lease(self):
+        yield self
+
+    async def new_page(self):
+        return self
+
+    async def route(self, pattern, handler):
+        self.routed.append(pattern)
+
+    async def goto(self, url, **kwargs):
+        if self.fail:
+            raise RuntimeError("browser crashed")
+        self.renders.append(url)
+
+    async def wait_for_function(self, script, **kwargs):
+        return True
+
+    @property
+    def accessibility(self):
+        return self
+
+    async def snapshot(self):
+        return {"role": "WebArea", "name": self.renders[-1], "children": [{"role": "text", "name": "x" * 500}]}
+
+    async def close(self):
+        pass
+
+
+def client():
+    pages = {"/static": LONG, "/shell": f"<html><head>{JSON_LD}</head><body><div id=app></div></body></html>"}
+
+    def handler(request):
+        if request.url.path == "/pdf":
+            return httpx.Response(200, content=b"%PDF", headers={"content-type": "application/pdf"})
+        if request.url.path not in pages:
+            return httpx.Response(404)
+        return httpx.Response(200, text=pages[request.url.path], headers={"content-type": "text/html"})
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url="https://ats.test")
+
+
+@pytest.mark.asyncio
+async def test_static_hit_skips_the_browser_and_thin_pages_escalate():
+    stats, pool = TierStats(), FakePool()
+    async with client() as http:
+        fetch = TieredFetcher(client=http, pool=pool, min_chars=400, stats=stats, use_strategies=False)
+        static = await fetch("https://ats.test/static")
+        shell = await fetch("https://ats.test/shell")
+        missing = await fetch("https://ats.test/missing")
+
+    assert static.tier == "static" and "data pipelines" in static.content
+    assert pool.renders == ["https://ats.test/shell", "https://ats.test/missing"]
+    assert shell.tier == "browser_lite" and shell.content["name"] == "https://ats.test/shell"
+    assert shell.fields["role"] == "SRE" and shell.fields["company"] == "Acme"  # kept from the static tier
+    assert [t[:2] for t in shell.tried] == [("static", "thin"), ("browser_lite", "hit")]
+    assert [t[:2] for t in missing.tried] == [("static", "error"), ("browser_lite", "hit")]
+    assert pool.routed == ["**/*", "**/*"]  # page-load profile routing
+    snap = stats.snapshot()
+    assert (snap["static"]["attempts"], snap["static"]["hit"], snap["static"]["hit_rate"]) == (3, 1, 0.3333)
+    assert snap["browser_lite"]["hit_rate"] == 1.0 and snap["browser_lite"]["p50_ms"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_browser_failure_falls_back_to_a_thin_static_page():
+    async with client() as http:
+        fetch = TieredFetcher(client=http, pool=FakePool(fail=True), stats=TierStats(), use_strategies=False)
+        page = await fetch("https://ats.test/shell")
+        assert page.tier == "static" and page.content == "short"
+        assert [t[:2] for t in page.tried] == [("static", "thin"), ("browser_lite", "error"), ("browser", "error")]
+        with pytest.raises(RuntimeError):
+            await fetch("https://ats.test/pdf")  # nothing usable from either tier
+
+
+def test_page_fields_override_llm_output():
+    parsed = {"role": "Site Reliability Eng.", "company": None, "must_have": ["k8s"], "meta": {"llm": 1}}
+    merged = merge_fields(parsed, {"role": "SRE", "company": "Acme", "meta": {"source": "json-ld"}})
+    assert merged == {"role": "SRE", "company": "Acme", "must_have": ["k8s"], "meta": {"llm": 1, "source": "json-ld"}}
+    assert merge_fields(None, {}) is None
+
+
+@pytest.mark.asyncio
+async def test_strategy_skips_the_static_tier_on_js_only_hosts(session_factory):
+    table = StrategyTable(session_factory, min_samples=3, reprobe_every=10)
+    pool = FakePool()
+    async with client() as http:
+        fetch = TieredFetcher(client=http, pool=pool, min_chars=400, stats=TierStats(), strategies=table)
+        tiers = [(await fetch("https://ats.test/shell")).tried[0][0] for _ in range(10)]
+        await fetch.aclose()
+    # three thin GETs, then straight to the browser until the 10th fetch re-probes
+    assert tiers == ["static"] * 3 + ["browser_lite"] * 6 + ["static"]
+
+    reloaded = StrategyTable(session_factory)
+    await reloaded.load()
+    stats = reloaded.snapshot("ats.test")["ats.test"]
+    assert stats["static"]["attempts"] == 4 and stats["static"]["success_rate"] == 0.0
+    assert stats["browser_lite"] == {"attempts": 10, "successes": 10, "success_rate": 1.0,
+                                     "median_ms": stats["browser_lite"]["median_ms"]}
+    assert reloaded.plan("ats.test") == ["browser_lite", "browser"]
+
+
+def test_sync_fetch_page_loads_and_flushes_the_strategy_table(tmp_path, monkeypatch):
+    url = f"sqlite+aiosqlite:///{tmp_path / 'strategy.db'}"
+
+    async def seed():  # a previous process found the static tier useless on ats.test
+        engine = create_async_engine(url)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        table = StrategyTable(async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession))
+        for _ in range(3):
+            table.record("ats.test", "static", "thin", 0.05)
+        await table.flush()
+        await engine.dispose()
+    asyncio.run(seed())
+
+    sessions = async_sessionmaker(create_async_engine(url), expire_on_commit=False, class_=AsyncSession)
+    table = StrategyTable(sessions, min_samples=3, reprobe_every=0)
+    monkeypatch.setattr(scraper, "strategy_table", table)
+    monkeypatch.setattr(settings, "FETCH_STRATEGY_ENABLED", True)
+    monkeypatch.setattr(settings, "FETCH_STRATEGY_FLUSH_EVERY", 2)
+    tiers = []
+
+    def fetch_tier(tier, url):
+        tiers.append(tier)
+        return LONG, {}
+    monkeypatch.setattr(scraper, "fetch_tier", fetch_tier)
+
+    scraper.fetch_page("https://ats.test/job/1")
+    assert tiers == ["browser_lite"]  # loaded before planning: no GET first
+    assert table.pending == 1
+    scraper.fetch_page("https://ats.test/job/2")
+    assert table.pending == 0  # second attempt reached FLUSH_EVERY
+
+    io_engine = table.io_session_factory.kw["bind"]
+    assert io_engine is not sessions.kw["bind"] and isinstance(io_engine.pool, NullPool)
+    assert sessions.kw["bind"].pool.checkedin() == 0  # the app engine's pool was never used
+
+    reloaded = StrategyTable(sessions)
+    reloaded.load_sync()
+    assert reloaded.snapshot("ats.test")["ats.test"]["browser_lite"]["attempts"] == 2
@@ -0,0 +1,63 @@
+import random
+
+import pytest
+
+from auto_apply_ai.services.job_intake.ingest.columnar import prepare_block
+from auto_apply_ai.services.job_intake.ingest.normalizers import normalize_capture_row
+from auto_apply_ai.services.job_intake.ingest.validators import validate_row
+from auto_apply_ai.utils.time import parse_captured_at
+
+EDGE_ROWS = [
+    {"source_url": "HTTPS://Boards.Greenhouse.io//acme///jobs/1/?utm_source=li&b=2&a=1#utm_x", "company": "  Acme  Inc ",
+     "job_title": "Backend\tEngineer", "tags": "Python; SQL|python,,", "captured_at": "2025-01-01T00:00:00Z"},
+    {"source_url": None, "company": None, "job_title": "", "tags": None, "captured_at": "2025-01-01T10:00:00+02:00"},
+    {"company": "x", "captured_at": "2025-01-01 10:00:00", "apply_url_hint": "https://ats.example/apply?gclid=1"},
+    {"source_url": "ftp://files.example/x", "company": " ", "job_title": "   ", "tags": ["A", " b ", "a"],
+     "captured_at": "2025-02-03T04:05:06Z", "extra_column": "kept", None: ["overflow"]},
+    {"source_url": "https://jobs.lever.co/acme/2#ref=abc", "apply_url_hint": "", "notes": "line1\n\nline2",
+     "source_site": " LinkedIn ", "seniority_hint": "Senior", "compensation_hint": " $1 ", "location": "NYC",
+     "captured_at": "2025-02-03T04:05:06Z", "tags": "\n"},
+    {"source_url": "not a url", "captured_at": "2025-01-01T00:00:00Z"},
+]
+
+
+def _rowwise(raw, batch_id):
+    row = normalize_capture_row(raw)
+    row["captured_at"] = parse_captured_at(row.get("captured_at"))
+    row["import_batch_id"] = batch_id
+    hard, soft = validate_row(row)
+    return row, hard, soft
+
+
+def _random_rows(n, seed):
+    rnd = random.Random(seed)
+    pieces = ["", " ", "  ", "\t", "Acme", "acme", "Ünïcode", " ", "a|b", "x;y", ",", "\n", "utm_"]
+    hosts = ["Jobs.Lever.co", "boards.greenhouse.io", "", "www.linkedin.com:443"]
+    rows = []
+    for _ in range(n):
+        def text():
+            return rnd.choice([None, "".join(rnd.choice(pieces) for _ in range(rnd.randrange(4)))])
+        query = "&".join(rnd.sample(["utm_source=x", "gclid=1", "id=7", "a=", "b=2"], rnd.randrange(3)))
+        rows.append({
+            "source_url": rnd.choice([None, "", f"https://{rnd.choice(hosts)}/{rnd.choice(['', 'p/', 'p//q/'])}?{query}"]),
+            "apply_url_hint": rnd.choice([None, "", f"https://ats.example/x?{query}"]),
+            "company": text(),
+            "job_title": text(),
+            "location": text(),
+            "notes": text(),
+            "tags": text(),
+            "captured_at": rnd.choice(["2025-01-01T00:00:00Z", "2025-06-01 12:00:00", "2024-12-31T23:59:59+05:30"]),
+        })
+    return rows
+
+
+@pytest.mark.parametrize("rows", [EDGE_ROWS, _random_rows(500, 1), _random_rows(500, 2)], ids=["edge", "rand1", "rand2"])
+def test_prepare_block_matches_rowwise(rows):
+    expected = [_rowwise(r, "b") for r in rows]
+    assert list(prepare_block(rows, "b")) == expected
+
+
+def test_prepare_block_rows_do_not_share_lists():
+    rows = [{"source_url": "https://a.example/1", "tags": "x"}, {"source_url": "https://a.example/1", "tags": "x"}]
+    (a, _, _), (b, _, _) = prepare_block(rows, "b")
+    assert a["tags"] == b["tags"] and a["tags"] is not b["tags"]
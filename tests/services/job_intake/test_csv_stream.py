@@ -0,0 +1,56 @@
+import csv
+import io
+
+import pytest
+
+from auto_apply_ai.services.job_intake.ingest.csv_stream import aiter_csv_dicts, aiter_file_chunks
+
+PAYLOAD = (
+    'source_url,company,notes\r\n'
+    'https://a.example/1,Zürich AG,"multi\nline, with ""quotes"""\r\n'
+    '\r\n'
+    'https://a.example/2,Café ☕,plain\r\n'
+    'https://a.example/3,"short",\r\n'
+    'https://a.example/4,no newline at end,x'
+).encode("utf-8")
+
+
+class _Upload:
+    def __init__(self, data: bytes):
+        self._buf = io.BytesIO(data)
+
+    async def read(self, size: int = -1) -> bytes:
+        return self._buf.read(size)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 1 << 16])
+async def test_stream_matches_dictreader(chunk_size):
+    expected = list(csv.DictReader(io.StringIO(PAYLOAD.decode("utf-8"))))
+    rows = [r async for r in aiter_csv_dicts(aiter_file_chunks(_Upload(PAYLOAD), chunk_size))]
+    assert rows == expected
+    assert len(rows) == 4
+
+
+@pytest.mark.asyncio
+async def test_invalid_utf8_is_replaced_and_empty_input_yields_nothing():
+    data = b"a,b\n\xff,1\n"
+    rows = [r async for r in aiter_csv_dicts(aiter_file_chunks(_Upload(data), 1))]
+    assert rows == [{"a": "�", "b": "1"}]
+    assert [r async for r in aiter_csv_dicts(aiter_file_chunks(_Upload(b"")))] == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("chunk_size", [1, 5, 1 << 16])
+async def test_stray_quote_in_unquoted_field_does_not_swallow_the_upload(chunk_size):
+    data = (
+        'source_url,job_title,company\n'
+        'https://a.example/1,27" Monitor Tester,Acme\n'
+        'https://a.example/2,"QA, Displays",Acme\n'
+        'https://a.example/3,Engineer,Acme,extra\n'
+        'https://a.example/4,Short\n'
+    ).encode()
+    expected = list(csv.DictReader(io.StringIO(data.decode())))
+    rows = [r async for r in aiter_csv_dicts(aiter_file_chunks(_Upload(data), chunk_size))]
+    assert rows == expected
+    assert [r["job_title"] for r in rows] == ['27" Monitor Tester', "QA, Displays", "Engineer", "Short"]
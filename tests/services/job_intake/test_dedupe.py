@@ -0,0 +1,37 @@
+from hashlib import sha1
+
+from auto_apply_ai.services.job_intake.dedupe.index import PostingDedupeIndex
+from auto_apply_ai.services.job_intake.dedupe.keys import KEY_BYTES, key_company_title_host, key_exact
+
+
+def test_index_remembers_hits_and_misses():
+    index = PostingDedupeIndex()
+    assert index.unresolved({"e1", "e2"}, {"c1"}) == ({"e1", "e2"}, {"c1"})
+
+    post = {"id": "p1", "company": "", "job_title": "", "location": None}
+    index.add(post, "e1", "c1")
+    index.mark_resolved({"e1", "e2"}, {"c1"})
+
+    assert index.unresolved({"e1", "e2", "e3"}, {"c1", "c2"}) == ({"e3"}, {"c2"})
+    assert index.lookup("e1", "zz") is post
+    assert index.lookup("zz", "c1") is post
+    assert index.lookup("e2", "c2") is None
+
+
+def test_first_posting_wins_for_shared_company_title_host_key():
+    index = PostingDedupeIndex()
+    first = {"id": "p1"}
+    second = {"id": "p2"}
+    index.add(first, "e1", "c1")
+    index.add(second, "e2", "c1")
+    assert index.lookup("e3", "c1") is first
+    assert index.lookup("e2", "c1") is second
+    assert len(index) == 2
+
+
+def test_binary_keys_are_truncated_hex_digests():
+    # the migration backfills existing rows with bytes.fromhex(old_hex[:32])
+    url = "https://boards.greenhouse.io/acme/jobs/1"
+    assert key_exact(url) == bytes.fromhex(sha1(url.encode()).hexdigest()[:32])
+    assert len(key_exact(url)) == KEY_BYTES
+    assert key_company_title_host(" Acme ", "SRE", "A.com") == bytes.fromhex(sha1(b"acme|sre|a.com").hexdigest()[:32])
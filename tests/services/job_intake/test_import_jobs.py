@@ -0,0 +1,135 @@
+import asyncio
+import csv
+import io
+from contextlib import asynccontextmanager
+
+import pytest
+
+from auto_apply_ai.models.entities import ImportJob
+from auto_apply_ai.services.job_intake.import_jobs import ImportJobConflict, ImportJobRegistry
+from auto_apply_ai.utils.time import now_utc
+
+CSV_TEXT = "source_url,company,job_title,captured_at\n" + "".join(
+    f"https://jobs.lever.co/acme/{i},Acme,Engineer {i},2025-01-01T00:00:00Z\n" for i in range(25)
+) + "bad-url,Acme,Broken,2025-01-01T00:00:00Z\n"
+
+
+def _rows():
+    @asynccontextmanager
+    async def source():
+        yield csv.DictReader(io.StringIO(CSV_TEXT))
+    return source
+
+
+@pytest.mark.asyncio
+async def test_background_import_reports_progress_and_persists(session_factory, monkeypatch):
+    monkeypatch.setattr("auto_apply_ai.config.settings.settings.IMPORT_PROGRESS_EVERY", 10)
+    registry = ImportJobRegistry(session_factory=session_factory, max_concurrent=1)
+
+    queued = await registry.submit("batch-1", "csv", _rows(), dry_run=False)
+    assert queued.status == "queued"
+    with pytest.raises(ImportJobConflict):
+        await registry.submit("batch-1", "csv", _rows(), dry_run=False)
+
+    seen = [s async for s in registry.follow("batch-1") if s is not None]
+    assert seen[-1].status == "succeeded"
+    assert (seen[-1].rows_processed, seen[-1].accepted, seen[-1].quarantined) == (26, 25, 1)
+    assert any(s.status == "running" and 0 < s.rows_processed < 26 for s in seen)
+
+    async with session_factory() as session:
+        stored = await session.get(ImportJob, "batch-1")
+    assert (stored.status, stored.accepted, stored.quarantined) == ("succeeded", 25, 1)
+    assert stored.finished_at is not None
+
+
+@pytest.mark.asyncio
+async def test_failed_source_marks_job_failed(session_factory):
+    registry = ImportJobRegistry(session_factory=session_factory)
+
+    @asynccontextmanager
+    async def broken():
+        raise RuntimeError("Failed to fetch sheet CSV: 404")
+        yield
+
+    await registry.submit("batch-2", "google_sheet", broken, dry_run=True)
+    await registry.wait("batch-2")
+    state = await registry.get("batch-2")
+    assert state.status == "failed"
+    assert "404" in state.error
+
+
+@pytest.mark.asyncio
+async def test_second_import_while_one_holds_the_sqlite_write_lock(session_factory, monkeypatch):
+    monkeypatch.setattr("auto_apply_ai.config.settings.settings.IMPORT_PROGRESS_EVERY", 5)
+    registry = ImportJobRegistry(session_factory=session_factory, max_concurrent=2)
+    writing, release = asyncio.Event(), asyncio.Event()
+
+    def slow_rows(prefix):
+        @asynccontextmanager
+        async def source():
+            async def rows():
+                for i in range(30):
+                    if i == 10 and prefix == "a":
+                        writing.set()  # the progress write at row 5 has taken the write lock
+                        await release.wait()
+                    yield {"source_url": f"https://jobs.lever.co/{prefix}/{i}", "company": "Acme",
+                           "job_title": f"Engineer {i}", "captured_at": "2025-01-01T00:00:00Z"}
+            yield rows()
+        return source
+
+    await registry.submit("batch-a", "csv", slow_rows("a"), dry_run=False, commit_every=0)
+    await asyncio.wait_for(writing.wait(), 5)
+    queued = await asyncio.wait_for(registry.submit("batch-b", "csv", slow_rows("b"), dry_run=False), 1)
+    assert queued.status == "queued"
+
+    release.set()
+    await registry.wait("batch-a")
+    await registry.wait("batch-b")
+    for batch_id in ("batch-a", "batch-b"):
+        state = await registry.get(batch_id)
+        assert (state.status, state.accepted) == ("succeeded", 30), state.error
+        async with session_factory() as session:
+            assert (await session.get(ImportJob, batch_id)).status == "succeeded"
+
+
+@pytest.mark.asyncio
+async def test_queued_job_row_is_stored_before_it_gets_a_slot(session_factory):
+    registry = ImportJobRegistry(session_factory=session_factory, max_concurrent=1)
+    opened, release = asyncio.Event(), asyncio.Event()
+
+    @asynccontextmanager
+    async def held():
+        opened.set()  # "running" is stored; the slot stays taken until release
+        await release.wait()
+        yield csv.DictReader(io.StringIO(CSV_TEXT))
+
+    await registry.submit("batch-a", "csv", held, dry_run=True)
+    await asyncio.wait_for(opened.wait(), 5)
+    await registry.submit("batch-b", "csv", _rows(), dry_run=True)
+    for _ in range(100):  # other processes read the row, not this registry's memory
+        async with session_factory() as session:
+            stored = await session.get(ImportJob, "batch-b")
+        if stored is not None:
+            break
+        await asyncio.sleep(0.01)
+    assert stored is not None and stored.status == "queued"
+
+    release.set()
+    await registry.wait("batch-b")
+    assert (await registry.get("batch-b")).status == "succeeded"
+
+
+@pytest.mark.asyncio
+async def test_fail_interrupted_marks_leftover_jobs_failed(session_factory):
+    async with session_factory() as session:
+        async with session.begin():
+            for batch_id, status in [("left-running", "running"), ("left-queued", "queued"), ("done", "succeeded")]:
+                session.add(ImportJob(id=batch_id, source="csv", status=status, dry_run=False, created_at=now_utc()))
+
+    registry = ImportJobRegistry(session_factory=session_factory)
+    assert await registry.fail_interrupted() == 2
+    async with session_factory() as session:
+        for batch_id in ("left-running", "left-queued"):
+            stored = await session.get(ImportJob, batch_id)
+            assert (stored.status, stored.error) == ("failed", "interrupted") and stored.finished_at is not None
+        assert (await session.get(ImportJob, "done")).status == "succeeded"
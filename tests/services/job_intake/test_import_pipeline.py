@@ -0,0 +1,118 @@
+import csv
+import io
+
+import pytest
+from sqlalchemy import select
+
+from auto_apply_ai.models.entities import JobCapture, JobPosting, PostingCapture
+from auto_apply_ai.services.job_intake.import_pipeline import process_csv_reader
+
+CSV_TEXT = """source_url,company,job_title,location,captured_at
+https://boards.greenhouse.io/acme/jobs/1?utm_source=x,Acme,Backend Engineer,Remote,2025-01-01T00:00:00Z
+https://boards.greenhouse.io/acme/jobs/1,,Backend Engineer,,2025-01-02T00:00:00Z
+https://www.linkedin.com/jobs/view/99,Acme,Backend Engineer,Berlin,2025-01-03T00:00:00Z
+https://jobs.lever.co/acme/2,Acme,Data Engineer,,2025-01-04T00:00:00Z
+not-a-url,Acme,Broken,,2025-01-05T00:00:00Z
+https://www.linkedin.com/jobs/view/100,Acme,Data Engineer,NYC,2025-01-06T00:00:00Z
+"""
+
+
+def _reader():
+    return csv.DictReader(io.StringIO(CSV_TEXT))
+
+
+async def _snapshot(session_factory):
+    async with session_factory() as session:
+        postings = (await session.execute(select(JobPosting))).scalars().all()
+        captures = (await session.execute(select(JobCapture))).scalars().all()
+        links = (await session.execute(select(PostingCapture))).scalars().all()
+    capture_urls = {c.id: c.source_url for c in captures}
+    by_posting = {}
+    for link in links:
+        by_posting.setdefault(link.posting_id, []).append(capture_urls[link.capture_id])
+    return sorted(
+        (
+            p.canonical_url,
+            p.company,
+            p.job_title,
+            p.location,
+            tuple(sorted(by_posting.get(p.id, []))),
+        )
+        for p in postings
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("batch_size", [2, 1000])
+@pytest.mark.parametrize("columnar", [False, True])
+async def test_batched_import_matches_row_by_row(session_factory, tmp_path, batch_size, columnar):
+    async with session_factory() as session:
+        expected_result = await process_csv_reader(_reader(), session, False, "b1", batch_size=1)
+    expected = await _snapshot(session_factory)
+
+    # fresh schema for the batched run
+    async with session_factory() as session:
+        async with session.begin():
+            await session.execute(PostingCapture.__table__.delete())
+            await session.execute(JobCapture.__table__.delete())
+            await session.execute(JobPosting.__table__.delete())
+    async with session_factory() as session:
+        result = await process_csv_reader(_reader(), session, False, "b1", batch_size=batch_size, columnar=columnar)
+
+    assert result[:2] == expected_result[:2] == (5, 1)
+    assert await _snapshot(session_factory) == expected
+    assert len(expected) == 4
+
+
+@pytest.mark.asyncio
+async def test_chunked_commits_resume_from_checkpoint(session_factory):
+    from sqlalchemy import func
+
+    from auto_apply_ai.models.entities import ImportCheckpoint
+
+    lines = CSV_TEXT.splitlines(keepends=True)
+
+    def failing_reader():
+        for i, row in enumerate(_reader()):
+            if i == 4:
+                raise RuntimeError("connection dropped")
+            yield row
+
+    async with session_factory() as session:
+        with pytest.raises(RuntimeError):
+            await process_csv_reader(failing_reader(), session, False, "b2", batch_size=2, commit_every=2)
+    async with session_factory() as session:
+        checkpoint = await session.get(ImportCheckpoint, "b2")
+        assert (checkpoint.last_row_index, checkpoint.accepted) == (1, 2)
+        assert await session.scalar(select(func.count()).select_from(JobCapture)) == 2
+
+    async with session_factory() as session:
+        accepted, quarantined, _, errors = await process_csv_reader(
+            _reader(), session, False, "b2", batch_size=2, commit_every=2
+        )
+    assert (accepted, quarantined) == (5, 1)
+    assert [e.row_index for e in errors] == [4]
+    async with session_factory() as session:
+        assert await session.scalar(select(func.count()).select_from(JobCapture)) == 5
+        assert (await session.get(ImportCheckpoint, "b2")).last_row_index == len(lines) - 2
+    assert len(await _snapshot(session_factory)) == 4
+
+
+@pytest.mark.asyncio
+async def test_delete_job_removes_linked_captures(session_factory):
+    from sqlalchemy import func
+
+    from auto_apply_ai.api.routers.job_intake import delete_job
+    from auto_apply_ai.db.writer import SessionWriter
+
+    async with session_factory() as session:
+        await process_csv_reader(_reader(), session, False, "b3")
+    async with session_factory() as session:
+        greenhouse = (await session.execute(
+            select(JobPosting.id).where(JobPosting.canonical_url == "https://boards.greenhouse.io/acme/jobs/1")
+        )).scalar_one()
+    await delete_job(greenhouse, SessionWriter(session_factory))
+    async with session_factory() as session:
+        assert await session.scalar(select(func.count()).select_from(JobCapture)) == 3
+        assert await session.scalar(select(func.count()).select_from(PostingCapture)) == 3
+    assert len(await _snapshot(session_factory)) == 3
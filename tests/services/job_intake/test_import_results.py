@@ -0,0 +1,25 @@
+from auto_apply_ai.services.job_intake.import_results import CompactIssueCollector, FullIssueCollector
+
+
+def test_compact_collector_groups_rows_into_runs():
+    issues = CompactIssueCollector(max_ranges=2, max_samples=3)
+    for idx in (0, 1, 2, 5, 6, 9):
+        issues.add(idx, [], ["missing_company"])
+    issues.add(7, ["invalid_source_url"], ["missing_job_title"])
+
+    (company, title) = issues.warning_summaries()
+    assert company.code == "missing_company"
+    assert company.count == 6
+    assert company.row_ranges == [(0, 2), (5, 6)]
+    assert company.ranges_truncated is True
+    assert company.sample_rows == [0, 1, 2]
+    assert (title.code, title.count, title.row_ranges) == ("missing_job_title", 1, [(7, 7)])
+    assert [(e.code, e.count) for e in issues.error_summaries()] == [("invalid_source_url", 1)]
+
+
+def test_full_collector_keeps_row_entries():
+    issues = FullIssueCollector()
+    issues.add(3, ["invalid_source_url"], ["missing_company"])
+    issues.add(4, [], ["missing_company"])
+    assert [(e.row_index, e.errors) for e in issues.errors_by_row] == [(3, ["invalid_source_url"])]
+    assert [w.row_index for w in issues.warnings_by_row] == [3, 4]
@@ -0,0 +1,49 @@
+import pytest
+
+from auto_apply_ai.services.job_intake.dedupe.keys import host_of, key_exact
+from auto_apply_ai.services.job_intake.ingest.normalizers import (
+    PARSED_URL_KEY,
+    clean_url,
+    normalize_capture_row,
+    parse_source_url,
+    source_url_record,
+)
+from auto_apply_ai.services.job_intake.ingest.validators import _valid_url, validate_row
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "HTTPS://Jobs.Example.com//a//b/?utm_source=x&b=2&a=1#ref=abc",
+        "  http://example.com  ",
+        "ftp://example.com/file",
+        "example.com/no-scheme",
+        "https:///missing-host",
+        "https://boards.greenhouse.io/acme/jobs/123?gh_src=abc",
+    ],
+)
+def test_parsed_url_matches_separate_parses(url):
+    rec = parse_source_url(url)
+    assert rec.canonical == clean_url(url)
+    assert rec.key_exact == key_exact(rec.canonical)
+    assert rec.is_valid == _valid_url(rec.canonical)
+    if rec.is_valid:
+        assert rec.host == host_of(rec.canonical)
+
+
+def test_normalized_row_carries_parse_once():
+    row = normalize_capture_row({"source_url": "https://Example.com/job/?utm_medium=x"})
+    rec = row[PARSED_URL_KEY]
+    assert row["source_url"] == rec.canonical == "https://example.com/job"
+    assert parse_source_url("https://Example.com/job/?utm_medium=x") is rec
+    assert source_url_record(row) is rec
+    assert validate_row({**row, "captured_at": None})[0] == ["invalid_captured_at"]
+
+
+def test_stale_record_is_not_trusted():
+    row = normalize_capture_row({"source_url": "https://example.com/a"})
+    row["source_url"] = "not a url"
+    assert "invalid_source_url" in validate_row(row)[0]
+    row["source_url"] = "https://example.com/b"
+    assert source_url_record(row).canonical == "https://example.com/b"
+    assert source_url_record({"source_url": ""}) is None
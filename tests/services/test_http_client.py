@@ -0,0 +1,50 @@
+import asyncio
+
+import httpx
+import pytest
+
+from auto_apply_ai.services.http_client import HostLimitedTransport, HttpClient
+
+
+@pytest.mark.asyncio
+async def test_per_host_limit_holds_slot_until_body_closed():
+    in_flight = {"a.test": 0, "b.test": 0}
+    peak = dict(in_flight)
+    release = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        in_flight[host] += 1
+        peak[host] = max(peak[host], in_flight[host])
+        if host == "a.test":
+            await release.wait()
+        in_flight[host] -= 1
+        return httpx.Response(200, text=host)
+
+    async with httpx.AsyncClient(transport=HostLimitedTransport(httpx.MockTransport(handler), per_host=2)) as client:
+        slow = [asyncio.create_task(client.get("http://a.test/")) for _ in range(5)]
+        assert (await client.get("http://b.test/")).text == "b.test"  # other hosts are not blocked
+        await asyncio.sleep(0.01)
+        assert peak["a.test"] == 2
+        release.set()
+        assert [r.text for r in await asyncio.gather(*slow)] == ["a.test"] * 5
+
+        async with client.stream("GET", "http://b.test/") as first:
+            async with client.stream("GET", "http://b.test/") as second:
+                third = asyncio.create_task(client.get("http://b.test/"))
+                await asyncio.sleep(0.01)
+                assert not third.done()  # two open streams hold both b.test slots
+                await second.aread()
+        assert (await third).status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_shared_client_is_reused_and_recreated_after_close():
+    shared = HttpClient()
+    await shared.start()
+    client = shared.client
+    assert shared.client is client and client.follow_redirects
+    await shared.aclose()
+    assert client.is_closed
+    assert not shared.client.is_closed  # used outside the app lifespan
+    await shared.aclose()
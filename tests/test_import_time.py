@@ -0,0 +1,53 @@
+"""
+Cold-start budget: `python -X importtime` in a fresh interpreter. Fails if the API or the
+service modules start importing a heavy SDK at import time, or the API import blows its budget
+(IMPORT_BUDGET_MS, override with the env var of the same name on slow machines).
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+IMPORT_BUDGET_MS = float(os.environ.get("IMPORT_BUDGET_MS", 1500))
+
+MODULES = [
+    "auto_apply_ai.api.app",
+    "auto_apply_ai.services.jd_parser.scraper",
+    "auto_apply_ai.services.tailor_resume.llm_resume_parser",
+    "auto_apply_ai.services.tailor_resume.agents.planningAgent",
+    "auto_apply_ai.services.tailor_resume.agents.summaryAgent",
+    "auto_apply_ai.services.tailor_resume.agents.skillsAgent",
+    "auto_apply_ai.services.tailor_resume.agents.experienceAgent",
+]
+HEAVY = ["playwright", "langchain_core", "langchain_google_genai", "bs4", "requests", "google.genai",
+         "opik", "spacy", "fitz", "openai"]
+
+
+def _importtime(module: str) -> dict:
+    """{module: cumulative microseconds} for a cold `import module`."""
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(SRC), os.environ.get("PYTHONPATH")]))}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, env=env, check=True,
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_no_heavy_imports_at_startup():
+    for module in MODULES:
+        times = _importtime(module)
+        assert module in times
+        loaded = sorted(h for h in HEAVY if h in times)
+        assert not loaded, f"importing {module} imports {loaded}"
+
+
+def test_api_import_budget():
+    ms = _importtime("auto_apply_ai.api.app")["auto_apply_ai.api.app"] / 1000
+    assert ms < IMPORT_BUDGET_MS, f"auto_apply_ai.api.app imports in {ms:.0f} ms (budget {IMPORT_BUDGET_MS:.0f} ms)"
@@ -0,0 +1,21 @@
+import uuid
+
+import pytest
+
+from auto_apply_ai.utils.cursor import decode_cursor, encode_cursor
+from auto_apply_ai.utils.ids import uuid7
+
+
+def test_uuid7_is_time_ordered_and_unique():
+    ids = [uuid7() for _ in range(20000)]
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+    assert uuid.UUID(ids[0]).version == 7
+
+
+def test_cursor_round_trip_and_rejects_garbage():
+    cursor = encode_cursor(1.5, "01a1-id")
+    assert decode_cursor(cursor, 2) == [1.5, "01a1-id"]
+    for bad in ("not-base64!", encode_cursor("only-one"), "", "AAAA"):
+        with pytest.raises(ValueError):
+            decode_cursor(bad, 2)
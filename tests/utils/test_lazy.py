@@ -0,0 +1,35 @@
+import asyncio
+import sys
+
+import pytest
+
+from auto_apply_ai.utils.lazy import lazy_decorator, lazy_import
+
+
+def test_lazy_import_defers_execution_and_missing_modules():
+    sys.modules.pop("colorsys", None)
+    colorsys = lazy_import("colorsys")
+    assert type(colorsys).__name__ == "_LazyModule"  # not executed yet
+    assert colorsys.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+    assert lazy_import("colorsys") is sys.modules["colorsys"]
+
+    missing = lazy_import("no_such_sdk_installed")
+    with pytest.raises(ModuleNotFoundError, match="no_such_sdk_installed"):
+        _ = missing.Client
+
+
+def test_lazy_decorator_applies_on_first_call():
+    calls = []
+
+    @lazy_decorator("functools", "lru_cache", maxsize=None)
+    def square(x):
+        calls.append(x)
+        return x * x
+
+    @lazy_decorator("functools", "lru_cache", maxsize=None)
+    async def double(x):
+        return 2 * x
+
+    assert square.__name__ == "square"
+    assert [square(3), square(3)] == [9, 9] and calls == [3]  # cached by the real decorator
+    assert asyncio.run(double(4)) == 8